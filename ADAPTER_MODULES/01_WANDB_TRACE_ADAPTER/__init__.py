@@ -9,4 +9,44 @@ Success Metric: Auditors find root cause significantly faster than baseline
 __version__ = "0.1.0"
 __author__ = "PROACTIVE Research Toolkit"
 
-from .adapter import load_trace_log, convert_to_wandb_table, upload_to_wandb
+# Public API, re-exported lazily from the defining submodule on first
+# attribute access so importing the package stays cheap.
+_EXPORTS = {
+    "load_trace_log": "adapter",
+    "load_shards": "adapter",
+    "expand_inputs": "adapter",
+    "convert_to_wandb_table": "adapter",
+    "export_table": "adapter",
+    "export_chunked": "adapter",
+    "export_incremental": "adapter",
+    "upload_to_wandb": "adapter",
+    "TraceSink": "sinks",
+    "WandbSink": "sinks",
+    "JsonlSink": "sinks",
+    "SqliteSink": "sinks",
+    "ParquetSink": "sinks",
+    "MemorySink": "sinks",
+    "get_sink": "sinks",
+    "UploadEngine": "upload_engine",
+    "UploadStats": "upload_engine",
+    "UploadError": "upload_engine",
+    "TraceTable": "table",
+    "CompactTraceTable": "table",
+    "TraceAggregates": "aggregates",
+    "ShardedAggregates": "aggregates",
+    "load_stats": "aggregates",
+    "save_stats": "aggregates",
+    "KLLSketch": "sketches",
+    "UploadManifest": "manifest",
+    "TraceIndex": "trace_index",
+    "build_index": "trace_index"
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        from importlib import import_module
+        return getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,17 +8,13 @@ Status: IMPLEMENTED
 
 import json
 import os
-from datetime import datetime
+import time
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 
-import wandb
-
-# Handle both package import and direct execution
-try:
-    from .config import DEFAULT_CONFIG, AdapterConfig
-except ImportError:
-    from config import DEFAULT_CONFIG, AdapterConfig
+# Configuration, tables, sinks and aggregates are imported where they are
+# used (handling both package import and direct execution), so
+# --validate-only starts without them.
 
 # Required fields for validation
 REQUIRED_FIELDS = [
@@ -33,6 +29,12 @@ OPTIONAL_FIELDS = [
 
 VALIDATOR_KEYS = ["I1_check", "I2_check", "I3_check", "I4_check", "I5_check", "I6_check"]
 
+# Low-cardinality table columns stored as category codes
+CATEGORICAL_COLUMNS = [
+    "epistemic_tag", "I1", "I2", "I3", "I4", "I5", "I6",
+    "failure_mode", "final_decision", "trace_REQ", "source_shard"
+]
+
 
 def load_trace_log(filepath: str) -> List[Dict[str, Any]]:
     """Load PROACTIVE trace log from JSON file.
@@ -60,6 +62,95 @@ def load_trace_log(filepath: str) -> List[Dict[str, Any]]:
     return data
 
 
+def expand_inputs(inputs: List[str]) -> List[str]:
+    """Expand files, directories and glob patterns into trace shard paths.
+    
+    Directories are searched recursively for ``*.json`` files. Glob patterns
+    support ``**``. Duplicates are dropped and the result is sorted so shard
+    order (and therefore row order) is deterministic.
+    
+    Args:
+        inputs: File paths, directory paths or glob patterns
+        
+    Returns:
+        Sorted list of shard file paths
+        
+    Raises:
+        FileNotFoundError: If an input matches no files
+    """
+    import glob
+    
+    paths = set()
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            matches = [str(p) for p in path.rglob("*.json") if p.is_file()]
+        elif glob.has_magic(item):
+            matches = [p for p in glob.glob(item, recursive=True) if Path(p).is_file()]
+        else:
+            matches = [item] if path.exists() else []
+        
+        if not matches:
+            raise FileNotFoundError(f"No trace logs found for: {item}")
+        paths.update(matches)
+    
+    return sorted(paths)
+
+
+def _load_shard(filepath: str, strict: bool) -> Tuple[str, List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Load and validate one shard, tagging entries with their provenance.
+    
+    Module-level so it can be pickled into ProcessPoolExecutor workers.
+    """
+    entries = load_trace_log(filepath)
+    for i, entry in enumerate(entries):
+        entry["_source_shard"] = filepath
+        entry["_source_index"] = i
+    
+    valid, invalid = validate_all(entries, strict=strict)
+    for item in invalid:
+        item["shard"] = filepath
+    return filepath, valid, invalid
+
+
+def load_shards(
+    paths: List[str],
+    strict: bool = True,
+    max_workers: Optional[int] = None
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Load and validate many trace shards, in parallel when there is more than one.
+    
+    Each shard is parsed and validated in a worker process. Results are merged
+    in the order of ``paths`` regardless of completion order.
+    
+    Args:
+        paths: Shard file paths (see expand_inputs)
+        strict: If True, reject entries with any errors
+        max_workers: Process pool size (default: min(len(paths), CPU count))
+        
+    Returns:
+        Tuple of (valid_entries, invalid_entries_with_errors) across all shards
+    """
+    if max_workers is None:
+        max_workers = min(len(paths), os.cpu_count() or 1)
+    
+    if len(paths) <= 1 or max_workers <= 1:
+        shard_results = [_load_shard(path, strict) for path in paths]
+    else:
+        # Imported here: multiprocessing is costly and unused for single shards
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            shard_results = list(pool.map(_load_shard, paths, [strict] * len(paths)))
+    
+    valid = []
+    invalid = []
+    for _, shard_valid, shard_invalid in shard_results:
+        valid.extend(shard_valid)
+        invalid.extend(shard_invalid)
+    
+    return valid, invalid
+
+
 def validate_entry(entry: Dict[str, Any]) -> List[str]:
     """Validate a single trace log entry against schema.
     
@@ -142,17 +233,34 @@ def validate_all(entries: List[Dict[str, Any]], strict: bool = True) -> Tuple[Li
 
 def convert_to_wandb_table(
     trace_entries: List[Dict[str, Any]], 
-    config: Optional[AdapterConfig] = None
-) -> wandb.Table:
+    config: Optional["AdapterConfig"] = None,
+    aggregates: Optional["TraceAggregates"] = None
+) -> "TraceTable":
     """Convert trace log entries to W&B Table format.
     
+    The result is backend-neutral: it exposes ``columns``/``data`` like
+    ``wandb.Table`` and can be written to any sink. Use ``to_wandb()`` when a
+    real ``wandb.Table`` is needed. Rows are stored column-wise (see
+    CompactTraceTable), so enum values are interned and claim text is not
+    copied until rows are read.
+    
     Args:
         trace_entries: List of validated trace log entries
         config: Optional configuration (uses DEFAULT_CONFIG if None)
+        aggregates: Optional accumulator (TraceAggregates or ShardedAggregates)
+            updated with every row in the same pass
         
     Returns:
-        wandb.Table object ready for upload
+        CompactTraceTable ready for export
     """
+    try:
+        from .config import DEFAULT_CONFIG
+        from .table import CompactTraceTable, CATEGORICAL, TEXT, FLOAT, INT, BOOL
+    except ImportError:
+        from config import DEFAULT_CONFIG
+        from table import CompactTraceTable, CATEGORICAL, TEXT, FLOAT, INT, BOOL
+    from datetime import datetime
+    
     if config is None:
         config = DEFAULT_CONFIG
     
@@ -166,22 +274,32 @@ def convert_to_wandb_table(
     if config.include_trace_chain:
         columns.extend(["trace_REQ", "trace_complete"])
     
+    # Provenance columns are only present for entries loaded via load_shards
+    include_provenance = any("_source_shard" in entry for entry in trace_entries)
+    if include_provenance:
+        columns.extend(["source_shard", "source_index"])
+    
+    # Enum columns are interned; claim text is truncated when rows are read
+    kinds = {name: CATEGORICAL for name in CATEGORICAL_COLUMNS}
+    kinds.update({
+        "claim_text": TEXT,
+        "confidence_score": FLOAT,
+        "evidence_count": INT,
+        "trace_complete": BOOL,
+        "source_index": INT
+    })
+    table = CompactTraceTable(columns, kinds, text_limit=config.max_claim_text_length)
+    
     # Build rows
-    rows = []
     for entry in trace_entries:
         validator = entry.get("validator_results", {})
         trace = entry.get("trace_chain", {})
         evidence = entry.get("evidence_sources", [])
         
-        # Truncate claim text for display
-        claim_text = entry.get("claim_text", "")
-        if len(claim_text) > config.max_claim_text_length:
-            claim_text = claim_text[:config.max_claim_text_length] + "..."
-        
         row = [
             entry.get("claim_id", "UNKNOWN"),
-            entry.get("timestamp", datetime.now().isoformat()),
-            claim_text,
+            entry["timestamp"] if "timestamp" in entry else datetime.now().isoformat(),
+            entry.get("claim_text", ""),
             entry.get("confidence_score", 0.0),
             entry.get("epistemic_tag", "UNKNOWN"),
             validator.get("I1_check", "SKIP"),
@@ -195,25 +313,272 @@ def convert_to_wandb_table(
             len(evidence)
         ]
         
+        trace_complete = None
         if config.include_trace_chain:
             # Add trace chain info
             trace_req = trace.get("REQ_id", "MISSING")
-            trace_complete = all([
-                trace.get("REQ_id"),
-                trace.get("CTRL_id"),
-                trace.get("TEST_id"),
-                trace.get("EVID_id"),
-                trace.get("DECISION_id")
-            ])
+            trace_complete = _trace_complete(trace)
             row.extend([trace_req, trace_complete])
         
-        rows.append(row)
+        if aggregates is not None:
+            aggregates.for_entry(entry).add(row[3], row[4], row[5:11], row[11], row[12], trace_complete)
+        
+        if include_provenance:
+            row.extend([entry.get("_source_shard", ""), entry.get("_source_index", -1)])
+        
+        table.append(row)
+    
+    return table
+
+
+def _trace_complete(trace: Dict[str, Any]) -> bool:
+    return all([
+        trace.get("REQ_id"),
+        trace.get("CTRL_id"),
+        trace.get("TEST_id"),
+        trace.get("EVID_id"),
+        trace.get("DECISION_id")
+    ])
+
+
+def aggregate_entries(
+    trace_entries: List[Dict[str, Any]],
+    aggregates: "TraceAggregates",
+    config: Optional["AdapterConfig"] = None
+) -> None:
+    """Add entries to ``aggregates`` without converting them to rows.
+
+    Accounts for each entry with the same values convert_to_wandb_table
+    would, for callers that need statistics over entries they do not export.
+
+    Args:
+        trace_entries: List of trace log entries
+        aggregates: Accumulator (TraceAggregates or ShardedAggregates)
+        config: Optional configuration (uses DEFAULT_CONFIG if None)
+    """
+    if config is None:
+        try:
+            from .config import DEFAULT_CONFIG
+        except ImportError:
+            from config import DEFAULT_CONFIG
+        config = DEFAULT_CONFIG
+    
+    for entry in trace_entries:
+        validator = entry.get("validator_results", {})
+        aggregates.for_entry(entry).add(
+            entry.get("confidence_score", 0.0),
+            entry.get("epistemic_tag", "UNKNOWN"),
+            [validator.get(f"{invariant}_check", "SKIP") for invariant in ("I1", "I2", "I3", "I4", "I5", "I6")],
+            entry.get("failure_mode") or "none",
+            entry.get("final_decision", "UNKNOWN"),
+            _trace_complete(entry.get("trace_chain", {})) if config.include_trace_chain else None
+        )
+
+
+def export_table(
+    table: "TraceTable",
+    sink: "TraceSink",
+    run_name: Optional[str] = None,
+    tags: Optional[List[str]] = None,
+    aggregates: Optional["TraceAggregates"] = None
+) -> str:
+    """Write a table to any sink and return the run location.
+    
+    Args:
+        table: TraceTable to export
+        sink: Destination backend (see sinks.get_sink)
+        run_name: Optional run name (auto-generated if None)
+        tags: Optional tags for the run
+        aggregates: Optional precomputed aggregates, logged as summary
+            metrics and side tables
+        
+    Returns:
+        Run URL (wandb) or output path (local sinks)
+    """
+    try:
+        from .config import DEFAULT_CONFIG
+    except ImportError:
+        from config import DEFAULT_CONFIG
+    
+    if run_name is None:
+        run_name = _default_run_name()
+    
+    if tags is None:
+        tags = list(DEFAULT_CONFIG.default_tags)
+    
+    sink.open(run_name, tags)
+    sink.write(table)
+    
+    summary = {
+        "total_entries": len(table),
+        "schema_version": DEFAULT_CONFIG.schema_version
+    }
+    _write_aggregates(sink, summary, aggregates)
+    return sink.finalize(summary)
+
+
+def _write_aggregates(sink: "TraceSink", summary: Dict[str, Any], aggregates: Optional["TraceAggregates"]) -> None:
+    """Log aggregate side tables and add aggregate metrics to ``summary``."""
+    if aggregates is None:
+        return
+    for name, side_table in aggregates.side_tables().items():
+        sink.write_side_table(name, side_table)
+    summary.update(aggregates.summary())
+
+
+def export_chunked(
+    trace_entries: List[Dict[str, Any]],
+    sink: "TraceSink",
+    config: Optional["AdapterConfig"] = None,
+    run_name: Optional[str] = None,
+    tags: Optional[List[str]] = None,
+    aggregates: Optional[Any] = None,
+    manifest: Optional["UploadManifest"] = None,
+    stats: Optional[Dict[str, Any]] = None
+) -> Optional[str]:
+    """Convert and export entries in chunks through a bounded-concurrency UploadEngine.
+    
+    Chunks of ``config.upload_chunk_size`` entries are converted lazily and
+    uploaded with at most ``config.max_in_flight`` in flight, retrying with
+    exponential backoff. Chunk IDs are derived from their claim IDs, so a
+    retried chunk is accepted at most once.
+    
+    Args:
+        trace_entries: Validated trace log entries
+        sink: Destination backend
+        config: Optional configuration (uses DEFAULT_CONFIG if None)
+        run_name: Optional run name (auto-generated if None)
+        tags: Optional tags for the run
+        aggregates: Optional TraceAggregates or ShardedAggregates updated
+            during conversion and logged with the run (a fresh
+            TraceAggregates is used if None)
+        manifest: Optional UploadManifest; when given, only new or changed
+            entries are exported and each chunk is committed to the manifest
+            once the sink accepts it
+        stats: Optional dictionary filled with ``convert_s`` (seconds per
+            converted chunk) and ``upload`` (the engine's UploadStats)
+        
+    Returns:
+        Run location, or None if the manifest shows nothing new to export
+        
+    Raises:
+        UploadError: If a chunk exhausts its retries
+        ValueError: If a manifest is given with a sink that rewrites its
+            output on every run (ParquetSink)
+    """
+    import hashlib
+    try:
+        from .aggregates import TraceAggregates, ShardedAggregates
+        from .config import DEFAULT_CONFIG
+        from .upload_engine import UploadEngine
+    except ImportError:
+        from aggregates import TraceAggregates, ShardedAggregates
+        from config import DEFAULT_CONFIG
+        from upload_engine import UploadEngine
     
-    return wandb.Table(columns=columns, data=rows)
+    if config is None:
+        config = DEFAULT_CONFIG
+    if run_name is None:
+        run_name = _default_run_name()
+    if tags is None:
+        tags = list(config.default_tags)
+    if aggregates is None:
+        aggregates = TraceAggregates()
+    
+    if manifest is not None:
+        if not sink.keeps_earlier_rows:
+            raise ValueError(f"The {sink.name} sink rewrites its output on every run "
+                             "and cannot be used with an upload manifest")
+        pending = manifest.filter_pending(trace_entries, sink.destination)
+        if not pending:
+            return None
+    else:
+        pending = [(entry, None) for entry in trace_entries]
+    
+    chunk_size = max(1, config.upload_chunk_size)
+    chunk_entries: Dict[str, List[Tuple[Dict[str, Any], Optional[str]]]] = {}
+    convert_s: List[float] = []
+    if stats is not None:
+        stats["convert_s"] = convert_s
+    
+    def chunks():
+        for start in range(0, len(pending), chunk_size):
+            chunk = pending[start:start + chunk_size]
+            chunk_id = f"{start // chunk_size:05d}-" + hashlib.sha1(
+                "\n".join(str(entry.get("claim_id", "UNKNOWN")) for entry, _ in chunk).encode("utf-8")
+            ).hexdigest()[:8]
+            chunk_entries[chunk_id] = chunk
+            start_s = time.perf_counter()
+            table = convert_to_wandb_table([entry for entry, _ in chunk], config, aggregates)
+            convert_s.append(time.perf_counter() - start_s)
+            yield chunk_id, table
+    
+    def on_committed(chunk_id: str) -> None:
+        chunk = chunk_entries.pop(chunk_id)
+        if manifest is not None:
+            manifest.commit_chunk(run_name, sink.destination, chunk)
+    
+    sink.open(run_name, tags)
+    engine = UploadEngine(
+        sink,
+        max_in_flight=config.max_in_flight,
+        max_retries=config.max_retries,
+        backoff_base_s=config.retry_backoff_s
+    )
+    upload_stats = engine.upload(chunks(), on_committed)
+    if stats is not None:
+        stats["upload"] = upload_stats
+    
+    summary = {
+        "total_entries": len(pending),
+        "schema_version": config.schema_version
+    }
+    if manifest is not None:
+        summary["skipped_entries"] = len(trace_entries) - len(pending)
+    summary.update(upload_stats.to_summary())
+    if isinstance(aggregates, ShardedAggregates):
+        aggregates = aggregates.combined()
+    _write_aggregates(sink, summary, aggregates)
+    return sink.finalize(summary)
+
+
+def export_incremental(
+    trace_entries: List[Dict[str, Any]],
+    sink: "TraceSink",
+    manifest: "UploadManifest",
+    config: Optional["AdapterConfig"] = None,
+    run_name: Optional[str] = None,
+    tags: Optional[List[str]] = None,
+    stats: Optional[Dict[str, Any]] = None
+) -> Optional[str]:
+    """Export only entries that are new or changed according to the manifest.
+    
+    Each chunk is committed to the manifest only after the sink accepts it,
+    so an interrupted run resumes from the last committed chunk. See
+    export_chunked for chunking and retry behaviour.
+    
+    Args:
+        trace_entries: Validated trace log entries
+        sink: Destination backend
+        manifest: UploadManifest recording what has been exported
+        config: Optional configuration (uses DEFAULT_CONFIG if None)
+        run_name: Optional run name (auto-generated if None)
+        tags: Optional tags for the run
+        stats: Optional dictionary for chunk timings (see export_chunked)
+        
+    Returns:
+        Run location, or None if there was nothing new to export
+    """
+    return export_chunked(trace_entries, sink, config, run_name, tags, manifest=manifest, stats=stats)
+
+
+def _default_run_name() -> str:
+    from datetime import datetime
+    return f"trace-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
 
 
 def upload_to_wandb(
-    table: wandb.Table,
+    table: "TraceTable",
     project: str = "proactive-traces",
     run_name: Optional[str] = None,
     entity: Optional[str] = None,
@@ -222,7 +587,7 @@ def upload_to_wandb(
     """Upload table to W&B and return run URL.
     
     Args:
-        table: wandb.Table to upload
+        table: TraceTable (or wandb.Table) to upload
         project: W&B project name
         run_name: Optional run name (auto-generated if None)
         entity: Optional W&B entity (team/user)
@@ -231,94 +596,234 @@ def upload_to_wandb(
     Returns:
         URL of the W&B run
     """
-    if run_name is None:
-        run_name = f"trace-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
-    
-    if tags is None:
-        tags = ["proactive", "trace-adapter"]
-    
-    run = wandb.init(
-        project=project,
-        name=run_name,
-        entity=entity,
-        tags=tags,
-        job_type="trace-upload"
-    )
-    
-    # Log the table
-    run.log({"trace_log": table})
-    
-    # Log summary metrics
-    run.summary["total_entries"] = len(table.data)
-    run.summary["schema_version"] = DEFAULT_CONFIG.schema_version
-    
-    url = run.get_url()
-    run.finish()
+    try:
+        from .sinks import WandbSink
+    except ImportError:
+        from sinks import WandbSink
     
-    return url
+    return export_table(table, WandbSink(project=project, entity=entity), run_name, tags)
 
 
-def main(input_file: str, project: str = "proactive-traces", strict: bool = True) -> str:
+def main(
+    inputs: List[str],
+    project: str = "proactive-traces",
+    strict: bool = True,
+    max_workers: Optional[int] = None,
+    sink: str = "wandb",
+    validate_only: bool = False,
+    manifest: Optional[str] = None,
+    index: Optional[str] = None,
+    stats_dir: Optional[str] = None,
+    metrics_file: Optional[str] = None
+) -> Optional[str]:
     """Main entry point: load, validate, convert, upload.
     
+    All shards are merged into a single table and uploaded with one
+    ``wandb.init`` per batch.
+    
     Args:
-        input_file: Path to trace log JSON file
+        inputs: Trace log files, directories or glob patterns
         project: W&B project name
         strict: If True, reject entries with validation errors
+        max_workers: Process pool size for shard loading
+        sink: Export backend spec (``wandb``, ``jsonl:<path>``, ``sqlite:<path>``, ``parquet:<path>``)
+        validate_only: Stop after validation; nothing is converted or exported
+        manifest: Path to an upload manifest (SQLite); when set, only new or
+            changed claims are exported
+        index: Path to a trace-chain index (gzip JSON) to create or extend
+            with the valid entries
+        stats_dir: Directory for per-shard mergeable stats files (see merge_stats.py)
+        metrics_file: Write OpenMetrics figures for this run here (see
+            metrics.py), also when the run fails
         
     Returns:
-        URL of the W&B run
+        URL of the W&B run, output path for local sinks, or None when
+        validate_only or when the manifest shows nothing new
+        
+    Raises:
+        ValueError: If no entries are valid, or validate_only finds invalid entries
     """
-    print(f"Loading trace log from: {input_file}")
-    entries = load_trace_log(input_file)
-    print(f"Loaded {len(entries)} entries")
-    
-    # Validate
+    run: Dict[str, Any] = {}
+    start = time.perf_counter()
+    success = False
+    try:
+        url = _run(inputs, project, strict, max_workers, sink, validate_only,
+                   manifest, index, stats_dir, run)
+        success = True
+        return url
+    finally:
+        if metrics_file is not None:
+            run["duration_s"] = time.perf_counter() - start
+            _write_metrics(metrics_file, run, success)
+
+
+def _run(
+    inputs: List[str],
+    project: str,
+    strict: bool,
+    max_workers: Optional[int],
+    sink: str,
+    validate_only: bool,
+    manifest: Optional[str],
+    index: Optional[str],
+    stats_dir: Optional[str],
+    run: Dict[str, Any]
+) -> Optional[str]:
+    """Body of main; figures for the metrics file are collected in ``run``."""
+    if isinstance(inputs, str):
+        inputs = [inputs]
+    
+    paths = expand_inputs(inputs)
+    print(f"Loading {len(paths)} trace log shard(s)")
+    
+    # Load and validate
     print("Validating entries...")
-    valid, invalid = validate_all(entries, strict=strict)
+    load_start = time.perf_counter()
+    valid, invalid = load_shards(paths, strict=strict, max_workers=max_workers)
+    run.update({
+        "shards": len(paths),
+        "entries_valid": len(valid),
+        "entries_invalid": len(invalid),
+        "load_s": time.perf_counter() - load_start
+    })
+    print(f"Loaded {len(valid) + len(invalid)} entries")
     print(f"Valid: {len(valid)}, Invalid: {len(invalid)}")
     
     if invalid:
         print("\nValidation errors:")
         for item in invalid[:5]:  # Show first 5 errors
-            print(f"  Entry {item['index']}: {item['errors']}")
+            print(f"  {item['shard']} entry {item['index']}: {item['errors']}")
         if len(invalid) > 5:
             print(f"  ... and {len(invalid) - 5} more")
     
+    if index is not None:
+        try:
+            from .trace_index import build_index
+        except ImportError:
+            from trace_index import build_index
+        
+        trace_index = build_index(valid, existing=index)
+        trace_index.save(index)
+        print(f"Trace index: {len(trace_index)} claims -> {index}")
+    
+    if validate_only:
+        if invalid:
+            raise ValueError(f"{len(invalid)} invalid entries")
+        return None
+    
     if not valid:
         raise ValueError("No valid entries to upload")
     
-    # Convert
-    print("\nConverting to W&B Table...")
-    table = convert_to_wandb_table(valid)
-    print(f"Created table with {len(table.columns)} columns, {len(table.data)} rows")
+    try:
+        from .aggregates import ShardedAggregates
+        from .sinks import get_sink
+    except ImportError:
+        from aggregates import ShardedAggregates
+        from sinks import get_sink
+    
+    trace_sink = get_sink(sink, project=project)
+    
+    if manifest is not None:
+        try:
+            from .manifest import UploadManifest
+        except ImportError:
+            from manifest import UploadManifest
+        
+        if stats_dir is not None:
+            # Stats describe whole shards, not just the entries exported this run
+            shard_aggregates = ShardedAggregates()
+            aggregate_entries(valid, shard_aggregates)
+            _save_stats(shard_aggregates, stats_dir)
+        
+        with UploadManifest(manifest) as upload_manifest:
+            print(f"\nExporting new or changed entries to {trace_sink.name} "
+                  f"(manifest: {upload_manifest.count(trace_sink.destination)} already exported)...")
+            url = export_incremental(valid, trace_sink, upload_manifest, stats=run)
+        if url is None:
+            print("\nNothing new to export")
+        else:
+            print(f"\nSuccess! View at: {url}")
+        return url
+    
+    # Convert and export chunk by chunk
+    print(f"\nConverting and exporting {len(valid)} rows to {trace_sink.name}...")
+    shard_aggregates = ShardedAggregates()
+    url = export_chunked(valid, trace_sink, aggregates=shard_aggregates, stats=run)
+    
+    if stats_dir is not None:
+        _save_stats(shard_aggregates, stats_dir)
     
-    # Upload
-    print("\nUploading to W&B...")
-    url = upload_to_wandb(table, project=project)
     print(f"\nSuccess! View at: {url}")
     
     return url
 
 
-if __name__ == "__main__":
+def _save_stats(shard_aggregates: "ShardedAggregates", stats_dir: str) -> None:
+    written = shard_aggregates.save(stats_dir)
+    print(f"Wrote {len(written)} shard stats file(s) to {stats_dir}")
+
+
+def _write_metrics(metrics_file: str, run: Dict[str, Any], success: bool) -> None:
+    """Write the run's OpenMetrics textfile; failures only warn."""
     import sys
+    try:
+        from .metrics import adapter_metrics
+    except ImportError:
+        from metrics import adapter_metrics
     
-    if len(sys.argv) < 2:
-        print("Usage: python adapter.py <trace_log.json> [project_name] [--no-strict]")
-        print()
-        print("Arguments:")
-        print("  trace_log.json  Path to PROACTIVE trace log file")
-        print("  project_name    W&B project name (default: proactive-traces)")
-        print("  --no-strict     Allow entries with validation warnings")
-        sys.exit(1)
+    try:
+        adapter_metrics(run, success).write_textfile(metrics_file)
+    except OSError as e:
+        print(f"Warning: could not write metrics to {metrics_file}: {e}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    import sys
+    import argparse
     
-    input_file = sys.argv[1]
-    project = sys.argv[2] if len(sys.argv) > 2 and not sys.argv[2].startswith("--") else "proactive-traces"
-    strict = "--no-strict" not in sys.argv
+    parser = argparse.ArgumentParser(
+        description="PROACTIVE W&B Trace Adapter - Converts trace logs to W&B Tables"
+    )
+    parser.add_argument("inputs", nargs="+",
+                        help="Trace log files, directories or glob patterns (e.g. 'traces/**/*.json')")
+    parser.add_argument("--project", "-p", default=None,
+                        help="W&B project name (default: proactive-traces)")
+    parser.add_argument("--no-strict", action="store_true",
+                        help="Allow entries with validation warnings")
+    parser.add_argument("--workers", "-j", type=int, default=None,
+                        help="Worker processes for shard loading (default: CPU count)")
+    parser.add_argument("--sink", "-s", default="wandb",
+                        help="Export backend: wandb, jsonl:<path>, sqlite:<path> or parquet:<path> (default: wandb)")
+    parser.add_argument("--validate-only", action="store_true",
+                        help="Only load and validate; exit 1 if any entry is invalid")
+    parser.add_argument("--manifest", "-m", default=None,
+                        help="Upload manifest (SQLite); export only new or changed claims")
+    parser.add_argument("--index", default=None,
+                        help="Create or extend a trace-chain index (gzip JSON) for root-cause queries")
+    parser.add_argument("--stats-dir", default=None,
+                        help="Write per-shard mergeable stats files here (combine with merge_stats.py)")
+    parser.add_argument("--metrics-file", default=None,
+                        help="Write OpenMetrics figures for this run to this file (e.g. a node_exporter .prom)")
+    
+    args = parser.parse_args()
+    
+    project = args.project
+    if project is None:
+        project = "proactive-traces"
+        if len(args.inputs) == 2 and Path(args.inputs[0]).is_file() and not os.path.exists(args.inputs[1]):
+            # Original single-file form: adapter.py <trace_log.json> <project_name>
+            input_path, project = args.inputs
+            args.inputs = [input_path]
+            print(f"Warning: a project name as second positional argument is deprecated; "
+                  f"reading {input_path} into project '{project}'. Use --project {project}",
+                  file=sys.stderr)
+        elif len(args.inputs) > 1:
+            parser.error("--project is required with more than one input "
+                         "(use --project proactive-traces for the default)")
     
     try:
-        main(input_file, project, strict)
+        main(args.inputs, project, not args.no_strict, args.workers, args.sink,
+             args.validate_only, args.manifest, args.index, args.stats_dir, args.metrics_file)
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
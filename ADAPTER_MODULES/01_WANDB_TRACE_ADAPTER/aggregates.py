@@ -0,0 +1,311 @@
+"""
+Aggregate metrics for trace tables
+
+TraceAggregates accumulates failure-mode rates, I1-I6 pass/fail matrices and
+confidence distributions in the same pass that converts entries to table
+rows. Every statistic is a count, a fixed-bin histogram or a KLL sketch, so
+aggregates built over separate shards or chunks merge exactly.
+
+ShardedAggregates keeps one TraceAggregates per source shard; each is saved
+as a small ``.stats.json`` file that merge_stats.py can combine later.
+"""
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+# Handle both package import and direct execution
+try:
+    from .sketches import KLLSketch
+    from .table import TraceTable
+except ImportError:
+    from sketches import KLLSketch
+    from table import TraceTable
+
+INVARIANTS = ["I1", "I2", "I3", "I4", "I5", "I6"]
+CHECK_RESULTS = ["PASS", "FAIL", "SKIP"]
+CONFIDENCE_BINS = 10
+SUMMARY_QUANTILES = [0.5, 0.9, 0.95, 0.99]
+GROUP_QUANTILES = [0.5, 0.95, 0.99]
+
+STATS_FORMAT = "proactive-trace-stats"
+STATS_VERSION = 1
+
+
+def _key(value: Any) -> str:
+    """Group key for a row value; null fields group as "none"."""
+    return "none" if value is None else str(value)
+
+
+def _increment(counts: Dict[str, int], key: str, amount: int = 1) -> None:
+    counts[key] = counts.get(key, 0) + amount
+
+
+def _merge_counts(target: Dict[str, int], source: Dict[str, int]) -> None:
+    for key, count in source.items():
+        _increment(target, _key(key), count)
+
+
+def _merge_sketches(target: Dict[str, KLLSketch], source: Dict[str, KLLSketch]) -> None:
+    for key, sketch in source.items():
+        key = _key(key)
+        if key in target:
+            target[key].merge(sketch)
+        else:
+            target[key] = KLLSketch.from_dict(sketch.to_dict())
+
+
+def _stored_key(key: str) -> str:
+    """Group key read from a stats file; files written before null fields
+    were grouped as "none" stored them as "None"."""
+    return "|".join("none" if part == "None" else part for part in key.split("|"))
+
+
+def _load_counts(source: Dict[str, int]) -> Dict[str, int]:
+    counts: Dict[str, int] = {}
+    for key, count in source.items():
+        _increment(counts, _stored_key(key), count)
+    return counts
+
+
+def _load_sketches(source: Dict[str, Any]) -> Dict[str, KLLSketch]:
+    sketches: Dict[str, KLLSketch] = {}
+    for key, state in source.items():
+        key = _stored_key(key)
+        if key in sketches:
+            sketches[key].merge(KLLSketch.from_dict(state))
+        else:
+            sketches[key] = KLLSketch.from_dict(state)
+    return sketches
+
+
+class TraceAggregates:
+    """Mergeable summary statistics over converted trace rows."""
+
+    def __init__(self, sketch_k: int = 200):
+        self.sketch_k = sketch_k
+        self.total = 0
+        self.trace_complete = 0
+        self.decisions: Dict[str, int] = {}
+        self.failure_modes: Dict[str, int] = {}
+        self.epistemic_tags: Dict[str, int] = {}
+        # "<failure_mode>|<final_decision>" -> count
+        self.failure_by_decision: Dict[str, int] = {}
+        self.invariant_matrix: Dict[str, Dict[str, int]] = {inv: {} for inv in INVARIANTS}
+        self.confidence_sum = 0.0
+        self.confidence_histogram = [0] * CONFIDENCE_BINS
+        self.confidence_sketch = KLLSketch(k=sketch_k)
+        self.confidence_by_decision: Dict[str, KLLSketch] = {}
+        self.confidence_by_tag: Dict[str, KLLSketch] = {}
+
+    def for_entry(self, entry: Dict[str, Any]) -> "TraceAggregates":
+        """Accumulator for ``entry``; a plain TraceAggregates collects everything."""
+        return self
+
+    def add(
+        self,
+        confidence: float,
+        epistemic_tag: str,
+        checks: List[str],
+        failure_mode: str,
+        decision: str,
+        trace_complete: Optional[bool] = None
+    ) -> None:
+        """Account for one row; arguments are the row's already-extracted values.
+
+        Args:
+            confidence: confidence_score
+            epistemic_tag: epistemic_tag
+            checks: I1-I6 check results in order
+            failure_mode: failure_mode ("none" if null)
+            decision: final_decision
+            trace_complete: Whether the trace chain is complete, if tracked
+
+        Null tags, decisions and check results are counted as "none".
+        """
+        epistemic_tag, failure_mode, decision = _key(epistemic_tag), _key(failure_mode), _key(decision)
+        checks = [_key(result) for result in checks]
+        self.total += 1
+        _increment(self.decisions, decision)
+        _increment(self.failure_modes, failure_mode)
+        _increment(self.epistemic_tags, epistemic_tag)
+        _increment(self.failure_by_decision, f"{failure_mode}|{decision}")
+        for invariant, result in zip(INVARIANTS, checks):
+            _increment(self.invariant_matrix[invariant], result)
+        if trace_complete:
+            self.trace_complete += 1
+
+        if isinstance(confidence, (int, float)):
+            self.confidence_sum += confidence
+            bin_index = min(max(int(confidence * CONFIDENCE_BINS), 0), CONFIDENCE_BINS - 1)
+            self.confidence_histogram[bin_index] += 1
+            self.confidence_sketch.update(float(confidence))
+            for groups, key in ((self.confidence_by_decision, decision),
+                                (self.confidence_by_tag, epistemic_tag)):
+                if key not in groups:
+                    groups[key] = KLLSketch(k=self.sketch_k)
+                groups[key].update(float(confidence))
+
+    def merge(self, other: "TraceAggregates") -> "TraceAggregates":
+        """Fold ``other`` into these aggregates in place and return self."""
+        self.total += other.total
+        self.trace_complete += other.trace_complete
+        _merge_counts(self.decisions, other.decisions)
+        _merge_counts(self.failure_modes, other.failure_modes)
+        _merge_counts(self.epistemic_tags, other.epistemic_tags)
+        _merge_counts(self.failure_by_decision, other.failure_by_decision)
+        for invariant in INVARIANTS:
+            _merge_counts(self.invariant_matrix[invariant], other.invariant_matrix.get(invariant, {}))
+        self.confidence_sum += other.confidence_sum
+        self.confidence_histogram = [
+            a + b for a, b in zip(self.confidence_histogram, other.confidence_histogram)
+        ]
+        self.confidence_sketch.merge(other.confidence_sketch)
+        _merge_sketches(self.confidence_by_decision, other.confidence_by_decision)
+        _merge_sketches(self.confidence_by_tag, other.confidence_by_tag)
+        return self
+
+    def summary(self) -> Dict[str, Any]:
+        """Flat metrics suitable for ``run.summary``."""
+        total = self.total or 1
+        metrics: Dict[str, Any] = {"trace_complete_rate": self.trace_complete / total}
+
+        for decision, count in sorted(self.decisions.items()):
+            metrics[f"decision_rate/{decision}"] = count / total
+        for failure_mode, count in sorted(self.failure_modes.items()):
+            metrics[f"failure_mode_rate/{failure_mode}"] = count / total
+        for invariant in INVARIANTS:
+            metrics[f"invariant_fail_rate/{invariant}"] = (
+                self.invariant_matrix[invariant].get("FAIL", 0) / total
+            )
+
+        sketch = self.confidence_sketch
+        if sketch.n:
+            metrics["confidence/mean"] = self.confidence_sum / sketch.n
+            metrics["confidence/min"] = sketch.min
+            metrics["confidence/max"] = sketch.max
+            for q, value in zip(SUMMARY_QUANTILES, sketch.quantiles(SUMMARY_QUANTILES)):
+                metrics[f"confidence/p{int(q * 100)}"] = value
+
+        for prefix, groups in (("confidence_by_decision", self.confidence_by_decision),
+                               ("confidence_by_tag", self.confidence_by_tag)):
+            for key, group_sketch in sorted(groups.items()):
+                for q, value in zip(GROUP_QUANTILES, group_sketch.quantiles(GROUP_QUANTILES)):
+                    metrics[f"{prefix}/{key}/p{int(q * 100)}"] = value
+
+        return metrics
+
+    def side_tables(self) -> Dict[str, TraceTable]:
+        """Small tables logged alongside the main trace table."""
+        matrix = TraceTable(columns=["invariant"] + CHECK_RESULTS, data=[
+            [invariant] + [self.invariant_matrix[invariant].get(r, 0) for r in CHECK_RESULTS]
+            for invariant in INVARIANTS
+        ])
+        histogram = TraceTable(columns=["bin_start", "bin_end", "count"], data=[
+            [i / CONFIDENCE_BINS, (i + 1) / CONFIDENCE_BINS, count]
+            for i, count in enumerate(self.confidence_histogram)
+        ])
+        failures = TraceTable(columns=["failure_mode", "final_decision", "count"], data=[
+            key.split("|", 1) + [count]
+            for key, count in sorted(self.failure_by_decision.items())
+        ])
+        return {
+            "invariant_matrix": matrix,
+            "confidence_histogram": histogram,
+            "failure_mode_by_decision": failures
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form (counts, histogram and sketch state)."""
+        return {
+            "total": self.total,
+            "trace_complete": self.trace_complete,
+            "decisions": self.decisions,
+            "failure_modes": self.failure_modes,
+            "epistemic_tags": self.epistemic_tags,
+            "failure_by_decision": self.failure_by_decision,
+            "invariant_matrix": self.invariant_matrix,
+            "confidence_sum": self.confidence_sum,
+            "confidence_histogram": self.confidence_histogram,
+            "confidence_sketch": self.confidence_sketch.to_dict(),
+            "confidence_by_decision": {k: v.to_dict() for k, v in self.confidence_by_decision.items()},
+            "confidence_by_tag": {k: v.to_dict() for k, v in self.confidence_by_tag.items()}
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TraceAggregates":
+        aggregates = cls(sketch_k=data["confidence_sketch"]["k"])
+        aggregates.total = data["total"]
+        aggregates.trace_complete = data["trace_complete"]
+        aggregates.decisions = _load_counts(data["decisions"])
+        aggregates.failure_modes = _load_counts(data["failure_modes"])
+        aggregates.epistemic_tags = _load_counts(data["epistemic_tags"])
+        aggregates.failure_by_decision = _load_counts(data["failure_by_decision"])
+        aggregates.invariant_matrix = {k: _load_counts(v) for k, v in data["invariant_matrix"].items()}
+        aggregates.confidence_sum = data["confidence_sum"]
+        aggregates.confidence_histogram = list(data["confidence_histogram"])
+        aggregates.confidence_sketch = KLLSketch.from_dict(data["confidence_sketch"])
+        aggregates.confidence_by_decision = _load_sketches(data.get("confidence_by_decision", {}))
+        aggregates.confidence_by_tag = _load_sketches(data.get("confidence_by_tag", {}))
+        return aggregates
+
+
+class ShardedAggregates:
+    """One TraceAggregates per source shard (``_source_shard`` provenance)."""
+
+    def __init__(self, sketch_k: int = 200):
+        self.sketch_k = sketch_k
+        self.shards: Dict[str, TraceAggregates] = {}
+
+    def for_entry(self, entry: Dict[str, Any]) -> TraceAggregates:
+        shard = entry.get("_source_shard", "")
+        if shard not in self.shards:
+            self.shards[shard] = TraceAggregates(sketch_k=self.sketch_k)
+        return self.shards[shard]
+
+    def combined(self) -> TraceAggregates:
+        """All shards merged into a single TraceAggregates."""
+        combined = TraceAggregates(sketch_k=self.sketch_k)
+        for aggregates in self.shards.values():
+            combined.merge(aggregates)
+        return combined
+
+    def save(self, stats_dir: str) -> List[str]:
+        """Write one stats file per shard and return their paths.
+
+        Files are named after the shard plus a short hash of its full path,
+        so re-running over the same shard overwrites its stats instead of
+        double counting it.
+        """
+        target_dir = Path(stats_dir)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        written = []
+        for shard, aggregates in sorted(self.shards.items()):
+            digest = hashlib.sha1(str(Path(shard).resolve()).encode("utf-8")).hexdigest()[:8]
+            path = target_dir / f"{Path(shard).stem or 'entries'}-{digest}.stats.json"
+            save_stats(aggregates, str(path), shard=shard)
+            written.append(str(path))
+        return written
+
+
+def save_stats(aggregates: TraceAggregates, path: str, shard: Optional[str] = None) -> None:
+    """Write aggregates as a stats file."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            "format": STATS_FORMAT,
+            "version": STATS_VERSION,
+            "shard": shard,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "aggregates": aggregates.to_dict()
+        }, f, separators=(",", ":"))
+
+
+def load_stats(path: str) -> TraceAggregates:
+    """Read a stats file written by save_stats."""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get("format") != STATS_FORMAT or data.get("version") != STATS_VERSION:
+        raise ValueError(f"Not a trace stats file (version {STATS_VERSION}): {path}")
+    return TraceAggregates.from_dict(data["aggregates"])
@@ -22,6 +22,12 @@ class AdapterConfig:
     max_claim_text_length: int = 500
     include_trace_chain: bool = True
     
+    # Upload settings
+    upload_chunk_size: int = 1000
+    max_in_flight: int = 4
+    max_retries: int = 5
+    retry_backoff_s: float = 0.5
+    
     # Default tags
     default_tags: List[str] = field(default_factory=lambda: ["proactive", "trace-adapter"])
 
@@ -0,0 +1,171 @@
+"""
+Upload Manifest for incremental trace syncs
+
+A small SQLite index of what has already been exported, keyed by sink
+destination and claim_id plus a content hash. Re-running the adapter on an
+appended or edited trace log then uploads only new or changed claims, and a
+crashed run resumes after the last committed chunk. Pointing the same
+manifest at another destination exports everything there once.
+"""
+
+import hashlib
+import json
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+# Handle both package import and direct execution
+try:
+    from .table import PROVENANCE_FIELDS
+except ImportError:
+    from table import PROVENANCE_FIELDS
+
+# SQLite limits the number of bound parameters per statement
+_LOOKUP_BATCH = 500
+
+
+def content_hash(entry: Dict[str, Any]) -> str:
+    """Stable SHA256 of an entry's content, ignoring provenance fields.
+
+    The same claim re-read from a different shard hashes identically.
+    """
+    content = {k: v for k, v in entry.items() if k not in PROVENANCE_FIELDS}
+    encoded = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def claim_key(entry: Dict[str, Any]) -> str:
+    """Manifest key of an entry: its claim_id, or its shard position without one.
+
+    Entries without a claim_id only pass non-strict validation; keying them
+    by position keeps them from collapsing into a single manifest row.
+    """
+    if "claim_id" in entry:
+        return str(entry["claim_id"])
+    return f"{entry.get('_source_shard', '')}#{entry.get('_source_index', -1)}"
+
+
+class UploadManifest:
+    """SQLite-backed record of exported claims.
+
+    ``sink`` is a sink destination (TraceSink.destination, e.g.
+    ``jsonl:/abs/path.jsonl`` or ``wandb:project``).
+
+    Tables:
+        chunks(chunk_id INTEGER PRIMARY KEY AUTOINCREMENT, run_name, sink,
+            row_count, committed_at): one row per committed chunk. The id is
+            assigned by SQLite and unrelated to the upload engine's chunk ids.
+        uploaded(sink, claim_id, content_hash, chunk_id REFERENCES chunks),
+            keyed by (sink, claim_id)
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS chunks (
+                chunk_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_name TEXT NOT NULL,
+                sink TEXT NOT NULL,
+                row_count INTEGER NOT NULL,
+                committed_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS uploaded (
+                sink TEXT NOT NULL,
+                claim_id TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                chunk_id INTEGER NOT NULL REFERENCES chunks(chunk_id),
+                PRIMARY KEY (sink, claim_id)
+            );
+        """)
+        self._conn.commit()
+
+    def __enter__(self) -> "UploadManifest":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM uploaded").fetchone()[0]
+
+    def count(self, sink: str) -> int:
+        """Claims recorded as exported to the destination ``sink``."""
+        return self._conn.execute("SELECT COUNT(*) FROM uploaded WHERE sink = ?", (sink,)).fetchone()[0]
+
+    def filter_pending(
+        self,
+        entries: List[Dict[str, Any]],
+        sink: Optional[str] = None
+    ) -> List[Tuple[Dict[str, Any], str]]:
+        """Return entries that are new or changed since they were last exported to ``sink``.
+
+        When a claim_id appears more than once the last occurrence wins.
+
+        Args:
+            entries: Validated trace log entries
+            sink: Sink destination (TraceSink.destination); None looks at
+                exports to any destination
+
+        Returns:
+            List of (entry, content_hash) pairs in input order
+        """
+        latest: Dict[str, Tuple[Dict[str, Any], str]] = {}
+        for entry in entries:
+            latest[claim_key(entry)] = (entry, content_hash(entry))
+
+        claim_ids = list(latest)
+        known: Dict[str, str] = {}
+        for start in range(0, len(claim_ids), _LOOKUP_BATCH):
+            batch = claim_ids[start:start + _LOOKUP_BATCH]
+            placeholders = ", ".join("?" for _ in batch)
+            if sink is None:
+                # Any destination counts; prefer the hash that matches
+                rows = self._conn.execute(
+                    f"SELECT claim_id, content_hash FROM uploaded WHERE claim_id IN ({placeholders})",
+                    batch
+                ).fetchall()
+            else:
+                rows = self._conn.execute(
+                    f"SELECT claim_id, content_hash FROM uploaded "
+                    f"WHERE sink = ? AND claim_id IN ({placeholders})",
+                    [sink] + batch
+                ).fetchall()
+            for claim_id, digest in rows:
+                if known.get(claim_id) != latest[claim_id][1]:
+                    known[claim_id] = digest
+
+        return [pair for claim_id, pair in latest.items() if known.get(claim_id) != pair[1]]
+
+    def commit_chunk(self, run_name: str, sink: str, pending: List[Tuple[Dict[str, Any], str]]) -> int:
+        """Record a successfully exported chunk in one transaction.
+
+        Call only after the sink has durably written the chunk, so a crash
+        before this point re-exports the chunk on the next run rather than
+        losing it.
+
+        Args:
+            run_name: Run the chunk was exported in
+            sink: Sink destination (TraceSink.destination)
+            pending: (entry, content_hash) pairs from filter_pending
+
+        Returns:
+            The new chunk_id
+        """
+        committed_at = datetime.now(timezone.utc).isoformat()
+        with self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO chunks (run_name, sink, row_count, committed_at) VALUES (?, ?, ?, ?)",
+                (run_name, sink, len(pending), committed_at)
+            )
+            chunk_id = cursor.lastrowid
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO uploaded (sink, claim_id, content_hash, chunk_id) VALUES (?, ?, ?, ?)",
+                ((sink, claim_key(entry), digest, chunk_id) for entry, digest in pending)
+            )
+        return chunk_id
@@ -0,0 +1,104 @@
+"""
+Merge per-shard trace stats into global statistics
+
+Combines any set of ``.stats.json`` files written by
+``adapter.py --stats-dir`` without reloading the underlying trace shards.
+
+Usage:
+    python merge_stats.py stats/*.stats.json
+    python merge_stats.py stats/ --json
+    python merge_stats.py 'stats/2026-01-*.stats.json' --out january.stats.json
+"""
+
+import json
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+# Handle both package import and direct execution
+try:
+    from .aggregates import TraceAggregates, load_stats, save_stats, GROUP_QUANTILES
+except ImportError:
+    from aggregates import TraceAggregates, load_stats, save_stats, GROUP_QUANTILES
+
+
+def expand_stats_paths(inputs: List[str]) -> List[str]:
+    """Expand files, directories and glob patterns into stats file paths."""
+    import glob
+
+    paths = set()
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            paths.update(str(p) for p in path.glob("*.stats.json"))
+        elif glob.has_magic(item):
+            paths.update(glob.glob(item, recursive=True))
+        else:
+            paths.add(item)
+    return sorted(paths)
+
+
+def merge_stats(paths: List[str]) -> TraceAggregates:
+    """Merge the aggregates stored in ``paths`` into one TraceAggregates."""
+    merged = TraceAggregates()
+    for path in paths:
+        merged.merge(load_stats(path))
+    return merged
+
+
+def format_report(merged: TraceAggregates) -> List[str]:
+    """Human-readable lines for the merged statistics."""
+    lines = [f"Entries: {merged.total}"]
+
+    for title, groups in (("final_decision", merged.confidence_by_decision),
+                          ("epistemic_tag", merged.confidence_by_tag)):
+        lines.append("")
+        lines.append(f"confidence_score by {title}:")
+        lines.append(f"  {'group':<12} {'n':>8} " + " ".join(f"{'p' + str(int(q * 100)):>7}" for q in GROUP_QUANTILES))
+        for key, sketch in sorted(groups.items()):
+            values = " ".join(f"{v:>7.3f}" for v in sketch.quantiles(GROUP_QUANTILES))
+            lines.append(f"  {key:<12} {sketch.n:>8} {values}")
+
+    lines.append("")
+    lines.append("failure_mode x final_decision:")
+    for key, count in sorted(merged.failure_by_decision.items()):
+        failure_mode, decision = key.split("|", 1)
+        lines.append(f"  {failure_mode:<6} {decision:<10} {count:>8}")
+
+    return lines
+
+
+def main(inputs: List[str], as_json: bool = False, out: Optional[str] = None) -> Dict[str, Any]:
+    """Merge stats files, print the result and optionally save the merge."""
+    paths = expand_stats_paths(inputs)
+    if not paths:
+        raise FileNotFoundError(f"No stats files found for: {inputs}")
+
+    merged = merge_stats(paths)
+    if out is not None:
+        save_stats(merged, out)
+
+    summary = merged.summary()
+    if as_json:
+        print(json.dumps({"files": len(paths), "total_entries": merged.total, "summary": summary}, indent=2))
+    else:
+        print(f"Merged {len(paths)} stats file(s)")
+        print("\n".join(format_report(merged)))
+    return summary
+
+
+if __name__ == "__main__":
+    import sys
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Merge per-shard PROACTIVE trace stats")
+    parser.add_argument("inputs", nargs="+", help="Stats files, directories or glob patterns")
+    parser.add_argument("--json", action="store_true", help="Emit merged summary metrics as JSON")
+    parser.add_argument("--out", "-o", default=None, help="Also save the merged stats to this file")
+
+    args = parser.parse_args()
+
+    try:
+        main(args.inputs, args.json, args.out)
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
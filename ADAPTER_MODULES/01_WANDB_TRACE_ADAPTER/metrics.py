@@ -0,0 +1,168 @@
+"""
+Metrics Export for the W&B Trace Adapter
+
+Writes the operational figures of an adapter run as an OpenMetrics text file
+that node_exporter's textfile collector (or any Prometheus scraper) can pick
+up, so throughput regressions in production runs can be alerted on:
+
+    python adapter.py traces/ --metrics-file /var/lib/node_exporter/proactive_adapter.prom
+
+Every sample describes the last run: counts and durations are gauges, and
+per-chunk conversion and upload times are histograms. The output is also
+valid Prometheus text format. The file is replaced atomically, so a scrape
+never sees a half-written run.
+"""
+
+import os
+import sys
+import time
+from typing import List, Dict, Any, Optional, Tuple
+
+PREFIX = "proactive_adapter_"
+
+# Upper bounds (seconds) for per-chunk conversion and upload times
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(float(bound))
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+class MetricsRegistry:
+    """Gauges and histograms of one run, rendered as OpenMetrics text."""
+
+    def __init__(self, prefix: str = PREFIX):
+        self.prefix = prefix
+        # name -> (type, help, gauge samples by label set | histogram data)
+        self._families: Dict[str, Tuple[str, str, Dict[Any, Any]]] = {}
+
+    def _family(self, name: str, kind: str, help_text: str) -> Dict[Any, Any]:
+        family_kind, _, data = self._families.setdefault(self.prefix + name, (kind, help_text, {}))
+        if family_kind != kind:
+            raise ValueError(f"Metric {self.prefix + name} is a {family_kind}, not a {kind}")
+        return data
+
+    def gauge(self, name: str, help_text: str, value: float, **labels: str) -> None:
+        """Set a gauge sample (one per distinct label set)."""
+        self._family(name, "gauge", help_text)[tuple(labels.items())] = float(value)
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        observations: List[float],
+        buckets: Tuple[float, ...] = DURATION_BUCKETS
+    ) -> None:
+        """Record ``observations`` as a histogram with cumulative ``buckets``."""
+        bounds = tuple(sorted(buckets)) + (float("inf"),)
+        self._family(name, "histogram", help_text).update({
+            "counts": [(bound, sum(1 for o in observations if o <= bound)) for bound in bounds],
+            "sum": float(sum(observations))
+        })
+
+    def render(self) -> str:
+        """OpenMetrics text exposition, terminated by ``# EOF``."""
+        lines = []
+        for name, (kind, help_text, data) in self._families.items():
+            lines.append(f"# HELP {name} {_escape(help_text)}")
+            lines.append(f"# TYPE {name} {kind}")
+            if kind == "gauge":
+                for labels, value in data.items():
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+                continue
+            for bound, count in data["counts"]:
+                lines.append(f'{name}_bucket{{le="{_format_bound(bound)}"}} {count}')
+            lines.append(f"{name}_sum {_format_value(data['sum'])}")
+            lines.append(f"{name}_count {data['counts'][-1][1]}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str) -> None:
+        """Write ``render()`` to ``path`` via a temporary file and rename."""
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(self.render())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+def peak_rss_bytes(children: bool = False) -> Optional[int]:
+    """Peak resident set size of this process, or None where unavailable.
+
+    With ``children``, the largest peak among finished child processes
+    (the shard loading workers) instead.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    peak = resource.getrusage(who).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def adapter_metrics(run: Dict[str, Any], success: bool) -> MetricsRegistry:
+    """Metrics for an adapter run.
+
+    Args:
+        run: Figures collected by adapter.main: ``shards``, ``entries_valid``,
+            ``entries_invalid``, ``load_s``, and after an export ``convert_s``
+            (seconds per chunk) and ``upload`` (UploadStats)
+        success: Whether the run completed without raising
+
+    Returns:
+        Registry ready to render or write
+    """
+    registry = MetricsRegistry()
+    registry.gauge("success", "1 if the run completed, 0 if it failed", 1 if success else 0)
+
+    if "entries_valid" in run:
+        valid, invalid = run["entries_valid"], run["entries_invalid"]
+        registry.gauge("shards", "Trace log shards loaded", run["shards"])
+        registry.gauge("entries_loaded", "Trace entries loaded", valid + invalid)
+        registry.gauge("entries_valid", "Trace entries that passed validation", valid)
+        registry.gauge("entries_invalid", "Trace entries rejected by validation", invalid)
+        registry.gauge("load_duration_seconds", "Time to load and validate all shards", run["load_s"])
+
+    if "convert_s" in run:
+        registry.histogram("conversion_duration_seconds", "Time to convert one chunk to a trace table",
+                           run["convert_s"])
+    upload = run.get("upload")
+    if upload is not None:
+        registry.histogram("upload_duration_seconds", "Time to upload one chunk, including retries",
+                           upload.chunk_upload_s)
+        registry.gauge("rows_exported", "Rows accepted by the sink", upload.rows)
+        registry.gauge("chunks_exported", "Chunks accepted by the sink", upload.chunks)
+        registry.gauge("upload_retries", "Chunk upload retries", upload.retries)
+        registry.gauge("export_duration_seconds", "Wall time of the chunked export", upload.elapsed_s)
+        registry.gauge("export_rows_per_second", "Rows exported per second of export wall time",
+                       upload.rows_per_s)
+
+    if "duration_s" in run:
+        registry.gauge("duration_seconds", "Wall time of the adapter run", run["duration_s"])
+    for process, rss in (("self", peak_rss_bytes()), ("children", peak_rss_bytes(children=True))):
+        if rss:
+            registry.gauge("peak_rss_bytes", "Peak resident set size", rss, process=process)
+    registry.gauge("last_run_timestamp_seconds", "Unix time the run finished", round(time.time(), 3))
+    return registry
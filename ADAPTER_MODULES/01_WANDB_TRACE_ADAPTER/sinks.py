@@ -0,0 +1,369 @@
+"""
+Export sinks for the W&B Trace Adapter
+
+A sink receives converted TraceTables and persists them somewhere. The wandb
+backend is imported lazily so the adapter works in air-gapped environments
+and CI can exercise the full pipeline with a local stand-in.
+
+Sink specs (see get_sink):
+    wandb                 Upload to Weights & Biases
+    jsonl:<path>          One JSON object per row
+    sqlite:<path>         SQLite database with a trace_log table
+    parquet:<path>        Parquet file (requires pyarrow)
+    memory                In-process stand-in for tests (MemorySink)
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Handle both package import and direct execution
+try:
+    from .table import TraceTable
+except ImportError:
+    from table import TraceTable
+
+
+class TraceSink:
+    """Base class for trace table export backends.
+
+    Lifecycle: ``open`` once, ``write`` one or more tables, ``finalize`` once.
+    ``write_chunk`` may be called concurrently from upload threads.
+    """
+
+    name = "base"
+    # Whether rows written by earlier runs survive later runs, so an upload
+    # manifest can export only what is new (see manifest.py)
+    keeps_earlier_rows = True
+
+    def __init__(self):
+        self._chunk_lock = threading.Lock()
+        self._accepted_chunks = set()
+
+    @property
+    def destination(self) -> str:
+        """Where rows end up, e.g. ``jsonl:/abs/path.jsonl``; keys the upload manifest."""
+        return self.name
+
+    def open(self, run_name: str, tags: List[str]) -> None:
+        """Start a run/batch."""
+
+    def write(self, table: TraceTable) -> None:
+        """Persist a table (may be called once per chunk)."""
+        raise NotImplementedError
+
+    def write_chunk(self, chunk_id: str, table: TraceTable) -> None:
+        """Persist one chunk exactly once per chunk_id (safe to retry).
+
+        The default serializes ``write`` calls; backends with a concurrent
+        upload path override this.
+        """
+        with self._chunk_lock:
+            if chunk_id in self._accepted_chunks:
+                return
+            self.write(table)
+            self._accepted_chunks.add(chunk_id)
+
+    def write_side_table(self, name: str, table: TraceTable) -> None:
+        """Persist a small auxiliary table (e.g. precomputed aggregates)."""
+
+    def finalize(self, summary: Dict[str, Any]) -> str:
+        """Record summary metrics, close the run and return its location."""
+        raise NotImplementedError
+
+
+class WandbSink(TraceSink):
+    """Upload tables to Weights & Biases.
+
+    Each chunk is logged as a ``trace_log`` table at its own step through the
+    inherited ``write_chunk``, which the upload engine retries. Nothing is
+    held back for finalize, so every chunk committed to an upload manifest is
+    already in the run's ``trace_log`` history.
+    """
+
+    name = "wandb"
+
+    def __init__(self, project: str = "proactive-traces", entity: Optional[str] = None):
+        super().__init__()
+        self.project = project
+        self.entity = entity
+        self._run = None
+
+    @property
+    def destination(self) -> str:
+        return f"wandb:{self.entity}/{self.project}" if self.entity else f"wandb:{self.project}"
+
+    def open(self, run_name: str, tags: List[str]) -> None:
+        import wandb
+        self._run = wandb.init(
+            project=self.project,
+            name=run_name,
+            entity=self.entity,
+            tags=tags,
+            job_type="trace-upload"
+        )
+
+    def write(self, table: TraceTable) -> None:
+        # Accept a ready-made wandb.Table as well as a TraceTable
+        wandb_table = table.to_wandb() if isinstance(table, TraceTable) else table
+        self._run.log({"trace_log": wandb_table})
+
+    def write_side_table(self, name: str, table: TraceTable) -> None:
+        # Attach to the current step rather than advancing it per side table
+        self._run.log({name: table.to_wandb()}, commit=False)
+
+    def finalize(self, summary: Dict[str, Any]) -> str:
+        for key, value in summary.items():
+            self._run.summary[key] = value
+        url = self._run.get_url()
+        self._run.finish()
+        return url
+
+
+class _FileSink(TraceSink):
+    """Sink writing to a local path."""
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = Path(path)
+
+    @property
+    def destination(self) -> str:
+        return f"{self.name}:{self.path.resolve()}"
+
+
+class JsonlSink(_FileSink):
+    """Write rows as JSON lines, plus a ``<path>.summary.json`` sidecar."""
+
+    name = "jsonl"
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._file = None
+        self._meta: Dict[str, Any] = {}
+
+    def open(self, run_name: str, tags: List[str]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'a', encoding='utf-8')
+        self._meta = {"run_name": run_name, "tags": tags}
+
+    def write(self, table: TraceTable) -> None:
+        # One write call per table so a failed chunk leaves no partial rows
+        self._file.write("".join(json.dumps(record, default=str) + "\n" for record in table.iter_records()))
+        self._file.flush()
+
+    def write_side_table(self, name: str, table: TraceTable) -> None:
+        side_path = self.path.with_name(f"{self.path.stem}.{name}.jsonl")
+        with open(side_path, 'w', encoding='utf-8') as f:
+            for record in table.iter_records():
+                f.write(json.dumps(record, default=str) + "\n")
+
+    def finalize(self, summary: Dict[str, Any]) -> str:
+        self._file.close()
+        summary_path = self.path.with_name(self.path.name + ".summary.json")
+        with open(summary_path, 'w', encoding='utf-8') as f:
+            json.dump({**self._meta, "summary": summary}, f, indent=2, default=str)
+        return str(self.path)
+
+
+class SqliteSink(_FileSink):
+    """Write rows to a ``trace_log`` table and summary to ``run_summary``."""
+
+    name = "sqlite"
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._conn = None
+        self._run_name = ""
+        self._columns: Optional[List[str]] = None
+
+    def open(self, run_name: str, tags: List[str]) -> None:
+        import sqlite3
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Writes are serialized by write_chunk's lock, so cross-thread use is safe
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._run_name = run_name
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS run_summary (run_name TEXT, key TEXT, value TEXT)"
+        )
+
+    def write(self, table: TraceTable) -> None:
+        if self._columns is None:
+            self._columns = list(table.columns)
+            column_sql = ", ".join(f'"{c}"' for c in ["run_name"] + self._columns)
+            self._conn.execute(f"CREATE TABLE IF NOT EXISTS trace_log ({column_sql})")
+        placeholders = ", ".join("?" for _ in range(len(self._columns) + 1))
+        self._conn.executemany(
+            f"INSERT INTO trace_log VALUES ({placeholders})",
+            ([self._run_name] + list(row) for row in table.iter_rows())
+        )
+        self._conn.commit()
+
+    def write_side_table(self, name: str, table: TraceTable) -> None:
+        column_sql = ", ".join(f'"{c}"' for c in ["run_name"] + list(table.columns))
+        placeholders = ", ".join("?" for _ in range(len(table.columns) + 1))
+        self._conn.execute(f'CREATE TABLE IF NOT EXISTS "{name}" ({column_sql})')
+        self._conn.executemany(
+            f'INSERT INTO "{name}" VALUES ({placeholders})',
+            ([self._run_name] + list(row) for row in table.iter_rows())
+        )
+        self._conn.commit()
+
+    def finalize(self, summary: Dict[str, Any]) -> str:
+        self._conn.executemany(
+            "INSERT INTO run_summary VALUES (?, ?, ?)",
+            ((self._run_name, k, json.dumps(v, default=str)) for k, v in summary.items())
+        )
+        self._conn.commit()
+        self._conn.close()
+        return str(self.path)
+
+
+class ParquetSink(_FileSink):
+    """Write rows to a Parquet file with the summary stored as file metadata.
+
+    Rows are buffered and the file is rewritten on finalize, so this sink
+    cannot be used with an upload manifest.
+    """
+
+    name = "parquet"
+    keeps_earlier_rows = False
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._columns: Optional[List[str]] = None
+        self._rows: List[List[Any]] = []
+        self._side_tables: Dict[str, Dict[str, Any]] = {}
+        self._meta: Dict[str, Any] = {}
+
+    def open(self, run_name: str, tags: List[str]) -> None:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError("Parquet sink requires pyarrow: pip install pyarrow")
+        self._meta = {"run_name": run_name, "tags": tags}
+
+    def write(self, table: TraceTable) -> None:
+        if self._columns is None:
+            self._columns = list(table.columns)
+        self._rows.extend(table.iter_rows())
+
+    def write_side_table(self, name: str, table: TraceTable) -> None:
+        # Side tables are tiny; keep them in the file metadata
+        self._side_tables[name] = {"columns": list(table.columns), "data": table.data}
+
+    def finalize(self, summary: Dict[str, Any]) -> str:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        columns = self._columns or []
+        arrays = {name: [row[i] for row in self._rows] for i, name in enumerate(columns)}
+        arrow_table = pa.table(arrays).replace_schema_metadata({
+            "proactive_summary": json.dumps(
+                {**self._meta, "summary": summary, "side_tables": self._side_tables}, default=str
+            )
+        })
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(arrow_table, str(self.path))
+        return str(self.path)
+
+
+class MemorySink(TraceSink):
+    """Keep everything in memory; a stand-in for W&B in tests and CI.
+
+    Args:
+        failures: chunk_id -> number of times write_chunk should fail before
+            succeeding, to exercise retry paths
+        latency_s: Artificial delay per chunk, to exercise concurrency
+    """
+
+    name = "memory"
+
+    def __init__(self, failures: Optional[Dict[str, int]] = None, latency_s: float = 0.0):
+        super().__init__()
+        self.failures = dict(failures or {})
+        self.latency_s = latency_s
+        self.run_name: Optional[str] = None
+        self.tags: List[str] = []
+        self.tables: List[TraceTable] = []
+        self.chunks: Dict[str, TraceTable] = {}
+        self.side_tables: Dict[str, TraceTable] = {}
+        self.summary: Dict[str, Any] = {}
+        self.attempts: Dict[str, int] = {}
+
+    def open(self, run_name: str, tags: List[str]) -> None:
+        self.run_name = run_name
+        self.tags = tags
+
+    def write(self, table: TraceTable) -> None:
+        self.tables.append(table)
+
+    def write_chunk(self, chunk_id: str, table: TraceTable) -> None:
+        import time
+        with self._chunk_lock:
+            self.attempts[chunk_id] = self.attempts.get(chunk_id, 0) + 1
+            remaining = self.failures.get(chunk_id, 0)
+            if remaining:
+                self.failures[chunk_id] = remaining - 1
+        if remaining:
+            raise ConnectionError(f"Injected failure for chunk {chunk_id}")
+        if self.latency_s:
+            time.sleep(self.latency_s)
+        with self._chunk_lock:
+            if chunk_id not in self.chunks:
+                self.chunks[chunk_id] = table
+                self.tables.append(table)
+
+    def write_side_table(self, name: str, table: TraceTable) -> None:
+        self.side_tables[name] = table
+
+    def finalize(self, summary: Dict[str, Any]) -> str:
+        self.summary = summary
+        return f"memory://{self.run_name}"
+
+
+LOCAL_SINKS = {
+    "jsonl": JsonlSink,
+    "sqlite": SqliteSink,
+    "parquet": ParquetSink,
+}
+
+_EXTENSION_SINKS = {
+    ".jsonl": "jsonl",
+    ".db": "sqlite",
+    ".sqlite": "sqlite",
+    ".parquet": "parquet",
+}
+
+
+def get_sink(spec: str, project: str = "proactive-traces", entity: Optional[str] = None) -> TraceSink:
+    """Build a sink from a spec string.
+
+    Args:
+        spec: ``wandb``, ``memory``, ``<kind>:<path>`` or a bare path whose extension
+            selects the backend (.jsonl, .db/.sqlite, .parquet)
+        project: W&B project name (wandb sink only)
+        entity: W&B entity (wandb sink only)
+
+    Returns:
+        TraceSink instance
+
+    Raises:
+        ValueError: If the spec names an unknown backend
+    """
+    if spec == "wandb":
+        return WandbSink(project=project, entity=entity)
+    if spec == "memory":
+        return MemorySink()
+
+    kind, sep, path = spec.partition(":")
+    if sep and kind in LOCAL_SINKS:
+        return LOCAL_SINKS[kind](path)
+
+    kind = _EXTENSION_SINKS.get(Path(spec).suffix.lower())
+    if kind is None:
+        raise ValueError(
+            f"Unknown sink: {spec} (expected wandb, jsonl:<path>, sqlite:<path> or parquet:<path>)"
+        )
+    return LOCAL_SINKS[kind](spec)
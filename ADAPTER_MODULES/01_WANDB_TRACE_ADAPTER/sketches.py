@@ -0,0 +1,143 @@
+"""
+Mergeable streaming sketches for trace statistics
+
+KLLSketch estimates quantiles of a stream in O(k log n) memory and can be
+merged with sketches built over other shards; the merged sketch has the same
+error guarantees as one built over the concatenated stream.
+"""
+
+import math
+from typing import List, Dict, Any, Optional, Tuple
+
+
+class KLLSketch:
+    """KLL quantile sketch (Karnin, Lang & Liberty, 2016).
+
+    Items live in a hierarchy of compactors; an item at level ``h`` stands for
+    ``2**h`` original items. When a level fills up it is sorted and every
+    other item is promoted to the next level. Compaction offsets alternate per
+    level so results are deterministic for a given input order.
+
+    Args:
+        k: Accuracy parameter; rank error is roughly 1.7 / k
+    """
+
+    def __init__(self, k: int = 200):
+        self.k = k
+        self.n = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self._compactors: List[List[float]] = [[]]
+        self._offsets: List[int] = [0]
+        self._size = 0
+        self._max_size = self._capacity(0)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._compactors) - level - 1
+        return int(math.ceil(self.k * (2 / 3) ** depth)) + 1
+
+    def _grow(self) -> None:
+        self._compactors.append([])
+        self._offsets.append(0)
+        self._max_size = sum(self._capacity(h) for h in range(len(self._compactors)))
+
+    def update(self, value: float) -> None:
+        """Add one value to the sketch."""
+        self.n += 1
+        self.min = value if self.min is None or value < self.min else self.min
+        self.max = value if self.max is None or value > self.max else self.max
+        self._compactors[0].append(value)
+        self._size += 1
+        if self._size >= self._max_size:
+            self._compress()
+
+    def _compress(self) -> None:
+        for level in range(len(self._compactors)):
+            items = self._compactors[level]
+            if len(items) >= self._capacity(level):
+                if level + 1 >= len(self._compactors):
+                    self._grow()
+                items.sort()
+                # Keep the last item at this level if the count is odd
+                keep = [items.pop()] if len(items) % 2 else []
+                offset = self._offsets[level]
+                self._offsets[level] ^= 1
+                self._compactors[level + 1].extend(items[offset::2])
+                self._compactors[level] = keep
+                self._size = sum(len(c) for c in self._compactors)
+                if self._size < self._max_size:
+                    break
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """Fold ``other`` into this sketch in place and return self."""
+        if other.n == 0:
+            return self
+        while len(self._compactors) < len(other._compactors):
+            self._grow()
+        for level, items in enumerate(other._compactors):
+            self._compactors[level].extend(items)
+        self.n += other.n
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self._size = sum(len(c) for c in self._compactors)
+        while self._size >= self._max_size:
+            self._compress()
+        return self
+
+    def _weighted(self) -> List[Tuple[float, int]]:
+        weighted = [(value, 1 << level) for level, items in enumerate(self._compactors) for value in items]
+        weighted.sort()
+        return weighted
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimated value at quantile ``q`` (0.0-1.0), or None if empty."""
+        return self.quantiles([q])[0]
+
+    def quantiles(self, qs: List[float]) -> List[Optional[float]]:
+        """Estimated values at several quantiles with a single sort."""
+        if self.n == 0:
+            return [None for _ in qs]
+        weighted = self._weighted()
+        total = sum(weight for _, weight in weighted)
+        results = []
+        for q in qs:
+            if q <= 0:
+                results.append(self.min)
+                continue
+            if q >= 1:
+                results.append(self.max)
+                continue
+            target = q * total
+            cumulative = 0
+            value = weighted[-1][0]
+            for item, weight in weighted:
+                cumulative += weight
+                if cumulative >= target:
+                    value = item
+                    break
+            results.append(value)
+        return results
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form for persisting next to an upload."""
+        return {
+            "type": "kll",
+            "k": self.k,
+            "n": self.n,
+            "min": self.min,
+            "max": self.max,
+            "compactors": self._compactors,
+            "offsets": self._offsets
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "KLLSketch":
+        sketch = cls(k=data["k"])
+        sketch.n = data["n"]
+        sketch.min = data["min"]
+        sketch.max = data["max"]
+        sketch._compactors = [list(c) for c in data["compactors"]]
+        sketch._offsets = list(data["offsets"])
+        sketch._size = sum(len(c) for c in sketch._compactors)
+        sketch._max_size = sum(sketch._capacity(h) for h in range(len(sketch._compactors)))
+        return sketch
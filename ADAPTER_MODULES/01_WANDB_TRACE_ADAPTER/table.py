@@ -0,0 +1,229 @@
+"""
+Backend-neutral trace table
+
+Holds converted trace rows independently of any export backend.
+
+TraceTable stores rows as a list of lists. CompactTraceTable stores the same
+rows column by column: low-cardinality columns (check results, decisions,
+tags) as small integer codes into a per-column category list, numbers in
+typed arrays, and claim text as a reference to the entry's own string plus
+the truncation length. Rows are only materialized while they are iterated.
+"""
+
+from array import array
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Iterator, Optional
+
+# Provenance keys attached to entries loaded through adapter.load_shards
+PROVENANCE_FIELDS = ["_source_shard", "_source_index"]
+
+# Column kinds understood by CompactTraceTable
+CATEGORICAL = "categorical"
+TEXT = "text"
+FLOAT = "float"
+INT = "int"
+BOOL = "bool"
+OBJECT = "object"
+
+
+@dataclass
+class TraceTable:
+    """Converted trace log rows.
+
+    Exposes ``columns`` and ``data`` like ``wandb.Table`` so existing callers
+    keep working, but does not require wandb to be installed.
+    """
+    columns: List[str]
+    data: List[List[Any]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def iter_rows(self) -> Iterator[List[Any]]:
+        """Yield each row as a list of values in column order."""
+        return iter(self.data)
+
+    def iter_records(self):
+        """Yield each row as a column-name -> value dictionary."""
+        for row in self.iter_rows():
+            yield dict(zip(self.columns, row))
+
+    def to_wandb(self):
+        """Convert to a ``wandb.Table`` (imports wandb on first use)."""
+        import wandb
+        return wandb.Table(columns=self.columns, data=self.data)
+
+
+class _CategoricalColumn:
+    """Interned values stored as one-byte codes (widened past 256 categories)."""
+
+    __slots__ = ("categories", "codes", "_lookup")
+
+    def __init__(self):
+        self.categories: List[Any] = []
+        self.codes = array("B")
+        self._lookup: Dict[Any, int] = {}
+
+    def append(self, value: Any) -> None:
+        # Key on the type too so True, 1 and 1.0 stay distinct categories
+        key = (type(value), value)
+        try:
+            code = self._lookup.get(key)
+        except TypeError:
+            # Unhashable values (non-strict input) get a category of their own
+            key, code = None, None
+        if code is None:
+            code = len(self.categories)
+            self.categories.append(value)
+            if key is not None:
+                self._lookup[key] = code
+            if code == 256 and self.codes.typecode == "B":
+                self.codes = array("I", self.codes)
+        self.codes.append(code)
+
+    def __getitem__(self, index: int) -> Any:
+        return self.categories[self.codes[index]]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+class _TextColumn:
+    """Claim text kept as references to the source strings.
+
+    Truncation is applied on read, so no shortened copy exists until a row is
+    materialized.
+    """
+
+    __slots__ = ("values", "limit")
+
+    def __init__(self, limit: Optional[int]):
+        self.values: List[str] = []
+        self.limit = limit
+
+    def append(self, value: str) -> None:
+        self.values.append(value)
+
+    def __getitem__(self, index: int) -> str:
+        text = self.values[index]
+        if self.limit is not None and len(text) > self.limit:
+            return text[:self.limit] + "..."
+        return text
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class _PackedColumn:
+    """Numbers in a typed array; falls back to a list for other input.
+
+    Only values of the column's own type are packed, so rows read back with
+    the types they were added with. A float column also packs exactly
+    representable ints and records their positions, so a score of 1 reads
+    back as 1, not 1.0.
+    """
+
+    __slots__ = ("values", "_type", "_ints")
+
+    def __init__(self, typecode: str, value_type: type):
+        self.values: Any = array(typecode)
+        self._type = value_type
+        self._ints: Optional[set] = None
+
+    def append(self, value: Any) -> None:
+        if isinstance(self.values, array):
+            try:
+                if type(value) is self._type:
+                    self.values.append(value)
+                    return
+                if self._type is float and type(value) is int and -2**53 <= value <= 2**53:
+                    if self._ints is None:
+                        self._ints = set()
+                    self._ints.add(len(self.values))
+                    self.values.append(value)
+                    return
+            except OverflowError:
+                pass
+            self.values = [self[index] for index in range(len(self.values))]
+            self._ints = None
+        self.values.append(value)
+
+    def __getitem__(self, index: int) -> Any:
+        value = self.values[index]
+        if isinstance(self.values, list):
+            return value
+        if self._ints is not None and index in self._ints:
+            return int(value)
+        return bool(value) if self._type is bool else value
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class _ObjectColumn(list):
+    """Arbitrary values (mostly unique strings such as claim IDs)."""
+
+    __slots__ = ()
+
+
+def _make_column(kind: str, text_limit: Optional[int]):
+    if kind == CATEGORICAL:
+        return _CategoricalColumn()
+    if kind == TEXT:
+        return _TextColumn(text_limit)
+    if kind == FLOAT:
+        return _PackedColumn("d", float)
+    if kind == INT:
+        return _PackedColumn("q", int)
+    if kind == BOOL:
+        return _PackedColumn("B", bool)
+    if kind == OBJECT:
+        return _ObjectColumn()
+    raise ValueError(f"Unknown column kind: {kind}")
+
+
+class CompactTraceTable(TraceTable):
+    """Column-oriented TraceTable with interned categories and lazy truncation.
+
+    Behaves like TraceTable for every sink; ``data`` materializes the rows as
+    a list of lists on access, so prefer ``iter_rows()`` or ``len()``.
+
+    Args:
+        columns: Column names in row order
+        kinds: Column kind per name (CATEGORICAL, TEXT, FLOAT, INT, BOOL or
+            OBJECT); unlisted columns are OBJECT
+        text_limit: Truncation length applied to TEXT columns on read
+    """
+
+    def __init__(self, columns: List[str], kinds: Optional[Dict[str, str]] = None,
+                 text_limit: Optional[int] = None):
+        kinds = kinds or {}
+        self.columns = columns
+        self.kinds = {name: kinds.get(name, OBJECT) for name in columns}
+        self._columns = [_make_column(self.kinds[name], text_limit) for name in columns]
+        self._length = 0
+
+    @property
+    def data(self) -> List[List[Any]]:
+        return list(self.iter_rows())
+
+    def append(self, row: List[Any]) -> None:
+        """Add one row; values are in column order, claim text untruncated."""
+        for column, value in zip(self._columns, row):
+            column.append(value)
+        self._length += 1
+
+    def __len__(self) -> int:
+        return self._length
+
+    def iter_rows(self) -> Iterator[List[Any]]:
+        columns = self._columns
+        for index in range(self._length):
+            yield [column[index] for column in columns]
+
+    def categories(self, name: str) -> List[Any]:
+        """Distinct values of a categorical column, in code order."""
+        column = self._columns[self.columns.index(name)]
+        if not isinstance(column, _CategoricalColumn):
+            raise ValueError(f"Column {name} is not categorical")
+        return list(column.categories)
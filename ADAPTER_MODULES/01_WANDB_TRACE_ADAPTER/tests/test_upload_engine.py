@@ -0,0 +1,184 @@
+"""
+UploadEngine against MemorySink with injected failures and latency.
+
+Run with: python -m pytest 01_WANDB_TRACE_ADAPTER/tests
+"""
+
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from adapter import export_chunked  # noqa: E402
+from config import AdapterConfig  # noqa: E402
+from manifest import UploadManifest  # noqa: E402
+from sinks import MemorySink, WandbSink  # noqa: E402
+from table import TraceTable  # noqa: E402
+from upload_engine import UploadEngine, UploadError  # noqa: E402
+
+
+def make_chunks(count, rows_per_chunk=10):
+    """(chunk_id, table) pairs whose rows are unique across all chunks."""
+    return [
+        (f"{index:05d}", TraceTable(
+            columns=["claim_id"],
+            data=[[f"CLAIM-{index:05d}-{row}"] for row in range(rows_per_chunk)]
+        ))
+        for index in range(count)
+    ]
+
+
+def sink_rows(sink):
+    return sorted(row[0] for table in sink.chunks.values() for row in table.iter_rows())
+
+
+def make_entries(count):
+    return [
+        {
+            "claim_id": f"CLAIM-{index:04d}",
+            "timestamp": "2026-01-01T00:00:00Z",
+            "claim_text": f"claim {index}",
+            "confidence_score": 0.5,
+            "epistemic_tag": "KNOWN",
+            "validator_results": {f"I{i}_check": "PASS" for i in range(1, 7)},
+            "final_decision": "SHIP"
+        }
+        for index in range(count)
+    ]
+
+
+def test_transient_failures_are_retried_without_loss_or_duplication():
+    chunks = make_chunks(12)
+    sink = MemorySink(failures={"00000": 2, "00005": 1, "00011": 3}, latency_s=0.001)
+    committed = []
+    sleeps = []
+
+    engine = UploadEngine(sink, max_in_flight=4, max_retries=3, backoff_base_s=0.01,
+                          sleep=sleeps.append, seed=7)
+    stats = engine.upload(chunks, on_committed=committed.append)
+
+    assert sorted(committed) == [chunk_id for chunk_id, _ in chunks]
+    assert stats.chunks == 12
+    assert stats.rows == 120
+    assert stats.retries == 6
+    assert len(sleeps) == 6
+    assert 1 <= stats.peak_in_flight <= 4
+    assert sink_rows(sink) == sorted(row[0] for _, table in chunks for row in table.iter_rows())
+    assert sink.attempts["00011"] == 4
+
+
+def test_retries_are_bounded():
+    sink = MemorySink(failures={"00002": 10})
+    committed = []
+    engine = UploadEngine(sink, max_in_flight=1, max_retries=2, sleep=lambda s: None)
+
+    with pytest.raises(UploadError, match="00002 failed after 3 attempts"):
+        engine.upload(make_chunks(5), on_committed=committed.append)
+
+    assert sink.attempts["00002"] == 3
+    # Earlier chunks stay committed, the failed one is never reported
+    assert committed == ["00000", "00001"]
+    assert sorted(sink.chunks) == ["00000", "00001"]
+
+
+def test_backoff_is_capped():
+    sink = MemorySink(failures={"00000": 8})
+    sleeps = []
+    engine = UploadEngine(sink, max_retries=8, backoff_base_s=1.0, backoff_max_s=2.0,
+                          sleep=sleeps.append, seed=1)
+    engine.upload(make_chunks(1))
+
+    assert len(sleeps) == 8
+    assert all(0 <= s <= 2.0 for s in sleeps)
+
+
+def test_resent_chunk_is_accepted_once():
+    sink = MemorySink()
+    (chunk_id, table), = make_chunks(1)
+    sink.write_chunk(chunk_id, table)
+    sink.write_chunk(chunk_id, table)
+
+    assert len(sink.tables) == 1
+    assert sink.attempts[chunk_id] == 2
+
+
+def test_manifest_resumes_after_failed_chunk(tmp_path):
+    entries = make_entries(25)
+    config = AdapterConfig(upload_chunk_size=10, max_in_flight=1, max_retries=0, retry_backoff_s=0.0)
+
+    with UploadManifest(str(tmp_path / "manifest.db")) as manifest:
+        # Chunk ids embed a hash of their claim ids, so fail the second one by position
+        failing = MemorySink()
+        failing.write_chunk = _fail_nth(failing, 2)
+        with pytest.raises(UploadError):
+            export_chunked(entries, failing, config, run_name="first", manifest=manifest)
+        first_rows = sink_rows(failing)
+        assert len(first_rows) == 10
+        assert manifest.count(failing.destination) == 10
+
+        resumed = MemorySink()
+        export_chunked(entries, resumed, config, run_name="second", manifest=manifest)
+        assert sorted(first_rows + sink_rows(resumed)) == [entry["claim_id"] for entry in entries]
+        assert manifest.count(resumed.destination) == 25
+
+        assert export_chunked(entries, MemorySink(), config, run_name="third", manifest=manifest) is None
+
+
+class _FakeRun:
+    """Records run.log calls; the first ``failures`` calls raise."""
+
+    id = "run-1"
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.logged = []
+        self.summary = {}
+
+    def log(self, data, commit=True):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("Injected log failure")
+        self.logged.append(data)
+
+    def get_url(self):
+        return "https://wandb.example/run-1"
+
+    def finish(self):
+        pass
+
+
+def test_wandb_sink_logs_each_chunk_once_through_retries(monkeypatch):
+    run = _FakeRun(failures=2)
+    fake_wandb = types.ModuleType("wandb")
+    fake_wandb.init = lambda **kwargs: run
+    fake_wandb.Table = lambda columns, data: TraceTable(columns=list(columns), data=list(data))
+    monkeypatch.setitem(sys.modules, "wandb", fake_wandb)
+
+    sink = WandbSink(project="test")
+    sink.open("run", [])
+    chunks = make_chunks(4)
+    UploadEngine(sink, max_in_flight=2, max_retries=3, sleep=lambda s: None).upload(chunks)
+    sink.finalize({"total_entries": 40})
+
+    logged = sorted(row[0] for data in run.logged for row in data["trace_log"].data)
+    assert logged == sorted(row[0] for _, table in chunks for row in table.iter_rows())
+    assert len(run.logged) == 4
+    assert run.summary == {"total_entries": 40}
+
+
+def _fail_nth(sink, n):
+    """Wrap sink.write_chunk so the n-th distinct chunk always fails."""
+    write_chunk = sink.write_chunk
+    seen = []
+
+    def wrapper(chunk_id, table):
+        if chunk_id not in seen:
+            seen.append(chunk_id)
+        if seen.index(chunk_id) == n - 1:
+            raise ConnectionError(f"Injected failure for chunk {chunk_id}")
+        write_chunk(chunk_id, table)
+
+    return wrapper
@@ -0,0 +1,243 @@
+"""
+Trace-Chain Graph Index
+
+Indexes the REQ → CTRL → TEST → EVID → DECISION links of every trace entry
+so auditors can answer root-cause questions without rescanning the log:
+
+    claims_under("REQ-001")        all claims whose chain passes through REQ-001
+    decisions_missing("EVID")      all DECISION_ids whose chain has no EVID_id
+    claims_sharing_prompt(hash)    all claims produced by the same prompt
+    downstream("REQ-001")          trace IDs one link further down the chain
+
+Lookups are dictionary hits returning O(degree) results. The index is
+persisted as gzip-compressed JSON with claim IDs interned to integers.
+
+Usage:
+    python trace_index.py <index.json.gz> claims-under REQ-001
+    python trace_index.py <index.json.gz> missing EVID
+    python trace_index.py <index.json.gz> prompt <prompt_hash>
+    python trace_index.py <index.json.gz> downstream REQ-001
+"""
+
+import gzip
+import json
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Set
+
+INDEX_VERSION = 1
+
+TRACE_FIELDS = ["REQ_id", "CTRL_id", "TEST_id", "EVID_id", "DECISION_id"]
+
+
+def _normalize_field(kind: str) -> str:
+    """Accept ``EVID`` as well as ``EVID_id``."""
+    field_name = kind if kind.endswith("_id") else f"{kind}_id"
+    if field_name not in TRACE_FIELDS:
+        raise ValueError(f"Unknown trace field: {kind} (expected one of {TRACE_FIELDS})")
+    return field_name
+
+
+class TraceIndex:
+    """Graph of trace IDs to claims built from trace log entries."""
+
+    def __init__(self):
+        # Interned claims: position -> claim_id and the claim's trace chain
+        self._claims: List[Optional[str]] = []
+        self._chains: List[Optional[List[Optional[str]]]] = []
+        self._prompts: List[Optional[str]] = []
+        self._positions: Dict[str, int] = {}
+        # Inverted indexes over claim positions
+        self._by_trace_id: Dict[str, Set[int]] = {}
+        self._by_prompt: Dict[str, Set[int]] = {}
+        self._missing: Dict[str, Set[int]] = {f: set() for f in TRACE_FIELDS}
+        # Trace ID -> trace IDs one link further down, with edge multiplicity
+        self._edges: Dict[str, Dict[str, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def add_entries(self, entries: List[Dict[str, Any]]) -> None:
+        """Index entries, replacing any previously indexed claim with the same claim_id."""
+        for entry in entries:
+            self.add_entry(entry)
+
+    def add_entry(self, entry: Dict[str, Any]) -> None:
+        """Index a single entry."""
+        claim_id = entry.get("claim_id")
+        if claim_id is None:
+            return
+        if claim_id in self._positions:
+            self._remove(self._positions[claim_id])
+
+        trace = entry.get("trace_chain") or {}
+        chain = [trace.get(f) or None for f in TRACE_FIELDS]
+        prompt_hash = entry.get("prompt_hash") or None
+
+        pos = len(self._claims)
+        self._claims.append(claim_id)
+        self._chains.append(chain)
+        self._prompts.append(prompt_hash)
+        self._positions[claim_id] = pos
+        self._link(pos)
+
+    def _link(self, pos: int) -> None:
+        chain = self._chains[pos]
+        for field_name, trace_id in zip(TRACE_FIELDS, chain):
+            if trace_id is None:
+                self._missing[field_name].add(pos)
+            else:
+                self._by_trace_id.setdefault(trace_id, set()).add(pos)
+
+        present = [trace_id for trace_id in chain if trace_id is not None]
+        for upstream, downstream in zip(present, present[1:]):
+            edges = self._edges.setdefault(upstream, {})
+            edges[downstream] = edges.get(downstream, 0) + 1
+
+        if self._prompts[pos] is not None:
+            self._by_prompt.setdefault(self._prompts[pos], set()).add(pos)
+
+    def _remove(self, pos: int) -> None:
+        chain = self._chains[pos]
+        for field_name, trace_id in zip(TRACE_FIELDS, chain):
+            if trace_id is None:
+                self._missing[field_name].discard(pos)
+            else:
+                self._by_trace_id[trace_id].discard(pos)
+
+        present = [trace_id for trace_id in chain if trace_id is not None]
+        for upstream, downstream in zip(present, present[1:]):
+            edges = self._edges[upstream]
+            edges[downstream] -= 1
+            if edges[downstream] == 0:
+                del edges[downstream]
+
+        if self._prompts[pos] is not None:
+            self._by_prompt[self._prompts[pos]].discard(pos)
+
+        del self._positions[self._claims[pos]]
+        self._claims[pos] = None
+        self._chains[pos] = None
+        self._prompts[pos] = None
+
+    def _claim_ids(self, positions: Set[int]) -> List[str]:
+        return sorted(self._claims[pos] for pos in positions)
+
+    # Queries
+
+    def claims_under(self, trace_id: str) -> List[str]:
+        """Claim IDs whose trace chain contains ``trace_id`` at any level."""
+        return self._claim_ids(self._by_trace_id.get(trace_id, set()))
+
+    def claims_sharing_prompt(self, prompt_hash: str) -> List[str]:
+        """Claim IDs produced by the same prompt."""
+        return self._claim_ids(self._by_prompt.get(prompt_hash, set()))
+
+    def decisions_missing(self, kind: str) -> List[Dict[str, Optional[str]]]:
+        """Claims whose chain lacks ``kind`` (e.g. ``EVID``), with their DECISION_id."""
+        field_name = _normalize_field(kind)
+        decision_col = TRACE_FIELDS.index("DECISION_id")
+        return sorted(
+            ({"claim_id": self._claims[pos], "DECISION_id": self._chains[pos][decision_col]}
+             for pos in self._missing[field_name]),
+            key=lambda item: item["claim_id"]
+        )
+
+    def downstream(self, trace_id: str) -> List[str]:
+        """Trace IDs one link further down the chain from ``trace_id``."""
+        return sorted(self._edges.get(trace_id, {}))
+
+    def chain(self, claim_id: str) -> Optional[Dict[str, Optional[str]]]:
+        """The indexed trace chain of a claim, or None if unknown."""
+        pos = self._positions.get(claim_id)
+        if pos is None:
+            return None
+        return dict(zip(TRACE_FIELDS, self._chains[pos]))
+
+    # Persistence
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Compact serializable form; dropped positions are compacted away."""
+        live = [pos for pos, claim_id in enumerate(self._claims) if claim_id is not None]
+        renumber = {old: new for new, old in enumerate(live)}
+
+        def positions(values: Set[int]) -> List[int]:
+            return sorted(renumber[pos] for pos in values)
+
+        return {
+            "version": INDEX_VERSION,
+            "fields": TRACE_FIELDS,
+            "claims": [self._claims[pos] for pos in live],
+            "chains": [self._chains[pos] for pos in live],
+            "prompts": [self._prompts[pos] for pos in live],
+            "by_trace_id": {k: positions(v) for k, v in self._by_trace_id.items() if v},
+            "by_prompt": {k: positions(v) for k, v in self._by_prompt.items() if v},
+            "missing": {k: positions(v) for k, v in self._missing.items()},
+            "edges": {k: v for k, v in self._edges.items() if v}
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TraceIndex":
+        """Rebuild an index from ``to_dict`` output without re-deriving it."""
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported trace index version: {data.get('version')}")
+        index = cls()
+        index._claims = data["claims"]
+        index._chains = data["chains"]
+        index._prompts = data["prompts"]
+        index._positions = {claim_id: pos for pos, claim_id in enumerate(index._claims)}
+        index._by_trace_id = {k: set(v) for k, v in data["by_trace_id"].items()}
+        index._by_prompt = {k: set(v) for k, v in data["by_prompt"].items()}
+        index._missing = {k: set(v) for k, v in data["missing"].items()}
+        index._edges = data["edges"]
+        return index
+
+    def save(self, path: str) -> None:
+        """Write the index as gzip-compressed JSON."""
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(target, 'wt', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str) -> "TraceIndex":
+        """Read an index written by ``save``."""
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+def build_index(entries: List[Dict[str, Any]], existing: Optional[str] = None) -> TraceIndex:
+    """Build a trace index, optionally extending one previously saved at ``existing``."""
+    index = TraceIndex.load(existing) if existing and Path(existing).exists() else TraceIndex()
+    index.add_entries(entries)
+    return index
+
+
+if __name__ == "__main__":
+    import sys
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Query a PROACTIVE trace-chain index")
+    parser.add_argument("index", help="Path to index file written by adapter.py --index")
+    parser.add_argument("query", choices=["claims-under", "missing", "prompt", "downstream", "chain"],
+                        help="Query type")
+    parser.add_argument("value", help="Trace ID, trace field (e.g. EVID), prompt hash or claim ID")
+
+    args = parser.parse_args()
+
+    try:
+        trace_index = TraceIndex.load(args.index)
+        if args.query == "claims-under":
+            result: Any = trace_index.claims_under(args.value)
+        elif args.query == "missing":
+            result = trace_index.decisions_missing(args.value)
+        elif args.query == "prompt":
+            result = trace_index.claims_sharing_prompt(args.value)
+        elif args.query == "downstream":
+            result = trace_index.downstream(args.value)
+        else:
+            result = trace_index.chain(args.value)
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    print(json.dumps(result, indent=2))
@@ -0,0 +1,164 @@
+"""
+Bounded-concurrency upload engine
+
+Sends table chunks to a TraceSink from a small thread pool with a bounded
+in-flight window, so converting the next chunk overlaps uploading the
+previous ones and memory stays proportional to the window, not the log.
+Failed chunks are retried with exponential backoff and full jitter. Each
+chunk carries a deterministic chunk_id so a retried chunk is accepted at most
+once (see TraceSink.write_chunk).
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from dataclasses import dataclass, asdict, field
+from typing import Iterable, List, Tuple, Callable, Optional, Dict, Any, Set
+
+# Handle both package import and direct execution
+try:
+    from .sinks import TraceSink
+    from .table import TraceTable
+except ImportError:
+    from sinks import TraceSink
+    from table import TraceTable
+
+
+class UploadError(Exception):
+    """A chunk could not be uploaded after all retries."""
+
+
+@dataclass
+class UploadStats:
+    """Throughput and reliability metrics for one engine run."""
+    chunks: int = 0
+    rows: int = 0
+    retries: int = 0
+    elapsed_s: float = 0.0
+    peak_in_flight: int = 0
+    # Seconds per committed chunk, including retries and backoff
+    chunk_upload_s: List[float] = field(default_factory=list, repr=False)
+
+    @property
+    def rows_per_s(self) -> float:
+        return self.rows / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    @property
+    def chunks_per_s(self) -> float:
+        return self.chunks / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    def to_summary(self) -> Dict[str, Any]:
+        """Flat metrics suitable for ``run.summary``."""
+        metrics = {f"upload/{k}": v for k, v in asdict(self).items() if k != "chunk_upload_s"}
+        metrics["upload/rows_per_s"] = self.rows_per_s
+        metrics["upload/chunks_per_s"] = self.chunks_per_s
+        return metrics
+
+
+class UploadEngine:
+    """Upload chunks concurrently with a bounded window and retries.
+
+    Args:
+        sink: Opened sink to write chunks to
+        max_in_flight: Maximum chunks being uploaded at once
+        max_retries: Retries per chunk after the first attempt
+        backoff_base_s: First retry waits up to this long; doubles per attempt
+        backoff_max_s: Upper bound on a single backoff
+        sleep: Sleep function (injectable for tests)
+        seed: Optional seed for the backoff jitter
+    """
+
+    def __init__(
+        self,
+        sink: TraceSink,
+        max_in_flight: int = 4,
+        max_retries: int = 5,
+        backoff_base_s: float = 0.5,
+        backoff_max_s: float = 30.0,
+        sleep: Callable[[float], None] = time.sleep,
+        seed: Optional[int] = None
+    ):
+        self.sink = sink
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_retries = max(0, max_retries)
+        self.backoff_base_s = backoff_base_s
+        self.backoff_max_s = backoff_max_s
+        self._sleep = sleep
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._retries = 0
+
+    def _backoff(self, attempt: int) -> float:
+        with self._lock:
+            jitter = self._random.random()
+        return min(self.backoff_max_s, self.backoff_base_s * (2 ** attempt)) * jitter
+
+    def _send(self, chunk_id: str, table: TraceTable) -> float:
+        start = time.perf_counter()
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.sink.write_chunk(chunk_id, table)
+                return time.perf_counter() - start
+            except Exception as e:
+                if attempt == self.max_retries:
+                    raise UploadError(
+                        f"Chunk {chunk_id} failed after {attempt + 1} attempts: {e}"
+                    ) from e
+                with self._lock:
+                    self._retries += 1
+                self._sleep(self._backoff(attempt))
+
+    def upload(
+        self,
+        chunks: Iterable[Tuple[str, TraceTable]],
+        on_committed: Optional[Callable[[str], None]] = None
+    ) -> UploadStats:
+        """Upload ``(chunk_id, table)`` pairs and return throughput metrics.
+
+        ``chunks`` is consumed lazily, at most ``max_in_flight`` ahead of the
+        slowest pending upload. ``on_committed`` runs on the calling thread
+        after each chunk is accepted, in completion order.
+
+        Raises:
+            UploadError: If any chunk exhausts its retries; chunks already
+                committed stay committed
+        """
+        stats = UploadStats()
+        self._retries = 0
+        start = time.perf_counter()
+        pending: Dict[Future, Tuple[str, int]] = {}
+        chunk_iter = iter(chunks)
+        exhausted = False
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as pool:
+            try:
+                while pending or not exhausted:
+                    while not exhausted and len(pending) < self.max_in_flight:
+                        try:
+                            chunk_id, table = next(chunk_iter)
+                        except StopIteration:
+                            exhausted = True
+                            break
+                        pending[pool.submit(self._send, chunk_id, table)] = (chunk_id, len(table))
+                        stats.peak_in_flight = max(stats.peak_in_flight, len(pending))
+
+                    if not pending:
+                        break
+                    done: Set[Future] = wait(pending, return_when=FIRST_COMPLETED).done
+                    for future in done:
+                        chunk_id, rows = pending.pop(future)
+                        stats.chunk_upload_s.append(future.result())
+                        stats.chunks += 1
+                        stats.rows += rows
+                        if on_committed is not None:
+                            on_committed(chunk_id)
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+            finally:
+                stats.retries = self._retries
+                stats.elapsed_s = time.perf_counter() - start
+
+        return stats
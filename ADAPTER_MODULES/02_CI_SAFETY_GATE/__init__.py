@@ -10,19 +10,48 @@ Success Metric: Gate catches seeded vulnerabilities that pass standard tests
 __version__ = "1.0.0"
 __author__ = "PROACTIVE Research Toolkit"
 
-from .validator import (
-    validate_file,
-    validate_directory,
-    generate_report,
-    generate_sarif,
-    check_invariants,
-    check_invariant_i1,
-    check_invariant_i2,
-    check_invariant_i3,
-    check_invariant_i4,
-    check_invariant_i5,
-    check_invariant_i6,
-    load_config,
-    Violation,
-    ValidationResult
-)
+# Public API, re-exported lazily from .validator on first attribute access
+# so importing the package (e.g. from pre-commit hooks) stays cheap.
+__all__ = [
+    "validate_file",
+    "validate_directory",
+    "validate_archive",
+    "generate_report",
+    "generate_sarif",
+    "check_invariants",
+    "check_invariant_i1",
+    "check_invariant_i2",
+    "check_invariant_i3",
+    "check_invariant_i4",
+    "check_invariant_i5",
+    "check_invariant_i6",
+    "load_config",
+    "reset_config",
+    "get_rules",
+    "compile_rules",
+    "ConfigManager",
+    "CompiledRules",
+    "RegexBackend",
+    "available_regex_backends",
+    "check_performance",
+    "BlobCache",
+    "TraceIndex",
+    "apply_trace_index",
+    "parse_shard",
+    "merge_reports",
+    "validate_stream",
+    "scan_history",
+    "GitObjectReader",
+    "assign_fingerprints",
+    "load_violation_baseline",
+    "write_violation_baseline",
+    "Violation",
+    "ValidationResult"
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        from . import validator
+        return getattr(validator, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,122 @@
+"""
+Archive Members for the PROACTIVE Safety Gate
+
+Validates the members of tar and zip archives in place, without extracting
+them to disk. Tar archives (plain, .gz, .bz2, .xz, .zst) are read as a
+stream, so only the current member is held in memory. Members are reported
+as ``<archive>!/<member>``.
+"""
+
+from typing import List, Optional
+
+# Handle both package import and direct execution
+try:
+    from .gate import (
+        ValidationResult, BlobCache, _container_kind, _open_compressed, _read_bounded,
+        _max_member_bytes, _scan_bytes, _read_error, _match_patterns, _decode_text
+    )
+except ImportError:
+    from gate import (
+        ValidationResult, BlobCache, _container_kind, _open_compressed, _read_bounded,
+        _max_member_bytes, _scan_bytes, _read_error, _match_patterns, _decode_text
+    )
+
+
+def _iter_archive(archive_path: str, limit: int):
+    """Yield (member name, bytes or the exception reading it) one member at a time.
+    
+    Tar archives are read as a stream (mode ``r|``), so only the current
+    member is ever held in memory.
+    """
+    if _container_kind(archive_path) == "zip":
+        import zipfile
+        with zipfile.ZipFile(archive_path) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                try:
+                    with archive.open(info) as stream:
+                        yield info.filename, _read_bounded(stream, limit, info.filename)
+                except Exception as e:
+                    yield info.filename, e
+        return
+    
+    import tarfile
+    if archive_path.lower().endswith(".tar.zst"):
+        source = _open_compressed(archive_path, "zstandard")
+        archive = tarfile.open(fileobj=source, mode="r|")
+    else:
+        source = None
+        archive = tarfile.open(archive_path, mode="r|*")
+    try:
+        for member in archive:
+            if not member.isfile():
+                continue
+            try:
+                stream = archive.extractfile(member)
+                yield member.name, _read_bounded(stream, limit, member.name)
+            except Exception as e:
+                yield member.name, e
+    finally:
+        archive.close()
+        if source is not None:
+            source.close()
+
+
+def validate_archive(
+    archive_path: str,
+    workspace: str = ".",
+    include_patterns: Optional[List[str]] = None,
+    exclude_patterns: Optional[List[str]] = None,
+    blob_cache: Optional[BlobCache] = None,
+    match_prefix: Optional[str] = None,
+    index: Optional["TraceIndex"] = None
+) -> List[ValidationResult]:
+    """Validate the members of a tar or zip archive without extracting it.
+    
+    Members are reported as ``<archive>!/<member>``. They are matched against
+    the include/exclude patterns as if the archive were a directory named
+    ``match_prefix`` (default: the archive path). Member names are normalized
+    first, so ``./sub/m.json`` and ``/sub/m.json`` both become ``sub/m.json``. A member larger than
+    ``validation_targets.max_member_mb`` or an unreadable archive yields a
+    SYSTEM error instead of being skipped silently.
+    
+    Args:
+        archive_path: Path to the .tar[.gz|.bz2|.xz|.zst], .tgz or .zip file
+        workspace: Workspace root for file existence checks
+        include_patterns: Glob patterns for members to include (None: all)
+        exclude_patterns: Glob patterns for members to exclude
+        blob_cache: Optional per-run cache; identical content is scanned once
+        match_prefix: Path the member names are joined to for matching
+        index: Optional cross-file trace index the scanned members are added to
+        
+    Returns:
+        List of ValidationResults, one per scanned member
+    """
+    import posixpath
+    
+    prefix = match_prefix if match_prefix is not None else archive_path
+    results = []
+    try:
+        for name, data in _iter_archive(archive_path, _max_member_bytes()):
+            name = posixpath.normpath(name).lstrip("/")
+            match_path = f"{prefix}/{name}"
+            if exclude_patterns and _match_patterns(match_path, exclude_patterns):
+                continue
+            if include_patterns is not None and not _match_patterns(match_path, include_patterns):
+                continue
+            display_path = f"{archive_path}!/{name}"
+            if isinstance(data, Exception):
+                results.append(_read_error(display_path, f"Error reading archive member: {data}"))
+                continue
+            try:
+                violations = _scan_bytes(data, display_path, workspace, blob_cache)
+            except Exception as e:
+                results.append(_read_error(display_path, f"Error reading archive member: {e}"))
+                continue
+            results.append(ValidationResult(file_path=display_path, violations=violations))
+            if index is not None:
+                index.add(_decode_text(data), display_path)
+    except Exception as e:
+        results.append(_read_error(archive_path, f"Error reading archive: {e}"))
+    return results
@@ -0,0 +1,291 @@
+"""
+Batch mode for the PROACTIVE Safety Gate
+
+Validates many workspaces (e.g. every repository in an org) from one warm
+process: config is parsed and rules are compiled once, then reused for every
+workspace. ``--jobs N`` spreads workspaces over N worker processes, each of
+which loads the rules once in its initializer.
+
+Each workspace gets its own report (violation_schema.json) and a time budget;
+a workspace that runs out of budget stops before its next file and fails with
+a SYSTEM violation instead of holding up the rest of the batch. The org-level
+roll-up lists every workspace's gate result and the totals.
+
+Manifest formats:
+    workspaces.txt   one path per line, optionally "name<TAB>path"; # comments
+    workspaces.json  ["repo-a", {"name": "b", "path": "repos/b", "budget_s": 600}]
+
+Usage:
+    python batch.py workspaces.txt --out-dir reports/
+    python batch.py workspaces.json --jobs 8 --budget 300 --format sarif --out-dir reports/
+"""
+
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+# Handle both package import and direct execution
+try:
+    from . import validator
+except ImportError:
+    import validator
+
+ROLLUP_FORMAT = "proactive-batch-rollup"
+ROLLUP_VERSION = 1
+
+
+@dataclass
+class Workspace:
+    """One entry of a batch manifest."""
+    name: str
+    path: str
+    budget_s: Optional[float] = None
+
+
+def load_manifest(manifest_path: str) -> List[Workspace]:
+    """Read a batch manifest (JSON list or one path per line).
+
+    Relative paths are resolved against the manifest's directory. Names
+    become report file names, so they must be plain file names.
+
+    Raises:
+        ValueError: If an entry is malformed, a name is not a plain file name
+            (contains a path separator, is ``.``/``..`` or ``rollup``) or two
+            entries share a name
+    """
+    base = Path(manifest_path).resolve().parent
+    text = Path(manifest_path).read_text(encoding='utf-8')
+
+    entries: List[Dict[str, Any]] = []
+    if manifest_path.endswith(".json"):
+        for item in json.loads(text):
+            if isinstance(item, str):
+                entries.append({"path": item})
+            elif isinstance(item, dict) and "path" in item:
+                entries.append(item)
+            else:
+                raise ValueError(f"Invalid manifest entry: {item!r}")
+    else:
+        for line in text.splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            name, _, path = line.rpartition("\t")
+            entries.append({"name": name.strip() or None, "path": path.strip()})
+
+    workspaces = []
+    seen = set()
+    for entry in entries:
+        path = Path(os.path.expanduser(entry["path"]))
+        if not path.is_absolute():
+            path = base / path
+        name = entry.get("name") or path.name
+        if (not isinstance(name, str) or not name or "/" in name or "\\" in name
+                or name in (".", "..") or name == "rollup"):
+            raise ValueError(f"Invalid workspace name in manifest: {name!r} "
+                             "(use a plain file name, e.g. org-repo)")
+        if name in seen:
+            raise ValueError(f"Duplicate workspace name in manifest: {name}")
+        seen.add(name)
+        budget = entry.get("budget_s")
+        workspaces.append(Workspace(name, str(path), float(budget) if budget is not None else None))
+    return workspaces
+
+
+def run_workspace(workspace: Workspace, config_path: str, budget_s: Optional[float] = None) -> Dict[str, Any]:
+    """Validate one workspace with the already loaded rules.
+
+    Args:
+        workspace: Manifest entry
+        config_path: Config path recorded in the report
+        budget_s: Default time budget when the entry sets none
+
+    Returns:
+        Report dictionary matching schema, plus a ``workspace`` section
+    """
+    start = time.monotonic()
+    budget = workspace.budget_s if workspace.budget_s is not None else budget_s
+    deadline = start + budget if budget else None
+
+    results = validator.validate_directory(workspace.path, deadline=deadline)
+    git_context = validator.get_git_context(workspace.path) if Path(workspace.path).is_dir() else {}
+    report = validator.generate_report(results, git_context, config_path, workspace=workspace.path)
+
+    elapsed = time.monotonic() - start
+    report["summary"]["execution_time_ms"] = int(elapsed * 1000)
+    report["workspace"] = {
+        "name": workspace.name,
+        "path": workspace.path,
+        "budget_s": budget,
+        "timed_out": any(v.rule_id == "SYSTEM.time_budget" for r in results for v in r.violations)
+    }
+    return report
+
+
+def _init_worker(config_path: str) -> None:
+    """Pool initializer: parse config and compile rules once per worker."""
+    validator.reset_config()
+    validator.get_rules(config_path)
+
+
+def _run_in_worker(workspace: Workspace, config_path: str, budget_s: Optional[float]) -> Dict[str, Any]:
+    return run_workspace(workspace, config_path, budget_s)
+
+
+def rollup(reports: List[Dict[str, Any]], elapsed_s: float) -> Dict[str, Any]:
+    """Org-level summary of per-workspace reports."""
+    from datetime import datetime, timezone
+
+    rows = []
+    totals: Dict[str, Any] = {
+        "workspaces": len(reports), "passed": 0, "failed": 0, "timed_out": 0,
+        "files_scanned": 0, "violations": 0, "errors": 0, "warnings": 0, "by_invariant": {}
+    }
+    for report in reports:
+        summary = report["summary"]
+        ws = report["workspace"]
+        rows.append({
+            "name": ws["name"],
+            "path": ws["path"],
+            "gate_result": summary["gate_result"],
+            "gate_reason": summary["gate_reason"],
+            "files_scanned": summary["total_files_scanned"],
+            "violations": summary["total_violations"],
+            "errors": summary["errors"],
+            "warnings": summary["warnings"],
+            "by_invariant": summary["by_invariant"],
+            "execution_time_ms": summary.get("execution_time_ms"),
+            "timed_out": ws["timed_out"]
+        })
+        totals["passed" if summary["gate_result"] == "PASS" else "failed"] += 1
+        totals["timed_out"] += ws["timed_out"]
+        totals["files_scanned"] += summary["total_files_scanned"]
+        totals["violations"] += summary["total_violations"]
+        totals["errors"] += summary["errors"]
+        totals["warnings"] += summary["warnings"]
+        for inv, count in summary["by_invariant"].items():
+            totals["by_invariant"][inv] = totals["by_invariant"].get(inv, 0) + count
+
+    return {
+        "format": ROLLUP_FORMAT,
+        "version": ROLLUP_VERSION,
+        "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "execution_time_ms": int(elapsed_s * 1000),
+        "totals": totals,
+        "workspaces": rows
+    }
+
+
+def run_batch(
+    workspaces: List[Workspace],
+    config_path: str = "validator_config.yaml",
+    jobs: int = 1,
+    budget_s: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """Validate every workspace and return the reports in manifest order.
+
+    Args:
+        workspaces: Manifest entries
+        config_path: Validator config shared by all workspaces
+        jobs: Worker processes; 1 runs everything in this process
+        budget_s: Default per-workspace time budget in seconds
+    """
+    if jobs <= 1:
+        _init_worker(config_path)
+        return [run_workspace(ws, config_path, budget_s) for ws in workspaces]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(config_path,)) as pool:
+        futures = [pool.submit(_run_in_worker, ws, config_path, budget_s) for ws in workspaces]
+        return [future.result() for future in futures]
+
+
+def print_rollup(summary: Dict[str, Any]) -> None:
+    """Print the roll-up as a table, failing workspaces first."""
+    totals = summary["totals"]
+    print("=" * 72)
+    print("PROACTIVE Safety Gate - Batch Roll-up")
+    print("=" * 72)
+    print(f"Workspaces: {totals['workspaces']}  passed: {totals['passed']}  "
+          f"failed: {totals['failed']}  timed out: {totals['timed_out']}")
+    print(f"Files: {totals['files_scanned']}  violations: {totals['violations']} "
+          f"({totals['errors']} errors, {totals['warnings']} warnings)  "
+          f"time: {summary['execution_time_ms'] / 1000:.1f}s")
+    print()
+    print(f"  {'workspace':<32} {'result':<8} {'files':>7} {'errors':>7} {'warn':>6} {'time':>8}")
+    for row in sorted(summary["workspaces"], key=lambda r: (r["gate_result"] == "PASS", r["name"])):
+        result = "TIMEOUT" if row["timed_out"] else row["gate_result"]
+        print(f"  {row['name'][:32]:<32} {result:<8} {row['files_scanned']:>7} {row['errors']:>7} "
+              f"{row['warnings']:>6} {(row['execution_time_ms'] or 0) / 1000:>7.1f}s")
+    print("=" * 72)
+
+
+def main(
+    manifest_path: str,
+    config_path: str = "validator_config.yaml",
+    jobs: int = 1,
+    budget_s: Optional[float] = None,
+    out_dir: Optional[str] = None,
+    output_format: str = "json",
+    as_json: bool = False
+) -> int:
+    """Run a batch and write per-workspace reports plus the roll-up.
+
+    Returns:
+        Exit code (0 = every workspace passed, 1 = at least one failed)
+    """
+    start = time.monotonic()
+    workspaces = load_manifest(manifest_path)
+    reports = run_batch(workspaces, config_path, jobs, budget_s)
+    summary = rollup(reports, time.monotonic() - start)
+
+    if out_dir:
+        target = Path(out_dir)
+        target.mkdir(parents=True, exist_ok=True)
+        for report in reports:
+            name = report["workspace"]["name"]
+            if output_format == "sarif":
+                (target / f"{name}.sarif").write_text(
+                    json.dumps(validator.generate_sarif(report), indent=2), encoding='utf-8')
+            else:
+                (target / f"{name}.json").write_text(json.dumps(report, indent=2), encoding='utf-8')
+        (target / "rollup.json").write_text(json.dumps(summary, indent=2), encoding='utf-8')
+
+    if as_json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print_rollup(summary)
+
+    return 0 if summary["totals"]["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    import sys
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the PROACTIVE Safety Gate over many workspaces")
+    parser.add_argument("manifest", help="Workspace manifest (.json list or one path per line)")
+    parser.add_argument("--config", "-c", default="validator_config.yaml",
+                        help="Validator config shared by all workspaces (default: validator_config.yaml)")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Worker processes (default: 1, everything in this process)")
+    parser.add_argument("--budget", type=float, default=None,
+                        help="Per-workspace time budget in seconds (manifest budget_s overrides)")
+    parser.add_argument("--out-dir", "-o", default=None,
+                        help="Write <name>.json|.sarif per workspace and rollup.json here")
+    parser.add_argument("--format", "-f", choices=["json", "sarif"], default="json",
+                        help="Per-workspace report format (default: json)")
+    parser.add_argument("--json", action="store_true", help="Print the roll-up as JSON")
+
+    args = parser.parse_args()
+
+    try:
+        sys.exit(main(args.manifest, args.config, args.jobs, args.budget,
+                      args.out_dir, args.format, args.json))
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
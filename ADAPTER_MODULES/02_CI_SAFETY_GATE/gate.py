@@ -0,0 +1,2385 @@
+"""
+PROACTIVE Constitutional Validator - core
+Validates model outputs against I1-I6 invariants
+
+validator.py is the command line entry point and re-exports this API. Keeping
+the implementation in an imported module lets Python cache its bytecode
+instead of compiling it on every run.
+
+Version: 1.0.0
+Status: IMPLEMENTED
+"""
+
+import json
+import re
+import os
+import sys
+import time
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple, Callable, FrozenSet
+from dataclasses import dataclass, field, asdict, replace
+from importlib.util import find_spec
+
+# Heavier or rarely needed modules (yaml, fnmatch, datetime, subprocess,
+# argparse) are imported where they are used so CLI cold start stays fast.
+# Only probe for yaml here; importing it is deferred until a config is loaded.
+YAML_AVAILABLE = find_spec("yaml") is not None
+
+
+@dataclass
+class Violation:
+    """Single constitutional violation."""
+    violation_id: str
+    invariant: str
+    severity: str
+    location: Dict[str, Any]
+    message: str
+    suggested_fix: Optional[str] = None
+    evidence: Optional[Dict[str, Any]] = None
+    rule_id: Optional[str] = None
+    fingerprint: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary, excluding None values."""
+        return {k: v for k, v in asdict(self).items() if v is not None}
+
+
+@dataclass
+class ValidationResult:
+    """Result of validating a single file."""
+    file_path: str
+    violations: List[Violation] = field(default_factory=list)
+    
+    @property
+    def has_errors(self) -> bool:
+        return any(v.severity == "ERROR" for v in self.violations)
+    
+    @property
+    def error_count(self) -> int:
+        return sum(1 for v in self.violations if v.severity == "ERROR")
+    
+    @property
+    def warning_count(self) -> int:
+        return sum(1 for v in self.violations if v.severity == "WARNING")
+
+
+def _get_default_config() -> Dict[str, Any]:
+    """Return default configuration when YAML not available or file not found."""
+    return {
+        "validator": {
+            "name": "PROACTIVE Constitutional Safety Gate",
+            "version": "1.0.0",
+            "regex_backend": "re"
+        },
+        "invariants": {
+            "I1_evidence_first": {
+                "enabled": True, 
+                "severity": "ERROR",
+                "patterns": [
+                    {"pattern": r"\b(certainly|definitely|absolutely|guaranteed|always|never)\b",
+                     "message": "Absolute claim without epistemic qualification"},
+                    {"pattern": r"\b(I am sure|I am certain|there is no doubt)\b",
+                     "message": "Certainty expression without evidence reference"}
+                ],
+                "required_tags": ["OBSERVED", "INFERRED", "SPECULATED"]
+            },
+            "I2_no_phantom_work": {
+                "enabled": True, 
+                "severity": "ERROR",
+                "validators": [
+                    {"type": "file_existence",
+                     "patterns": [
+                         r'(?:created|generated|wrote|saved|output).*?["\']([^"\']+\.[a-zA-Z]{2,5})["\']',
+                         r'(?:file|document|report)\s+["\']([^"\']+\.[a-zA-Z]{2,5})["\'].*?(?:created|ready|complete)'
+                     ]},
+                    {"type": "artifact_verification",
+                     "patterns": [r"\b(completed|finished|done|implemented)\b.*\b(all|every|entire)\b"]}
+                ]
+            },
+            "I3_confidence_requires_verification": {
+                "enabled": True, 
+                "severity": "WARNING",
+                "confidence_threshold": 0.8,
+                "patterns": [{"pattern": r"confidence[:\s]*([01]\.?\d*)"}],
+                "verification_keywords": ["verified", "tested", "validated", "confirmed", "evidence", "proof", "artifact"]
+            },
+            "I4_traceability_mandatory": {
+                "enabled": True, 
+                "severity": "ERROR",
+                "required_trace_fields": ["REQ_id", "CTRL_id", "TEST_id", "EVID_id", "DECISION_id"],
+                "patterns": [{"pattern": r"\b(decided|decision|approved|rejected|selected)\b",
+                             "message": "Decision statement without trace chain reference"}]
+            },
+            "I5_safety_over_fluency": {
+                "enabled": True, 
+                "severity": "WARNING",
+                "patterns": [
+                    {"pattern": r"(?:seems? like|probably|might|could be|appears to).*?(?:certain|definite|high confidence)",
+                     "message": "Hedging language combined with certainty"},
+                    {"pattern": r"(?:certain|definite|high confidence).*?(?:seems? like|probably|might|could be|appears to)",
+                     "message": "Certainty combined with hedging language"}
+                ]
+            },
+            "I6_fail_closed": {
+                "enabled": True, 
+                "severity": "ERROR",
+                "patterns": [
+                    {"pattern": r"(?:ignore|suppress|skip|bypass|work around).*?(?:error|exception|failure|warning)",
+                     "message": "Attempting to bypass error instead of fail-closed behavior"},
+                    {"pattern": r"(?:error|exception|failure).*?(?:ignore|suppress|skip|continue anyway)",
+                     "message": "Continuing despite error instead of fail-closed behavior"},
+                    {"pattern": r"try\s*:.*?except\s*:?\s*pass",
+                     "message": "Silent exception handling - should surface error"},
+                    {"pattern": r"catch.*?\{\s*(?://.*?continue|/\*.*?\*/\s*\})",
+                     "message": "Empty catch block - should surface error"}
+                ]
+            }
+        },
+        "gate": {
+            "fail_on_error": True,
+            "fail_on_warning": False,
+            "warning_threshold": 5,
+            "output_format": "sarif",
+            "performance": {
+                "enabled": True,
+                "severity": "ERROR",
+                "max_regression_pct": 10.0,
+                "noise_iqr_factor": 1.0,
+                "metrics": [
+                    "validate_directory.mb_per_s",
+                    "validate_directory.items_per_s",
+                    "convert_to_wandb_table.items_per_s"
+                ]
+            }
+        },
+        "validation_targets": {
+            "include": ["**/*.json", "**/*.jsonl", "**/*.yaml", "**/*.yml", "**/outputs/*.md", "**/claims/*.txt"],
+            "exclude": ["node_modules/**", ".git/**", "**/*.test.*", "**/test_cases/**", "**/__pycache__/**"],
+            "archives": True,
+            "max_member_mb": 64,
+            "read_ahead": {"threads": 4, "memory_mb": 64}
+        },
+        "logging": {
+            "max_context_length": 200
+        }
+    }
+
+
+# Parsed configs are cached on disk as JSON keyed by config fingerprint.
+# Override the location with PROACTIVE_VALIDATOR_CACHE (set it empty to disable).
+CONFIG_CACHE_ENV = "PROACTIVE_VALIDATOR_CACHE"
+CONFIG_CACHE_VERSION = 1
+
+# validator.regex_backend selects the engine; the environment variable
+# overrides it. "auto" picks the first installed engine in REGEX_BACKENDS.
+REGEX_BACKEND_ENV = "PROACTIVE_REGEX_BACKEND"
+REGEX_BACKENDS = ("re2", "regex", "re")
+
+
+def available_regex_backends() -> List[str]:
+    """Installed regex engines, in ``auto`` preference order."""
+    return [name for name in REGEX_BACKENDS if name == "re" or find_spec(name) is not None]
+
+
+def _inline_flags(flags: int) -> str:
+    """``re`` flags as an inline group, for engines that take no flag argument."""
+    letters = ("i" if flags & re.IGNORECASE else "") + ("s" if flags & re.DOTALL else "")
+    return f"(?{letters})" if letters else ""
+
+
+class RegexBackend:
+    """Compiles rule patterns with one regex engine, falling back to ``re``.
+    
+    ``regex`` takes the stdlib flag values; google-re2 gets them as an inline
+    ``(?is)`` group and can prefilter a whole pattern list with one
+    ``re2.Set`` scan. Patterns an engine rejects (RE2 has no backreferences
+    or lookaround) are compiled with ``re`` instead and listed in
+    ``fallbacks`` as (owner, pattern, reason).
+    
+    Args:
+        name: "re", "regex", "re2" or "auto"
+    """
+    
+    def __init__(self, name: str = "re"):
+        available = available_regex_backends()
+        if name == "auto":
+            name = available[0]
+        elif name not in available:
+            if name not in REGEX_BACKENDS:
+                print(f"Warning: Unknown regex backend '{name}', using re", file=sys.stderr)
+            else:
+                print(f"Warning: Regex backend '{name}' is not installed, using re", file=sys.stderr)
+            name = "re"
+        self.name = name
+        self.module = re
+        if name != "re":
+            import importlib
+            self.module = importlib.import_module(name)
+        self.fallbacks: List[Tuple[str, str, str]] = []
+    
+    def compile(self, pattern: str, flags: int = 0, owner: str = ""):
+        """Compile ``pattern`` with this engine, or with ``re`` if it is unsupported.
+        
+        Raises:
+            re.error: If ``re`` cannot compile the pattern either
+        """
+        if self.name == "re":
+            return re.compile(pattern, flags)
+        try:
+            if self.name == "re2":
+                return self.module.compile(_inline_flags(flags) + pattern)
+            return self.module.compile(pattern, flags)
+        except Exception as e:
+            compiled = re.compile(pattern, flags)
+            self.fallbacks.append((owner, pattern, str(e)))
+            print(f"Warning: {owner} pattern not supported by {self.name}, using re: {pattern} - {e}", file=sys.stderr)
+            return compiled
+    
+    def prefilter(self, entries: List[Tuple[Any, str, str]], flags: int):
+        """One-pass candidate filter for a compiled pattern list, or None.
+        
+        Only google-re2 provides set matching. Patterns that fell back to
+        ``re`` are always kept as candidates.
+        """
+        regex_set_type = getattr(self.module, "Set", None)
+        if self.name != "re2" or regex_set_type is None or len(entries) < 2:
+            return None
+        try:
+            regex_set = regex_set_type.SearchSet()
+            slots = [
+                None if isinstance(regex, re.Pattern) else regex_set.Add(_inline_flags(flags) + pattern)
+                for regex, pattern, _ in entries
+            ]
+            regex_set.Compile()
+        except Exception:
+            return None
+        return _SetPrefilter(regex_set, slots)
+
+
+class _SetPrefilter:
+    """Selects the entries of a pattern list whose regex occurs in the content."""
+    
+    def __init__(self, regex_set, slots: List[Optional[int]]):
+        self.regex_set = regex_set
+        self.slots = slots
+    
+    def __call__(self, content: str, entries: List[Tuple[Any, str, str]]) -> List[Tuple[Any, str, str]]:
+        hits = set(self.regex_set.Match(content))
+        return [entry for entry, slot in zip(entries, self.slots) if slot is None or slot in hits]
+
+
+def _candidates(settings: Dict[str, Any], key: str, content: str) -> List[Tuple[Any, str, str]]:
+    """Pattern entries of ``settings[key]`` that can match ``content``."""
+    prefilter = settings.get("prefilters", {}).get(key)
+    entries = settings[key]
+    return entries if prefilter is None else prefilter(content, entries)
+
+
+# Content types for applies_to routing. Path types come from the file suffix
+# (after stripping a compression suffix); "trace" is decided by the content,
+# the same test check_invariant_i4 uses for its trace-field check.
+CONTENT_TYPE_SUFFIXES = {
+    "code": (".py", ".js", ".jsx", ".ts", ".tsx", ".java", ".kt", ".go", ".rs", ".rb", ".php",
+             ".c", ".h", ".cc", ".cpp", ".hpp", ".cs", ".swift", ".scala", ".sh"),
+    "json": (".json", ".jsonl", ".ndjson"),
+    "yaml": (".yaml", ".yml"),
+    "markdown": (".md", ".markdown", ".rst"),
+    "text": (".txt", ".log")
+}
+
+
+def _is_trace_document(content: str) -> bool:
+    lowered = content.lower()
+    return "trace_chain" in lowered or "decision_id" in lowered
+
+
+CONTENT_PREDICATES = {"trace": _is_trace_document}
+
+# (glob sets, content type sets): a rule applies when the path matches some
+# glob of every set and the file is of some type of every set
+Route = Tuple[Tuple[Tuple[str, ...], ...], Tuple[FrozenSet[str], ...]]
+UNROUTED: Route = ((), ())
+
+
+def _route(section: Any, owner: str, parent: Route = UNROUTED) -> Route:
+    """``parent`` narrowed by the ``applies_to``/``content_types`` keys of ``section``."""
+    if not isinstance(section, dict):
+        return parent
+    globs, types = parent
+    applies_to = section.get("applies_to")
+    if applies_to:
+        if isinstance(applies_to, str):
+            applies_to = [applies_to]
+        # Relative globs match at any depth, like include patterns with **/
+        globs += (tuple(g if g.startswith(("**/", "/")) else f"**/{g}" for g in applies_to),)
+    content_types = section.get("content_types")
+    if content_types:
+        if isinstance(content_types, str):
+            content_types = [content_types]
+        known = frozenset(t for t in content_types if t in CONTENT_TYPE_SUFFIXES or t in CONTENT_PREDICATES)
+        for name in sorted(set(content_types) - known):
+            print(f"Warning: Unknown content type '{name}' in {owner} config; "
+                  f"expected one of {sorted(CONTENT_TYPE_SUFFIXES) + sorted(CONTENT_PREDICATES)}",
+                  file=sys.stderr)
+        if known:
+            types += (known,)
+    return globs, types
+
+
+def _compile_patterns(
+    invariant: str,
+    pattern_defs: List[Any],
+    flags: int,
+    default_message: str = "",
+    default_pattern: str = "",
+    backend: Optional[RegexBackend] = None
+) -> List[Tuple[Any, str, str]]:
+    """Compile config pattern entries into (regex, pattern, message) tuples.
+    
+    Entries are either ``{"pattern": ..., "message": ...}`` dicts or bare
+    pattern strings. Invalid patterns are reported once and skipped.
+    """
+    backend = backend or RegexBackend("re")
+    compiled = []
+    for pattern_def in pattern_defs:
+        if isinstance(pattern_def, dict):
+            pattern = pattern_def.get("pattern", default_pattern)
+            message = pattern_def.get("message", default_message)
+        else:
+            pattern, message = pattern_def, default_message
+        if not pattern:
+            continue
+        try:
+            compiled.append((backend.compile(pattern, flags, invariant), pattern, message))
+        except re.error as e:
+            print(f"Warning: Invalid regex pattern in {invariant} config: {pattern} - {e}")
+    return compiled
+
+
+class CompiledRules:
+    """Validator config with every invariant regex compiled once.
+    
+    ``invariants`` maps I1-I6 to their settings: ``enabled``, ``severity``,
+    compiled ``patterns`` as (regex, pattern, message) tuples, plus the
+    per-invariant keyword and field regexes the checks need. With the ``re``
+    and ``regex`` backends the structure holds only builtins and compiled
+    patterns so it pickles portably; re2 rule sets are rebuilt per process.
+    ``backend`` names the engine and ``fallbacks`` lists the patterns it
+    could not compile (see RegexBackend).
+    """
+    
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        fingerprint: str,
+        invariants: Dict[str, Dict[str, Any]],
+        backend: str = "re",
+        fallbacks: Optional[List[Tuple[str, str, str]]] = None
+    ):
+        self.config = config
+        self.fingerprint = fingerprint
+        self.invariants = invariants
+        self.backend = backend
+        self.fallbacks = fallbacks or []
+        self.max_context = config.get("logging", {}).get("max_context_length", 200)
+        
+        # Every distinct glob set and content predicate some route refers to
+        routes = [inv.get("route", UNROUTED) for inv in invariants.values()]
+        for inv in invariants.values():
+            for key_routes in inv.get("routes", {}).values():
+                routes.extend(key_routes)
+        self._glob_sets = sorted({globs for route in routes for globs in route[0]})
+        self._predicates = sorted({t for route in routes for types in route[1] for t in types
+                                   if t in CONTENT_PREDICATES})
+        self.routed = any(route != UNROUTED for route in routes)
+        # Dispatch table: file signature -> invariants with only the rules
+        # that apply to such files
+        self._dispatch: Dict[Tuple, Dict[str, Dict[str, Any]]] = {}
+        self._last: Tuple[Optional[str], Optional[str], Dict[str, Dict[str, Any]]] = (None, None, invariants)
+    
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["_dispatch"] = {}
+        state["_last"] = (None, None, self.invariants)
+        return state
+    
+    def path_signature(self, file_path: str) -> Tuple:
+        """The part of a file's routing signature decided by its path alone."""
+        if not self.routed:
+            return ()
+        path = file_path.replace(os.sep, "/")
+        base, suffix = os.path.splitext(path)
+        if suffix.lower() in COMPRESSION_SUFFIXES:
+            path = base
+        suffix = os.path.splitext(path)[1].lower()
+        file_type = next((t for t, suffixes in CONTENT_TYPE_SUFFIXES.items() if suffix in suffixes), None)
+        return (file_type,) + tuple(_match_patterns(path, list(globs)) for globs in self._glob_sets)
+    
+    def view(self, file_path: str, content: str) -> Dict[str, Dict[str, Any]]:
+        """Invariant settings reduced to the rules that apply to this file.
+        
+        Without any ``applies_to``/``content_types`` in the config this is
+        ``invariants`` itself.
+        """
+        if not self.routed:
+            return self.invariants
+        last_path, last_content, last_view = self._last
+        if file_path == last_path and content is last_content:
+            return last_view
+        
+        signature = self.path_signature(file_path) + tuple(
+            CONTENT_PREDICATES[name](content) for name in self._predicates
+        )
+        view = self._dispatch.get(signature)
+        if view is None:
+            view = self._dispatch[signature] = self._build_view(signature)
+        self._last = (file_path, content, view)
+        return view
+    
+    def _build_view(self, signature: Tuple) -> Dict[str, Dict[str, Any]]:
+        file_type = signature[0]
+        globs_matched = dict(zip(self._glob_sets, signature[1:1 + len(self._glob_sets)]))
+        predicates = dict(zip(self._predicates, signature[1 + len(self._glob_sets):]))
+        
+        def applies(route: Route) -> bool:
+            globs, types = route
+            return (all(globs_matched[g] for g in globs)
+                    and all(file_type in t or any(predicates.get(p) for p in t) for t in types))
+        
+        view = {}
+        for name, inv in self.invariants.items():
+            if not applies(inv.get("route", UNROUTED)):
+                view[name] = {**inv, "enabled": False}
+                continue
+            narrowed = dict(inv)
+            prefilters = dict(inv.get("prefilters", {}))
+            for key, key_routes in inv.get("routes", {}).items():
+                keep = [i for i, route in enumerate(key_routes) if applies(route)]
+                if len(keep) == len(key_routes):
+                    continue
+                narrowed[key] = [inv[key][i] for i in keep]
+                if key in prefilters:
+                    prefilter = prefilters[key]
+                    prefilters[key] = _SetPrefilter(prefilter.regex_set, [prefilter.slots[i] for i in keep])
+            narrowed["prefilters"] = prefilters
+            view[name] = narrowed
+        return view
+
+
+def compile_rules(config: Dict[str, Any], fingerprint: str = "defaults") -> CompiledRules:
+    """Compile the regexes of a loaded config.
+    
+    The engine is ``validator.regex_backend`` (default "re"), overridden by
+    the PROACTIVE_REGEX_BACKEND environment variable.
+    
+    Args:
+        config: Configuration dictionary (as returned by load_config)
+        fingerprint: Identifier of the config source
+        
+    Returns:
+        CompiledRules for the check_invariant_* functions
+    """
+    invariants_config = config.get("invariants", {})
+    backend = RegexBackend(
+        os.environ.get(REGEX_BACKEND_ENV) or config.get("validator", {}).get("regex_backend", "re")
+    )
+    
+    def settings(key: str, default_severity: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        section = invariants_config.get(key, {})
+        return section, {
+            "enabled": section.get("enabled", True),
+            "severity": section.get("severity", default_severity),
+            "route": _route(section, key)
+        }
+    
+    def add_patterns(
+        inv: Dict[str, Any], key: str, owner: str, pattern_defs: List[Any], flags: int, *defaults: str,
+        parent_routes: Optional[List[Route]] = None
+    ) -> None:
+        inv[key] = []
+        routes = []
+        for i, pattern_def in enumerate(pattern_defs):
+            compiled = _compile_patterns(owner, [pattern_def], flags, *defaults, backend=backend)
+            inv[key].extend(compiled)
+            parent = parent_routes[i] if parent_routes else UNROUTED
+            routes.extend([_route(pattern_def, owner, parent)] * len(compiled))
+        inv.setdefault("routes", {})[key] = routes
+        prefilter = backend.prefilter(inv[key], flags)
+        if prefilter is not None:
+            inv.setdefault("prefilters", {})[key] = prefilter
+    
+    section, i1 = settings("I1_evidence_first", "ERROR")
+    i1["required_tags"] = section.get("required_tags", ["OBSERVED", "INFERRED", "SPECULATED"])
+    i1["tag_regex"] = backend.compile(r'\[(' + '|'.join(i1["required_tags"]) + r')\]', 0, "I1")
+    add_patterns(i1, "patterns", "I1", section.get("patterns", []), re.IGNORECASE, "I1 violation detected")
+    
+    section, i2 = settings("I2_no_phantom_work", "ERROR")
+    pattern_defs: Dict[str, List[Any]] = {"file_existence": [], "artifact_verification": []}
+    validator_routes: Dict[str, List[Route]] = {"file_existence": [], "artifact_verification": []}
+    for validator in section.get("validators", []):
+        val_type = validator.get("type", "")
+        if val_type in pattern_defs:
+            pattern_defs[val_type].extend(validator.get("patterns", []))
+            validator_routes[val_type].extend(
+                [_route(validator, "I2")] * len(validator.get("patterns", []))
+            )
+    for val_type, defs in pattern_defs.items():
+        add_patterns(i2, val_type, "I2", defs, re.IGNORECASE, parent_routes=validator_routes[val_type])
+    i2["evidence_regex"] = backend.compile(r'(?:evidence|proof|verified|tested|see|ref|artifact)', re.IGNORECASE, "I2")
+    
+    section, i3 = settings("I3_confidence_requires_verification", "WARNING")
+    i3["threshold"] = section.get("confidence_threshold", 0.8)
+    keywords = section.get("verification_keywords",
+        ["verified", "tested", "validated", "confirmed", "evidence", "proof", "artifact"])
+    i3["verification_regex"] = backend.compile(r'(?:' + '|'.join(keywords) + r')', re.IGNORECASE, "I3")
+    add_patterns(i3, "patterns", "I3", section.get("patterns", []), re.IGNORECASE,
+                 "", r"confidence[:\s]*([01]\.?\d*)")
+    
+    section, i4 = settings("I4_traceability_mandatory", "ERROR")
+    i4["required_fields"] = section.get("required_trace_fields",
+        ["REQ_id", "CTRL_id", "TEST_id", "EVID_id", "DECISION_id"])
+    i4["field_regexes"] = [
+        (field_name, backend.compile(rf'["\']?{field_name}["\']?\s*[:=]', re.IGNORECASE, "I4"))
+        for field_name in i4["required_fields"]
+    ]
+    i4["cross_file"] = bool(section.get("cross_file", False))
+    i4["value_regex"] = backend.compile(
+        r'["\']?\b(' + '|'.join(re.escape(f) for f in i4["required_fields"]) + r')\b["\']?\s*[:=]\s*["\']?([A-Za-z0-9][\w.:/-]*)',
+        re.IGNORECASE, "I4"
+    )
+    i4["trace_regex"] = backend.compile(r'(?:REQ|CTRL|TEST|EVID|DECISION|trace_chain|trace)', re.IGNORECASE, "I4")
+    add_patterns(i4, "patterns", "I4", section.get("patterns", []), re.IGNORECASE,
+                 "Decision statement without trace chain reference",
+                 r"\b(decided|decision|approved|rejected|selected)\b")
+    
+    section, i5 = settings("I5_safety_over_fluency", "WARNING")
+    add_patterns(i5, "patterns", "I5", section.get("patterns", []), re.IGNORECASE,
+                 "Hedging language inconsistent with confidence claim")
+    
+    section, i6 = settings("I6_fail_closed", "ERROR")
+    add_patterns(i6, "patterns", "I6", section.get("patterns", []), re.IGNORECASE | re.DOTALL,
+                 "Detected attempt to bypass failure")
+    
+    return CompiledRules(config, fingerprint, {"I1": i1, "I2": i2, "I3": i3, "I4": i4, "I5": i5, "I6": i6},
+                         backend.name, backend.fallbacks)
+
+
+def _default_cache_dir() -> Optional[str]:
+    if CONFIG_CACHE_ENV in os.environ:
+        return os.environ[CONFIG_CACHE_ENV] or None
+    return str(Path.home() / ".cache" / "proactive-validator")
+
+
+class ConfigManager:
+    """Keeps the compiled rule set of a config file current.
+    
+    The file is fingerprinted by its SHA-256; ``rules()`` re-stats it at most
+    every ``check_interval_s`` seconds and only re-hashes when mtime or size
+    changed, so an unchanged config costs one ``stat``. A changed hash builds
+    a new CompiledRules and swaps it in with a single assignment: readers see
+    either the old or the new rule set, never a partial one. A config that
+    fails to parse keeps the previous rules.
+    
+    Parsed configs are cached as JSON in ``cache_dir`` keyed by
+    fingerprint, so a cold start with an unchanged config skips importing
+    and parsing YAML; patterns are compiled from the cached config. Cache
+    files not owned by the current user, or writable by group or others,
+    are ignored, since the cache decides which rules the gate enforces.
+    
+    Args:
+        config_path: Path to validator_config.yaml
+        check_interval_s: Minimum seconds between staleness checks
+        cache_dir: Directory for cached configs (None disables the cache)
+    """
+    
+    def __init__(
+        self,
+        config_path: str = "validator_config.yaml",
+        check_interval_s: float = 1.0,
+        cache_dir: Optional[str] = "default"
+    ):
+        import threading
+        self.config_path = config_path
+        self.check_interval_s = check_interval_s
+        self.cache_dir = _default_cache_dir() if cache_dir == "default" else cache_dir
+        self.reloads = 0
+        self._rules: Optional[CompiledRules] = None
+        self._stat_key: Optional[Tuple[int, int]] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        return self.rules().config
+    
+    def rules(self) -> CompiledRules:
+        """Current rule set, reloaded first if the config file changed."""
+        rules = self._rules
+        if rules is not None and time.monotonic() - self._checked_at < self.check_interval_s:
+            return rules
+        with self._lock:
+            self._checked_at = time.monotonic()
+            try:
+                stat = os.stat(self.config_path)
+                stat_key: Optional[Tuple[int, int]] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                stat_key = None
+            if self._rules is None or stat_key != self._stat_key:
+                self._stat_key = stat_key
+                self._refresh(stat_key is not None)
+            return self._rules
+    
+    def _refresh(self, exists: bool) -> None:
+        if not exists:
+            if self._rules is None or self._rules.fingerprint != "defaults":
+                self._swap(compile_rules(_get_default_config()))
+            return
+        
+        import hashlib
+        with open(self.config_path, 'rb') as f:
+            data = f.read()
+        fingerprint = hashlib.sha256(data).hexdigest()
+        if self._rules is not None and self._rules.fingerprint == fingerprint:
+            return
+        
+        config = self._load_cached(fingerprint)
+        if config is None:
+            config = self._parse(data)
+            if config is None:
+                if self._rules is None:
+                    self._swap(compile_rules(_get_default_config()))
+                return
+            self._store_cached(fingerprint, config)
+        self._swap(compile_rules(config, fingerprint))
+    
+    def _parse(self, data: bytes) -> Optional[Dict[str, Any]]:
+        if not YAML_AVAILABLE:
+            return None
+        try:
+            import yaml
+            # The libyaml-backed loader is several times faster when available
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            return yaml.load(data.decode('utf-8'), Loader=loader)
+        except Exception as e:
+            print(f"Warning: Could not load config from {self.config_path}: {e}")
+            return None
+    
+    def _swap(self, rules: CompiledRules) -> None:
+        self._rules = rules
+        self.reloads += 1
+    
+    def _cache_path(self, fingerprint: str) -> Optional[Path]:
+        if not self.cache_dir:
+            return None
+        return Path(self.cache_dir) / f"config-{fingerprint[:32]}-v{CONFIG_CACHE_VERSION}.json"
+    
+    def _load_cached(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        path = self._cache_path(fingerprint)
+        if path is None:
+            return None
+        try:
+            with open(path, 'rb') as f:
+                if not _private_file(f.fileno()) or not _private_file(str(path.parent)):
+                    return None
+                cached = json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cached, dict) or cached.get("fingerprint") != fingerprint:
+            return None
+        config = cached.get("config")
+        return config if isinstance(config, dict) else None
+    
+    def _store_cached(self, fingerprint: str, config: Dict[str, Any]) -> None:
+        path = self._cache_path(fingerprint)
+        if path is None:
+            return
+        try:
+            data = json.dumps({"fingerprint": fingerprint, "config": config})
+            # Configs JSON cannot represent exactly (e.g. YAML dates) are not cached
+            if json.loads(data)["config"] != config:
+                return
+            path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            fd = os.open(str(tmp_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError):
+            # The cache only saves parse time; a read-only home must not fail the gate
+            pass
+
+
+def _private_file(target: Any) -> bool:
+    """True if a path or file descriptor is owned by this user and not group/world-writable."""
+    import stat
+    st = os.stat(target)
+    if hasattr(os, "geteuid") and st.st_uid != os.geteuid():
+        return False
+    return not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+# Global config manager (created on first access)
+_manager: Optional[ConfigManager] = None
+
+
+def get_rules(config_path: str = "validator_config.yaml") -> CompiledRules:
+    """Return the compiled rule set, reloading it if the config file changed.
+    
+    Args:
+        config_path: Path to configuration file (used on first access)
+        
+    Returns:
+        CompiledRules
+    """
+    global _manager
+    if _manager is None:
+        _manager = ConfigManager(config_path)
+    return _manager.rules()
+
+
+def load_config(config_path: str = "validator_config.yaml") -> Dict[str, Any]:
+    """Load validator configuration from YAML file.
+    
+    Args:
+        config_path: Path to configuration file
+        
+    Returns:
+        Configuration dictionary
+    """
+    return get_rules(config_path).config
+
+
+def reset_config() -> None:
+    """Reset config to force reload on next access."""
+    global _manager
+    _manager = None
+
+
+def _generate_violation_id() -> str:
+    """Provisional violation ID; assign_fingerprints replaces it with a stable one."""
+    return f"V-{os.urandom(2).hex().upper()}"
+
+
+# Evidence keys that anchor a fingerprint, most specific first; violations
+# without any of them are anchored on their message
+FINGERPRINT_ANCHORS = ("matched_text", "claimed_file", "missing_field", "metric")
+
+
+def _fingerprint_key(violation: Violation) -> Tuple[str, str, str]:
+    """(rule, file, normalized anchor text) identifying what was flagged."""
+    evidence = violation.evidence or {}
+    anchor = next((str(evidence[k]) for k in FINGERPRINT_ANCHORS if evidence.get(k) is not None),
+                  violation.message)
+    file_path = violation.location.get("file", "")
+    if file_path:
+        file_path = Path(os.path.normpath(file_path)).as_posix()
+    return (
+        violation.rule_id or violation.invariant,
+        file_path,
+        " ".join(anchor.lower().split())
+    )
+
+
+def assign_fingerprints(violations: List[Violation]) -> List[Violation]:
+    """Give each violation a content-anchored fingerprint and violation_id.
+    
+    The fingerprint hashes rule_id, file, the normalized matched text and the
+    occurrence index of that triple within the list. Line numbers are not
+    part of it, so edits elsewhere in a file keep existing fingerprints
+    stable. The violation_id is derived from the fingerprint.
+    
+    Args:
+        violations: Violations in report order
+        
+    Returns:
+        New list of violations with ``fingerprint`` and ``violation_id`` set
+    """
+    import hashlib
+    
+    occurrences: Dict[Tuple[str, str, str], int] = {}
+    stamped = []
+    for violation in violations:
+        key = _fingerprint_key(violation)
+        index = occurrences.get(key, 0)
+        occurrences[key] = index + 1
+        fingerprint = hashlib.sha256("\0".join((*key, str(index))).encode('utf-8')).hexdigest()[:32]
+        stamped.append(replace(violation, fingerprint=fingerprint, violation_id=f"V-{fingerprint[:12].upper()}"))
+    return stamped
+
+
+def _report_id(
+    git_context: Dict[str, Any],
+    fingerprints: List[str],
+    workspace_root: str = "",
+    config_fingerprint: str = ""
+) -> str:
+    """Report ID derived from the commit, workspace root, config fingerprint
+    and the reported fingerprints.
+    
+    The root and config keep two clean runs of the same commit apart when
+    they scan different directories or use different rules.
+    """
+    import hashlib
+    key = "\0".join((str(git_context.get("commit_sha", "")), workspace_root, config_fingerprint))
+    digest = hashlib.sha256(key.encode('utf-8'))
+    for fingerprint in sorted(fingerprints):
+        digest.update(fingerprint.encode('ascii'))
+    return f"VR-{digest.hexdigest()[:8]}"
+
+
+BASELINE_FORMAT = "proactive-violation-baseline"
+BASELINE_VERSION = 1
+
+
+def load_violation_baseline(path: str) -> set:
+    """Read the fingerprints stored by ``--write-baseline``.
+    
+    Raises:
+        ValueError: If the file is not a violation baseline
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get("format") != BASELINE_FORMAT or data.get("version") != BASELINE_VERSION:
+        raise ValueError(f"Not a violation baseline (version {BASELINE_VERSION}): {path}")
+    return set(data.get("fingerprints", []))
+
+
+def write_violation_baseline(report: Dict[str, Any], path: str) -> int:
+    """Store the fingerprints of a report's violations as the new baseline.
+    
+    Returns:
+        Number of fingerprints written
+    """
+    fingerprints = sorted({v["fingerprint"] for v in report["violations"] if v.get("fingerprint")})
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            "format": BASELINE_FORMAT,
+            "version": BASELINE_VERSION,
+            "report_id": report.get("report_id"),
+            "git_context": report.get("git_context", {}),
+            "fingerprints": fingerprints
+        }, f, indent=1)
+        f.write("\n")
+    return len(fingerprints)
+
+
+def _find_line_number(content: str, match_start: int) -> int:
+    """Find line number for a match position (1-indexed)."""
+    return content[:match_start].count('\n') + 1
+
+
+def _get_context(content: str, match_start: int, match_end: int, max_length: int = 200) -> str:
+    """Extract context around a match."""
+    # Get some context before and after
+    context_start = max(0, match_start - 50)
+    context_end = min(len(content), match_end + 50)
+    context = content[context_start:context_end]
+    
+    # Truncate if too long
+    if len(context) > max_length:
+        context = context[:max_length] + "..."
+    
+    return context.replace('\n', ' ').strip()
+
+
+def check_invariant_i1(content: str, file_path: str) -> List[Violation]:
+    """Check I1: Evidence-First Outputs.
+    
+    Every claim must carry an epistemic tag and supporting evidence.
+    """
+    violations = []
+    rules = get_rules()
+    i1 = rules.view(file_path, content)["I1"]
+    
+    if not i1["enabled"]:
+        return violations
+    
+    severity = i1["severity"]
+    required_tags = i1["required_tags"]
+    tag_regex = i1["tag_regex"]
+    
+    for regex, pattern, message in _candidates(i1, "patterns", content):
+        for match in regex.finditer(content):
+            line_num = _find_line_number(content, match.start())
+            
+            # Check if epistemic tag exists nearby (within 300 chars)
+            context_start = max(0, match.start() - 300)
+            context_end = min(len(content), match.end() + 300)
+            
+            if not tag_regex.search(content, context_start, context_end):
+                violations.append(Violation(
+                    violation_id=_generate_violation_id(),
+                    invariant="I1",
+                    severity=severity,
+                    location={
+                        "file": file_path,
+                        "line": line_num,
+                        "context": _get_context(content, match.start(), match.end(), rules.max_context)
+                    },
+                    message=f"I1 Violation: {message}",
+                    suggested_fix=f"Add epistemic tag: [{required_tags[0]}], [{required_tags[1]}], or [{required_tags[2]}]",
+                    evidence={
+                        "matched_pattern": pattern,
+                        "matched_text": match.group()[:100]
+                    },
+                    rule_id="I1_evidence_first"
+                ))
+    
+    return violations
+
+
+def check_invariant_i2(content: str, file_path: str, workspace: str) -> List[Violation]:
+    """Check I2: No Phantom Work.
+    
+    Cannot claim work is complete unless artifact exists.
+    """
+    return (_check_i2_file_existence(content, file_path, workspace)
+            + _check_i2_artifact_verification(content, file_path))
+
+
+def _check_i2_file_existence(
+    content: str,
+    file_path: str,
+    workspace: str,
+    exists: Optional[Callable[[str], bool]] = None
+) -> List[Violation]:
+    """I2 claimed-file checks; the only check whose result depends on the workspace.
+    
+    ``exists`` replaces the filesystem lookup, e.g. with a membership test
+    against a git tree; it receives the claimed path relative to the workspace.
+    """
+    violations = []
+    rules = get_rules()
+    i2 = rules.view(file_path, content)["I2"]
+    
+    if not i2["enabled"]:
+        return violations
+    
+    severity = i2["severity"]
+    
+    # Check for file creation claims
+    for regex, pattern, _ in _candidates(i2, "file_existence", content):
+        for match in regex.finditer(content):
+            # Extract the claimed filename (group 1)
+            if match.groups():
+                claimed_file = match.group(1)
+                line_num = _find_line_number(content, match.start())
+                
+                # Check if file exists
+                full_path = Path(workspace) / claimed_file
+                if not (full_path.exists() if exists is None else exists(claimed_file)):
+                    violations.append(Violation(
+                        violation_id=_generate_violation_id(),
+                        invariant="I2",
+                        severity=severity,
+                        location={
+                            "file": file_path,
+                            "line": line_num,
+                            "context": _get_context(content, match.start(), match.end(), rules.max_context)
+                        },
+                        message=f"I2 Violation: Claimed file '{claimed_file}' does not exist",
+                        suggested_fix=f"Create the file '{claimed_file}' or remove the completion claim",
+                        evidence={
+                            "claimed_file": claimed_file,
+                            "checked_path": str(full_path),
+                            "validation_type": "file_existence"
+                        },
+                        rule_id="I2_file_existence"
+                    ))
+    
+    return violations
+
+
+def _check_i2_artifact_verification(content: str, file_path: str) -> List[Violation]:
+    """I2 completion-claim checks, which depend on the content only."""
+    violations = []
+    rules = get_rules()
+    i2 = rules.view(file_path, content)["I2"]
+    
+    if not i2["enabled"]:
+        return violations
+    
+    severity = i2["severity"]
+    
+    # Check for completion claims without evidence reference
+    evidence_regex = i2["evidence_regex"]
+    for regex, pattern, _ in _candidates(i2, "artifact_verification", content):
+        for match in regex.finditer(content):
+            line_num = _find_line_number(content, match.start())
+            
+            # Check if evidence reference exists nearby
+            context_start = max(0, match.start() - 150)
+            context_end = min(len(content), match.end() + 150)
+            
+            if not evidence_regex.search(content, context_start, context_end):
+                violations.append(Violation(
+                    violation_id=_generate_violation_id(),
+                    invariant="I2",
+                    severity=severity,
+                    location={
+                        "file": file_path,
+                        "line": line_num,
+                        "context": _get_context(content, match.start(), match.end(), rules.max_context)
+                    },
+                    message="I2 Violation: Completion claim without evidence reference",
+                    suggested_fix="Add reference to verification artifact",
+                    evidence={
+                        "matched_pattern": pattern,
+                        "matched_text": match.group()[:100],
+                        "validation_type": "artifact_verification"
+                    },
+                    rule_id="I2_artifact_verification"
+                ))
+    
+    return violations
+
+
+def check_invariant_i3(content: str, file_path: str) -> List[Violation]:
+    """Check I3: Confidence Requires Verification.
+    
+    High confidence requires verification artifacts.
+    """
+    violations = []
+    rules = get_rules()
+    i3 = rules.view(file_path, content)["I3"]
+    
+    if not i3["enabled"]:
+        return violations
+    
+    severity = i3["severity"]
+    threshold = i3["threshold"]
+    verification_regex = i3["verification_regex"]
+    
+    for regex, pattern, _ in _candidates(i3, "patterns", content):
+        for match in regex.finditer(content):
+            # Try to extract confidence value
+            try:
+                if match.groups():
+                    confidence = float(match.group(1))
+                else:
+                    continue
+                    
+                if confidence >= threshold:
+                    line_num = _find_line_number(content, match.start())
+                    
+                    # Check for verification reference nearby
+                    context_start = max(0, match.start() - 300)
+                    context_end = min(len(content), match.end() + 300)
+                    
+                    if not verification_regex.search(content, context_start, context_end):
+                        violations.append(Violation(
+                            violation_id=_generate_violation_id(),
+                            invariant="I3",
+                            severity=severity,
+                            location={
+                                "file": file_path,
+                                "line": line_num,
+                                "context": _get_context(content, match.start(), match.end(), rules.max_context)
+                            },
+                            message=f"I3 Violation: High confidence ({confidence}) without verification reference",
+                            suggested_fix="Add reference to verification artifact or reduce confidence",
+                            evidence={
+                                "confidence_value": confidence,
+                                "threshold": threshold
+                            },
+                            rule_id="I3_confidence_verification"
+                        ))
+            except (TypeError, ValueError):
+                continue
+    
+    return violations
+
+
+def check_invariant_i4(content: str, file_path: str) -> List[Violation]:
+    """Check I4: Traceability Is Mandatory.
+    
+    Every decision must be traceable through REQ → CTRL → TEST → EVID → DECISION.
+    """
+    violations = []
+    rules = get_rules()
+    i4 = rules.view(file_path, content)["I4"]
+    
+    if not i4["enabled"]:
+        return violations
+    
+    severity = i4["severity"]
+    required_fields = i4["required_fields"]
+    
+    # Check if this looks like a trace document
+    if _is_trace_document(content):
+        # Check for required trace fields
+        for field_name, field_regex in i4["field_regexes"]:
+            if not field_regex.search(content):
+                violations.append(Violation(
+                    violation_id=_generate_violation_id(),
+                    invariant="I4",
+                    severity=severity,
+                    location={
+                        "file": file_path,
+                        "line": 1
+                    },
+                    message=f"I4 Violation: Missing required trace field '{field_name}'",
+                    suggested_fix=f"Add {field_name} to complete the trace chain",
+                    evidence={
+                        "missing_field": field_name,
+                        "required_fields": required_fields
+                    },
+                    rule_id="I4_missing_trace_field"
+                ))
+    
+    # Check for decision statements without trace reference
+    trace_regex = i4["trace_regex"]
+    for regex, pattern, message in _candidates(i4, "patterns", content):
+        for match in regex.finditer(content):
+            line_num = _find_line_number(content, match.start())
+            
+            # Check if trace reference exists nearby
+            context_start = max(0, match.start() - 400)
+            context_end = min(len(content), match.end() + 400)
+            
+            if not trace_regex.search(content, context_start, context_end):
+                violations.append(Violation(
+                    violation_id=_generate_violation_id(),
+                    invariant="I4",
+                    severity=severity,
+                    location={
+                        "file": file_path,
+                        "line": line_num,
+                        "context": _get_context(content, match.start(), match.end(), rules.max_context)
+                    },
+                    message=f"I4 Violation: {message}",
+                    suggested_fix="Add trace chain (REQ → CTRL → TEST → EVID → DECISION)",
+                    evidence={
+                        "matched_text": match.group()
+                    },
+                    rule_id="I4_decision_without_trace"
+                ))
+    
+    return violations
+
+
+def check_invariant_i5(content: str, file_path: str) -> List[Violation]:
+    """Check I5: Safety Over Fluency.
+    
+    Bounded statements preferred over fluent-but-wrong.
+    """
+    violations = []
+    rules = get_rules()
+    i5 = rules.view(file_path, content)["I5"]
+    
+    if not i5["enabled"]:
+        return violations
+    
+    severity = i5["severity"]
+    
+    for regex, pattern, message in _candidates(i5, "patterns", content):
+        for match in regex.finditer(content):
+            line_num = _find_line_number(content, match.start())
+            violations.append(Violation(
+                violation_id=_generate_violation_id(),
+                invariant="I5",
+                severity=severity,
+                location={
+                    "file": file_path,
+                    "line": line_num,
+                    "context": _get_context(content, match.start(), match.end(), rules.max_context)
+                },
+                message=f"I5 Violation: {message}",
+                suggested_fix="Choose either hedged or confident language, not both",
+                evidence={
+                    "matched_pattern": pattern,
+                    "matched_text": match.group()[:100]
+                },
+                rule_id="I5_fluency_conflict"
+            ))
+    
+    return violations
+
+
+def check_invariant_i6(content: str, file_path: str) -> List[Violation]:
+    """Check I6: Fail Closed.
+    
+    Stop and surface failures; do not work around.
+    """
+    violations = []
+    rules = get_rules()
+    i6 = rules.view(file_path, content)["I6"]
+    
+    if not i6["enabled"]:
+        return violations
+    
+    severity = i6["severity"]
+    
+    for regex, pattern, message in _candidates(i6, "patterns", content):
+        for match in regex.finditer(content):
+            line_num = _find_line_number(content, match.start())
+            violations.append(Violation(
+                violation_id=_generate_violation_id(),
+                invariant="I6",
+                severity=severity,
+                location={
+                    "file": file_path,
+                    "line": line_num,
+                    "context": _get_context(content, match.start(), match.end(), rules.max_context)
+                },
+                message=f"I6 Violation: {message}",
+                suggested_fix="Surface the error to user instead of suppressing",
+                evidence={
+                    "matched_pattern": pattern,
+                    "matched_text": match.group()[:200]
+                },
+                rule_id="I6_fail_closed"
+            ))
+    
+    return violations
+
+
+def check_invariants(content: str, file_path: str, workspace: str = ".") -> List[Violation]:
+    """Run all I1-I6 invariant checks on content.
+    
+    Args:
+        content: File content to validate
+        file_path: Path to file for location reporting
+        workspace: Workspace root for file existence checks
+        
+    Returns:
+        Combined list of all violations
+    """
+    all_violations = []
+    
+    all_violations.extend(check_invariant_i1(content, file_path))
+    all_violations.extend(check_invariant_i2(content, file_path, workspace))
+    all_violations.extend(check_invariant_i3(content, file_path))
+    all_violations.extend(check_invariant_i4(content, file_path))
+    all_violations.extend(check_invariant_i5(content, file_path))
+    all_violations.extend(check_invariant_i6(content, file_path))
+    
+    return assign_fingerprints(all_violations)
+
+
+def _decode_text(data: bytes) -> str:
+    """Decode like ``Path.read_text``: UTF-8 with universal newlines."""
+    content = data.decode('utf-8')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+def _relocate(violation: Violation, file_path: str) -> Violation:
+    """Copy of a cached violation reported against another path."""
+    if violation.location.get("file") == file_path:
+        return violation
+    return replace(violation, location={**violation.location, "file": file_path})
+
+
+class BlobCache:
+    """Scan results keyed by file content, shared across one validation run.
+    
+    Each unique blob (by 128-bit content hash; xxhash when installed, BLAKE2b
+    otherwise) is scanned once. I2 file-existence checks resolve claimed
+    paths against the workspace, so they are cached per (blob, workspace);
+    every other check depends on the content only. When the config routes
+    rules by path (``applies_to``), entries are also keyed by the path's
+    routing signature. Cached violations are copied to each further path
+    with its own location.file and fingerprint.
+    """
+    
+    def __init__(self):
+        try:
+            import xxhash
+            self._digest = xxhash.xxh3_128_hexdigest
+        except ImportError:
+            import hashlib
+            self._digest = lambda data: hashlib.blake2b(data, digest_size=16).hexdigest()
+        # (digest, routing signature) -> (I1 violations, content-only I2-I6 violations)
+        self._content: Dict[Tuple[str, Tuple], Tuple[List[Violation], List[Violation]]] = {}
+        self._existence: Dict[Tuple[str, Tuple, str], List[Violation]] = {}
+        self.files = 0
+    
+    @property
+    def unique_blobs(self) -> int:
+        return len(self._content)
+    
+    def scan(self, data: bytes, file_path: str, workspace: str) -> List[Violation]:
+        """Violations for ``data`` at ``file_path``, scanning only unseen content.
+        
+        Raises:
+            UnicodeDecodeError: If the content has to be scanned and is not UTF-8
+        """
+        key = (self._digest(data), get_rules().path_signature(file_path))
+        content = None
+        
+        scanned = self._content.get(key)
+        if scanned is None:
+            content = _decode_text(data)
+            scanned = (
+                check_invariant_i1(content, file_path),
+                _check_i2_artifact_verification(content, file_path)
+                + check_invariant_i3(content, file_path)
+                + check_invariant_i4(content, file_path)
+                + check_invariant_i5(content, file_path)
+                + check_invariant_i6(content, file_path)
+            )
+            self._content[key] = scanned
+        
+        existence = self._existence.get(key + (workspace,))
+        if existence is None:
+            if content is None:
+                content = _decode_text(data)
+            existence = _check_i2_file_existence(content, file_path, workspace)
+            self._existence[key + (workspace,)] = existence
+        
+        self.files += 1
+        # Same order as check_invariants: I1, I2 (existence, artifacts), I3-I6
+        return assign_fingerprints([_relocate(v, file_path) for v in scanned[0] + existence + scanned[1]])
+
+
+# Single-stream compression, by file suffix (zstandard is optional)
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".bz2": "bz2", ".xz": "lzma", ".zst": "zstandard"}
+ARCHIVE_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz", ".tar.zst", ".zip")
+
+
+def _container_kind(name: str) -> Optional[str]:
+    """"tar", "zip", a compression module name, or None for a plain file."""
+    lower = name.lower()
+    if lower.endswith(".zip"):
+        return "zip"
+    if lower.endswith(ARCHIVE_SUFFIXES):
+        return "tar"
+    return COMPRESSION_SUFFIXES.get(os.path.splitext(lower)[1])
+
+
+def _open_compressed(file_path: str, compression: str):
+    """Binary stream of the decompressed content of ``file_path``."""
+    if compression == "zstandard":
+        try:
+            import zstandard
+        except ImportError:
+            raise ValueError("zstandard is not installed; cannot read .zst files")
+        return zstandard.ZstdDecompressor().stream_reader(open(file_path, 'rb'), closefd=True)
+    import importlib
+    return importlib.import_module(compression).open(file_path, 'rb')
+
+
+def _read_bounded(stream, limit: int, name: str) -> bytes:
+    """Read a whole stream, refusing to hold more than ``limit`` bytes.
+    
+    Raises:
+        ValueError: If the stream is larger than ``limit``
+    """
+    data = stream.read(limit + 1)
+    if len(data) > limit:
+        raise ValueError(f"{name} exceeds {limit // (1024 * 1024)} MB decompressed; not scanned")
+    return data
+
+
+def _max_member_bytes() -> int:
+    """validation_targets.max_member_mb as bytes."""
+    return int(load_config().get("validation_targets", {}).get("max_member_mb", 64) * 1024 * 1024)
+
+
+def _scan_bytes(data: bytes, file_path: str, workspace: str, blob_cache: Optional[BlobCache]) -> List[Violation]:
+    """Violations in ``data`` reported against ``file_path``.
+    
+    Raises:
+        UnicodeDecodeError: If the content is not UTF-8
+    """
+    if blob_cache is not None:
+        return blob_cache.scan(data, file_path, workspace)
+    return check_invariants(_decode_text(data), file_path, workspace)
+
+
+def _read_file(file_path: str, limit: int) -> bytes:
+    """Content of ``file_path``, decompressed if it has a compression suffix.
+    
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the decompressed content exceeds ``limit`` bytes
+    """
+    compression = _container_kind(os.path.basename(file_path))
+    if compression in COMPRESSION_SUFFIXES.values():
+        with _open_compressed(file_path, compression) as stream:
+            return _read_bounded(stream, limit, file_path)
+    with open(file_path, 'rb') as f:
+        return f.read()
+
+
+def _read_error(file_path: str, message: str) -> ValidationResult:
+    return ValidationResult(file_path=file_path, violations=[
+        Violation(
+            violation_id=_generate_violation_id(),
+            invariant="SYSTEM",
+            severity="ERROR",
+            location={"file": file_path},
+            message=message
+        )
+    ])
+
+
+def validate_file(file_path: str, workspace: str = ".", blob_cache: Optional[BlobCache] = None) -> ValidationResult:
+    """Validate a single file against constitutional invariants.
+    
+    Files ending in .gz, .bz2, .xz or .zst are decompressed in memory, up to
+    ``validation_targets.max_member_mb``; line numbers refer to the
+    decompressed text.
+    
+    Args:
+        file_path: Path to file to validate
+        workspace: Workspace root for file existence checks
+        blob_cache: Optional per-run cache; identical content is scanned once
+        
+    Returns:
+        ValidationResult with any violations found
+    """
+    path = Path(file_path)
+    if not path.exists():
+        return _read_error(file_path, f"File not found: {file_path}")
+    
+    try:
+        violations = _scan_bytes(_read_file(file_path, _max_member_bytes()), file_path, workspace, blob_cache)
+    except Exception as e:
+        return _read_error(file_path, f"Error reading file: {e}")
+    
+    return ValidationResult(file_path=file_path, violations=violations)
+
+
+# Compiled ** globs, keyed by pattern
+_GLOB_CACHE: Dict[str, Any] = {}
+
+
+def _glob_regex(pattern: str):
+    """Compile a ``**`` glob: ``**/`` spans zero or more directories, ``*`` and
+    ``?`` stay within one path segment."""
+    regex = _GLOB_CACHE.get(pattern)
+    if regex is None:
+        parts = re.split(r'(\*\*/|\*\*|\*|\?)', pattern)
+        translated = {"**/": "(?:.*/)?", "**": ".*", "*": "[^/]*", "?": "[^/]"}
+        regex = re.compile("".join(translated.get(part, re.escape(part)) for part in parts))
+        _GLOB_CACHE[pattern] = regex
+    return regex
+
+
+def _match_patterns(path: str, patterns: List[str]) -> bool:
+    """Check if path matches any of the glob patterns."""
+    import fnmatch
+    path = path.replace(os.sep, "/")
+    for pattern in patterns:
+        # Handle ** patterns
+        if "**" in pattern:
+            if _glob_regex(pattern).fullmatch(path):
+                return True
+        elif fnmatch.fnmatch(path, pattern):
+            return True
+        elif fnmatch.fnmatch(os.path.basename(path), pattern):
+            return True
+    return False
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """Parse ``i/N`` (1-based shard index, shard count).
+    
+    Raises:
+        ValueError: If the spec is malformed or out of range
+    """
+    try:
+        index, count = (int(part) for part in spec.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard '{spec}': expected i/N, e.g. 1/4")
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Invalid shard '{spec}': index must be between 1 and {max(count, 1)}")
+    return index, count
+
+
+def _in_shard(rel_path: str, shard: Tuple[int, int]) -> bool:
+    """Deterministic assignment of a workspace-relative path to a shard."""
+    import hashlib
+    index, count = shard
+    digest = hashlib.blake2b(rel_path.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % count == index - 1
+
+
+def validate_directory(
+    directory: str,
+    include_patterns: Optional[List[str]] = None,
+    exclude_patterns: Optional[List[str]] = None,
+    dedup: bool = True,
+    shard: Optional[Tuple[int, int]] = None,
+    deadline: Optional[float] = None,
+    stats: Optional[Dict[str, Any]] = None
+) -> List[ValidationResult]:
+    """Validate all matching files in a directory.
+    
+    Files are scanned largest first while a thread pool reads ahead
+    (``validation_targets.read_ahead``: ``threads``, 0 to read inline, and
+    a ``memory_mb`` budget for content read but not yet scanned). Results
+    are returned in directory walk order regardless.
+    
+    Args:
+        directory: Directory to scan
+        include_patterns: Glob patterns for files to include
+        exclude_patterns: Glob patterns for files to exclude
+        dedup: Scan byte-identical files once and fan the results out
+        shard: Optional (index, count); only files whose relative path
+            hashes to this shard are validated
+        deadline: Optional ``time.monotonic()`` value; once it passes, the
+            scan stops before the next file and a SYSTEM ERROR result
+            records how many files were validated
+        stats: Optional dictionary filled with read-ahead and timing
+            figures (``io_wait_s``: scanner blocked on reads,
+            ``scan_cpu_s``: scanner CPU time)
+        
+    Returns:
+        List of ValidationResults for each file
+    """
+    try:
+        from .archives import validate_archive
+    except ImportError:
+        from archives import validate_archive
+    
+    config = load_config()
+    targets = config.get("validation_targets", {})
+    
+    if include_patterns is None:
+        include_patterns = targets.get("include", ["**/*.json", "**/*.yaml", "**/*.yml"])
+    if exclude_patterns is None:
+        exclude_patterns = targets.get("exclude", ["node_modules/**", ".git/**"])
+    
+    results = []
+    root = Path(directory)
+    
+    if not root.exists():
+        return [ValidationResult(file_path=directory, violations=[
+            Violation(
+                violation_id=_generate_violation_id(),
+                invariant="SYSTEM",
+                severity="ERROR",
+                location={"file": directory},
+                message=f"Directory not found: {directory}"
+            )
+        ])]
+    
+    # If directory is actually a file, validate just that file
+    if root.is_file():
+        if _container_kind(root.name) in ("tar", "zip"):
+            return validate_archive(str(root), str(root.parent), blob_cache=BlobCache() if dedup else None)
+        return [validate_file(str(root), str(root.parent))]
+    
+    scan_archives = targets.get("archives", True)
+    read_ahead = targets.get("read_ahead", {})
+    threads = int(read_ahead.get("threads", 4))
+    budget_bytes = int(read_ahead.get("memory_mb", 64) * 1024 * 1024)
+    limit = _max_member_bytes()
+    
+    # (path, workspace-relative path, is archive, size on disk) in walk order
+    candidates: List[Tuple[str, str, bool, int]] = []
+    for path in root.rglob("*"):
+        if path.is_file():
+            rel_path = str(path.relative_to(root))
+            
+            # Check exclusions first
+            if _match_patterns(rel_path, exclude_patterns):
+                continue
+            
+            if shard is not None and not _in_shard(path.relative_to(root).as_posix(), shard):
+                continue
+            
+            # Archives are matched member by member; compressed files by
+            # their name without the compression suffix
+            kind = _container_kind(path.name)
+            archive = kind in ("tar", "zip")
+            if archive and not scan_archives:
+                continue
+            match_path = os.path.splitext(rel_path)[0] if kind in COMPRESSION_SUFFIXES.values() else rel_path
+            
+            # Check inclusions
+            if archive or _match_patterns(match_path, include_patterns):
+                candidates.append((str(path), rel_path, archive, path.stat().st_size))
+    
+    # Largest first, so the slowest files do not end up in the tail
+    order = sorted(range(len(candidates)), key=lambda i: -candidates[i][3])
+    reader = None
+    if threads > 0:
+        reads = [(candidates[i][0], candidates[i][3]) for i in order if not candidates[i][2]]
+        if reads:
+            try:
+                from .readahead import _ReadAhead
+            except ImportError:
+                from readahead import _ReadAhead
+            reader = _ReadAhead(reads, threads, budget_bytes, limit)
+    
+    blob_cache = BlobCache() if dedup else None
+    i4 = get_rules().invariants["I4"]
+    # Cross-file chains need every file, so shard runs keep the per-file check
+    index = None
+    if i4["enabled"] and i4["cross_file"] and shard is None:
+        try:
+            from .trace_chains import TraceIndex, apply_trace_index
+        except ImportError:
+            from trace_chains import TraceIndex, apply_trace_index
+        index = TraceIndex(i4["required_fields"], i4["value_regex"])
+    slots: List[Optional[List[ValidationResult]]] = [None] * len(candidates)
+    io_wait = scan_cpu = 0.0
+    files_read = bytes_read = validated = 0
+    scan_start = time.perf_counter()
+    timed_out = False
+    try:
+        for i in order:
+            file_path, rel_path, archive, size = candidates[i]
+            if deadline is not None and time.monotonic() > deadline:
+                timed_out = True
+                break
+            validated += 1
+            if archive:
+                cpu = time.thread_time()
+                slots[i] = validate_archive(file_path, str(root), include_patterns,
+                                            exclude_patterns, blob_cache, rel_path, index)
+                scan_cpu += time.thread_time() - cpu
+                continue
+            
+            wait = time.perf_counter()
+            try:
+                data = reader.next().result() if reader else _read_file(file_path, limit)
+            except Exception as e:
+                slots[i] = [_read_error(file_path, f"Error reading file: {e}")]
+                continue
+            finally:
+                io_wait += time.perf_counter() - wait
+                if reader:
+                    reader.release(size)
+            files_read += 1
+            bytes_read += len(data)
+            
+            cpu = time.thread_time()
+            try:
+                slots[i] = [ValidationResult(file_path=file_path,
+                                             violations=_scan_bytes(data, file_path, str(root), blob_cache))]
+            except Exception as e:
+                slots[i] = [_read_error(file_path, f"Error reading file: {e}")]
+            else:
+                if index is not None:
+                    index.add(_decode_text(data), file_path)
+            scan_cpu += time.thread_time() - cpu
+            del data
+    finally:
+        if reader:
+            reader.close()
+    
+    results = [result for slot in slots if slot for result in slot]
+    if index is not None and not timed_out:
+        apply_trace_index(results, index)
+    if timed_out:
+        results.append(ValidationResult(file_path=directory, violations=[
+            Violation(
+                violation_id=_generate_violation_id(),
+                invariant="SYSTEM",
+                severity="ERROR",
+                location={"file": directory},
+                message=f"Time budget exhausted after {validated} files; scan incomplete",
+                rule_id="SYSTEM.time_budget"
+            )
+        ]))
+    
+    if stats is not None:
+        stats.update({
+            "threads": threads,
+            "memory_budget_mb": read_ahead.get("memory_mb", 64),
+            "files_read": files_read,
+            "bytes_read": bytes_read,
+            "peak_buffered_bytes": reader.peak_buffered if reader else 0,
+            "read_s": round(reader.read_s if reader else io_wait, 6),
+            "io_wait_s": round(io_wait, 6),
+            "scan_cpu_s": round(scan_cpu, 6),
+            "wall_s": round(time.perf_counter() - scan_start, 6)
+        })
+    
+    return results
+
+
+def _count_violations(violations) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """Count violation dicts by invariant and by severity."""
+    by_invariant: Dict[str, int] = {}
+    by_severity: Dict[str, int] = {"ERROR": 0, "WARNING": 0, "INFO": 0}
+    for v in violations:
+        by_invariant[v["invariant"]] = by_invariant.get(v["invariant"], 0) + 1
+        by_severity[v["severity"]] = by_severity.get(v["severity"], 0) + 1
+    return by_invariant, by_severity
+
+
+def _gate_decision(
+    errors: int,
+    warnings: int,
+    gate_config: Dict[str, Any],
+    partial: bool = False
+) -> Tuple[str, Optional[str]]:
+    """Apply the gate rules to violation totals.
+    
+    Args:
+        errors: ERROR-level violation count
+        warnings: WARNING-level violation count
+        gate_config: The config's ``gate`` section
+        partial: Totals cover one shard only; the warning threshold applies
+            to merged totals, so only fail_on_error/fail_on_warning are final
+        
+    Returns:
+        Tuple of (gate_result, gate_reason)
+    """
+    if gate_config.get("fail_on_error", True) and errors > 0:
+        return "FAIL", f"{errors} ERROR-level violations found"
+    if gate_config.get("fail_on_warning", False) and warnings > 0:
+        return "FAIL", f"{warnings} WARNING-level violations found"
+    if not partial and warnings > gate_config.get("warning_threshold", 5):
+        return "FAIL", f"Warning count ({warnings}) exceeds threshold ({gate_config.get('warning_threshold', 5)})"
+    return "PASS", None
+
+
+def generate_report(
+    results: List[ValidationResult],
+    git_context: Optional[Dict[str, str]] = None,
+    config_path: Optional[str] = None,
+    extra_violations: Optional[List[Violation]] = None,
+    shard: Optional[Tuple[int, int]] = None,
+    known_fingerprints: Optional[set] = None,
+    workspace: Optional[str] = None
+) -> Dict[str, Any]:
+    """Generate a violation report matching violation_schema.json.
+    
+    Args:
+        results: List of validation results
+        git_context: Optional git metadata (commit, branch, PR)
+        config_path: Optional path to config file used
+        extra_violations: Violations not tied to a scanned file (e.g. PERF);
+            they count towards the gate but not towards files scanned
+        shard: (index, count) when the results cover one shard; the report
+            is then partial (see merge_reports)
+        known_fingerprints: Fingerprints of accepted violations (see
+            load_violation_baseline); matching violations are left out of
+            the report and the gate, so only new ones can fail it
+        workspace: Directory (or file) the results were validated from;
+            recorded as ``config_used.workspace_root`` and part of report_id
+        
+    Returns:
+        Report dictionary matching schema
+    """
+    from datetime import datetime, timezone
+    
+    all_violations = []
+    files_with_violations = 0
+    suppressed = 0
+    
+    for result in results:
+        violations = assign_fingerprints(result.violations)
+        if known_fingerprints is not None:
+            new = [v for v in violations if v.fingerprint not in known_fingerprints]
+            suppressed += len(violations) - len(new)
+            violations = new
+        all_violations.extend(violations)
+        if violations:
+            files_with_violations += 1
+    all_violations.extend(assign_fingerprints(extra_violations or []))
+    
+    by_invariant, by_severity = _count_violations(v.to_dict() for v in all_violations)
+    errors = by_severity["ERROR"]
+    warnings = by_severity["WARNING"]
+    
+    config = load_config()
+    gate_config = config.get("gate", {})
+    
+    # Determine gate result
+    gate_result, gate_reason = _gate_decision(errors, warnings, gate_config, partial=shard is not None)
+    
+    # Build enabled invariants list
+    enabled_invariants = []
+    invariants_config = config.get("invariants", {})
+    for key, val in invariants_config.items():
+        if val.get("enabled", True):
+            # Extract invariant ID (e.g., "I1" from "I1_evidence_first")
+            inv_id = key.split("_")[0].upper()
+            if inv_id not in enabled_invariants:
+                enabled_invariants.append(inv_id)
+    
+    workspace_root = os.path.abspath(workspace) if workspace is not None else ""
+    rules = get_rules()
+    report = {
+        "report_id": _report_id(git_context or {}, [v.fingerprint for v in all_violations],
+                                workspace_root, rules.fingerprint),
+        "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "validator_version": config.get("validator", {}).get("version", "1.0.0"),
+        "git_context": git_context or {},
+        "config_used": {
+            "config_path": config_path or "validator_config.yaml",
+            "config_fingerprint": rules.fingerprint,
+            "workspace_root": workspace_root,
+            "regex_backend": rules.backend,
+            "enabled_invariants": sorted(enabled_invariants),
+            "fail_on_warning": gate_config.get("fail_on_warning", False),
+            "warning_threshold": gate_config.get("warning_threshold", 5)
+        },
+        "violations": [v.to_dict() for v in all_violations],
+        "summary": {
+            "total_files_scanned": len(results),
+            "files_with_violations": files_with_violations,
+            "total_violations": len(all_violations),
+            "errors": errors,
+            "warnings": warnings,
+            "by_invariant": by_invariant,
+            "by_severity": by_severity,
+            "gate_result": gate_result,
+            "gate_reason": gate_reason
+        }
+    }
+    if shard is not None:
+        report["shard"] = {"index": shard[0], "count": shard[1]}
+    if known_fingerprints is not None:
+        report["baseline"] = {"known": len(known_fingerprints), "suppressed": suppressed}
+        if shard is None:
+            # Fingerprints are unique per run, so every unmatched one was fixed
+            report["baseline"]["fixed"] = len(known_fingerprints) - suppressed
+    
+    return report
+
+
+def merge_reports(reports: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine partial shard reports into one report.
+    
+    Totals are summed and ``gate_result`` is recomputed over the merged
+    counts, including ``gate.warning_threshold``. A shard without a partial
+    report fails the gate with a SYSTEM violation rather than passing on
+    incomplete coverage.
+    
+    Args:
+        reports: JSON reports written by ``validator.py --shard i/N``
+        
+    Returns:
+        Report dictionary matching schema
+        
+    Raises:
+        ValueError: If reports disagree on the shard count or repeat a shard
+    """
+    from datetime import datetime, timezone
+    
+    if not reports:
+        raise ValueError("No reports to merge")
+    
+    counts = {r.get("shard", {}).get("count") for r in reports}
+    if len(counts) > 1:
+        raise ValueError(f"Reports come from different shard counts: {sorted(counts, key=str)}")
+    count = counts.pop()
+    
+    seen: Dict[int, Dict[str, Any]] = {}
+    for report in reports:
+        index = report.get("shard", {}).get("index")
+        if index is not None:
+            if index in seen:
+                raise ValueError(f"Shard {index}/{count} given more than once")
+            seen[index] = report
+    ordered = [seen[i] for i in sorted(seen)] if count is not None else list(reports)
+    
+    violations = [v for report in ordered for v in report.get("violations", [])]
+    missing = [i for i in range(1, count + 1) if i not in seen] if count is not None else []
+    violations.extend(v.to_dict() for v in assign_fingerprints([
+        Violation(
+            violation_id=_generate_violation_id(),
+            invariant="SYSTEM",
+            severity="ERROR",
+            location={"file": f"shard {index}/{count}"},
+            message=f"Missing partial report for shard {index}/{count}"
+        )
+        for index in missing
+    ]))
+    
+    by_invariant, by_severity = _count_violations(violations)
+    errors = by_severity["ERROR"]
+    warnings = by_severity["WARNING"]
+    gate_config = load_config().get("gate", {})
+    gate_result, gate_reason = _gate_decision(errors, warnings, gate_config)
+    
+    first = ordered[0]
+    summaries = [r.get("summary", {}) for r in ordered]
+    merged = {
+        "report_id": _report_id(first.get("git_context", {}), [v.get("fingerprint", "") for v in violations],
+                                first.get("config_used", {}).get("workspace_root", ""),
+                                first.get("config_used", {}).get("config_fingerprint", "")),
+        "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "validator_version": first.get("validator_version", "1.0.0"),
+        "git_context": first.get("git_context", {}),
+        "config_used": {
+            **first.get("config_used", {}),
+            "fail_on_warning": gate_config.get("fail_on_warning", False),
+            "warning_threshold": gate_config.get("warning_threshold", 5)
+        },
+        "violations": violations,
+        "summary": {
+            "total_files_scanned": sum(s.get("total_files_scanned", 0) for s in summaries),
+            "files_with_violations": sum(s.get("files_with_violations", 0) for s in summaries),
+            "total_violations": len(violations),
+            "errors": errors,
+            "warnings": warnings,
+            "by_invariant": by_invariant,
+            "by_severity": by_severity,
+            "gate_result": gate_result,
+            "gate_reason": gate_reason
+        }
+    }
+    times = [s["execution_time_ms"] for s in summaries if "execution_time_ms" in s]
+    if times:
+        # Shards run in parallel; the slowest one bounds the wall time
+        merged["summary"]["execution_time_ms"] = max(times)
+    if count is not None:
+        merged["shards"] = {"count": count, "merged": sorted(seen), "missing": missing}
+    performance = next((r["performance"] for r in ordered if r.get("performance")), None)
+    if performance is not None:
+        merged["performance"] = performance
+    baselines = [r["baseline"] for r in ordered if "baseline" in r]
+    if baselines:
+        known = baselines[0]["known"]
+        suppressed = sum(b["suppressed"] for b in baselines)
+        merged["baseline"] = {"known": known, "suppressed": suppressed, "fixed": known - suppressed}
+    return merged
+
+
+def generate_sarif(report: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert report to SARIF format for GitHub Security.
+    
+    Args:
+        report: Violation report dictionary
+        
+    Returns:
+        SARIF-formatted report
+    """
+    # Build rules from invariants
+    rules = [
+        {"id": "I1", "name": "Evidence-First Outputs", 
+         "shortDescription": {"text": "Every claim must carry an epistemic tag and supporting evidence"}},
+        {"id": "I2", "name": "No Phantom Work",
+         "shortDescription": {"text": "Cannot claim work is complete unless artifact exists"}},
+        {"id": "I3", "name": "Confidence Requires Verification",
+         "shortDescription": {"text": "High confidence requires verification artifacts"}},
+        {"id": "I4", "name": "Traceability Is Mandatory",
+         "shortDescription": {"text": "Every decision must be traceable through REQ → CTRL → TEST → EVID → DECISION"}},
+        {"id": "I5", "name": "Safety Over Fluency",
+         "shortDescription": {"text": "Bounded statements preferred over fluent-but-wrong"}},
+        {"id": "I6", "name": "Fail Closed",
+         "shortDescription": {"text": "Stop and surface failures; do not work around"}},
+        {"id": "PERF", "name": "Performance Regression",
+         "shortDescription": {"text": "Benchmark throughput dropped below the stored baseline"}},
+        {"id": "SYSTEM", "name": "System Error",
+         "shortDescription": {"text": "Validator system error"}}
+    ]
+    
+    sarif = {
+        "$schema": "https://raw.githubusercontent.com/oasis-tcs/sarif-spec/master/Schemata/sarif-schema-2.1.0.json",
+        "version": "2.1.0",
+        "runs": [{
+            "tool": {
+                "driver": {
+                    "name": "PROACTIVE Constitutional Validator",
+                    "version": report.get("validator_version", "1.0.0"),
+                    "informationUri": "https://github.com/proactive-toolkit",
+                    "rules": rules
+                }
+            },
+            "results": [
+                {
+                    "ruleId": v["invariant"],
+                    "level": "error" if v["severity"] == "ERROR" else ("warning" if v["severity"] == "WARNING" else "note"),
+                    "message": {"text": v["message"]},
+                    "locations": [{
+                        "physicalLocation": {
+                            "artifactLocation": {"uri": v["location"]["file"]},
+                            "region": {"startLine": v["location"].get("line", 1)}
+                        }
+                    }],
+                    **({"partialFingerprints": {"proactiveFingerprint/v1": v["fingerprint"]}}
+                       if v.get("fingerprint") else {})
+                }
+                for v in report["violations"]
+            ]
+        }]
+    }
+    return sarif
+
+
+def print_text_report(report: Dict[str, Any]) -> None:
+    """Print human-readable report to stdout."""
+    summary = report["summary"]
+    
+    print("\n" + "=" * 60)
+    print("PROACTIVE Constitutional Validator Report")
+    print("=" * 60)
+    print(f"\nReport ID: {report['report_id']}")
+    print(f"Timestamp: {report['timestamp']}")
+    print(f"\nGate Result: {summary['gate_result']}")
+    if summary.get('gate_reason'):
+        print(f"Gate Reason: {summary['gate_reason']}")
+    print(f"\nFiles Scanned: {summary['total_files_scanned']}")
+    print(f"Files with Violations: {summary.get('files_with_violations', 'N/A')}")
+    print(f"Total Violations: {summary['total_violations']}")
+    print(f"  Errors: {summary['errors']}")
+    print(f"  Warnings: {summary['warnings']}")
+    
+    if summary.get("by_invariant"):
+        print("\nBy Invariant:")
+        for inv, count in sorted(summary["by_invariant"].items()):
+            print(f"  {inv}: {count}")
+    
+    if report.get("baseline"):
+        base = report["baseline"]
+        print(f"\nBaseline: {base['known']} known, {base['suppressed']} still present (not counted)"
+              + (f", {base['fixed']} fixed" if "fixed" in base else ""))
+    
+    if report.get("io"):
+        io = report["io"]
+        print(f"\nI/O: {io['bytes_read'] / 1e6:.1f} MB in {io['files_read']} files, "
+              f"{io['threads']} read-ahead threads; scanner waited {io['io_wait_s']:.2f}s on reads, "
+              f"{io['scan_cpu_s']:.2f}s CPU")
+    
+    if report.get("performance"):
+        perf = report["performance"]
+        print(f"\nPerformance vs baseline (max regression {perf['max_regression_pct']}%):")
+        for m in perf["metrics"]:
+            if m["status"] == "missing":
+                print(f"  {m['metric']:<40} missing")
+                continue
+            print(f"  {m['metric']:<40} {m['change_pct']:>+7.1f}% "
+                  f"(threshold -{m['threshold_pct']:.1f}%, n={m['samples']}) {m['status']}")
+    
+    if report["violations"]:
+        print("\n" + "-" * 60)
+        print("Violations:")
+        print("-" * 60)
+        for v in report["violations"][:20]:  # Show first 20
+            print(f"\n[{v['severity']}] {v['invariant']}: {v['message']}")
+            loc = v["location"]
+            line_info = f":{loc.get('line', '?')}" if 'line' in loc else ""
+            print(f"  File: {loc['file']}{line_info}")
+            if v.get("suggested_fix"):
+                print(f"  Fix: {v['suggested_fix']}")
+        
+        if len(report["violations"]) > 20:
+            print(f"\n... and {len(report['violations']) - 20} more violations")
+    
+    print("\n" + "=" * 60)
+
+
+def get_git_context(cwd: Optional[str] = None) -> Dict[str, Any]:
+    """Commit, branch and origin URL of the repository at ``cwd``.
+    
+    One ``git rev-parse`` call resolves the commit and the branch, one
+    ``git config`` call reads the origin URL. Keys that git cannot provide
+    (no repository, unborn branch, no origin) are left out; a detached HEAD
+    has an empty branch.
+    """
+    import subprocess
+    git_context: Dict[str, Any] = {}
+    try:
+        commit_sha, branch = subprocess.check_output(
+            ["git", "rev-parse", "HEAD", "--abbrev-ref", "HEAD"], cwd=cwd, stderr=subprocess.DEVNULL
+        ).decode().split()
+        git_context["commit_sha"] = commit_sha
+        git_context["branch"] = "" if branch == "HEAD" else branch
+        git_context["repository"] = subprocess.check_output(
+            ["git", "config", "--get", "remote.origin.url"], cwd=cwd, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        pass
+    return git_context
+
+
+def main(
+    directory: str = ".",
+    output_format: str = "json",
+    config_path: str = "validator_config.yaml",
+    perf_results: Optional[str] = None,
+    perf_baseline: Optional[str] = None,
+    perf_max_regression: Optional[float] = None,
+    shard: Optional[Tuple[int, int]] = None,
+    violation_baseline: Optional[str] = None,
+    write_baseline: Optional[str] = None,
+    store_path: Optional[str] = None,
+    metrics_path: Optional[str] = None
+) -> int:
+    """Main entry point for CLI usage.
+    
+    Args:
+        directory: Directory to validate
+        output_format: Output format (json, sarif, text)
+        config_path: Path to validator config
+        perf_results: Benchmark results to gate on (benchmarks/suite.py --out)
+        perf_baseline: Baseline to compare ``perf_results`` against (default:
+            gate.performance.baseline, relative to the config file)
+        perf_max_regression: Overrides gate.performance.max_regression_pct
+        shard: Validate only shard (index, count); the partial report is
+            always printed as JSON for ``merge``
+        violation_baseline: Fingerprint baseline; only violations not in it
+            are reported and gated on
+        write_baseline: Store the fingerprints of all current violations here
+        store_path: SQLite violation store (see store.py) to append this
+            run to; shard runs are not stored, their merge is
+        metrics_path: Write OpenMetrics gauges for this run here (see
+            metrics.py), e.g. for node_exporter's textfile collector
+        
+    Returns:
+        Exit code (0 = pass, 1 = violations found)
+    """
+    start_time = time.time()
+    
+    # Reset and load config
+    reset_config()
+    load_config(config_path)
+    
+    # Get git context if available
+    git_context = get_git_context()
+    
+    # Validate
+    io_stats: Dict[str, Any] = {}
+    results = validate_directory(directory, shard=shard, stats=io_stats)
+    
+    extra_violations: List[Violation] = []
+    perf_section = None
+    if perf_results:
+        try:
+            from .perf import check_performance, _performance_config
+        except ImportError:
+            from perf import check_performance, _performance_config
+        perf_config = _performance_config()
+        if perf_config.get("enabled", True):
+            baseline = perf_baseline
+            if not baseline:
+                # Relative to the config file, like the baseline shipped next to it
+                baseline = os.path.join(os.path.dirname(config_path),
+                                        perf_config.get("baseline", "../benchmarks/baseline.json"))
+            extra_violations, perf_section = check_performance(perf_results, baseline, perf_max_regression)
+    
+    if write_baseline:
+        write_violation_baseline(generate_report(results, git_context, config_path, workspace=directory),
+                                 write_baseline)
+    
+    known_fingerprints = None
+    if violation_baseline:
+        try:
+            known_fingerprints = load_violation_baseline(violation_baseline)
+        except (OSError, ValueError) as e:
+            extra_violations.append(Violation(
+                violation_id=_generate_violation_id(),
+                invariant="SYSTEM",
+                severity="ERROR",
+                location={"file": violation_baseline},
+                message=f"Error reading violation baseline: {e}"
+            ))
+    
+    report = generate_report(results, git_context, config_path, extra_violations, shard, known_fingerprints,
+                             directory)
+    if report.get("baseline") is not None:
+        report["baseline"]["path"] = violation_baseline
+    if perf_section is not None:
+        report["performance"] = perf_section
+    if io_stats:
+        report["io"] = io_stats
+    
+    # Add execution time
+    report["summary"]["execution_time_ms"] = int((time.time() - start_time) * 1000)
+    
+    if store_path and shard is None:
+        _store_report(store_path, report)
+    if metrics_path:
+        _write_metrics(metrics_path, report)
+    
+    # Output
+    if shard is not None:
+        print(json.dumps(report, indent=2))
+    elif output_format == "sarif":
+        sarif = generate_sarif(report)
+        print(json.dumps(sarif, indent=2))
+    elif output_format == "text":
+        print_text_report(report)
+    else:
+        print(json.dumps(report, indent=2))
+    
+    # Return exit code based on gate result
+    return 0 if report["summary"]["gate_result"] == "PASS" else 1
+
+
+def _store_report(store_path: str, report: Dict[str, Any]) -> None:
+    """Append a report to the violation store; failures only warn."""
+    import sqlite3
+    try:
+        from . import store
+    except ImportError:
+        import store
+    try:
+        store.record_run(store_path, report)
+    except (sqlite3.Error, OSError, ValueError) as e:
+        print(f"Warning: could not record run in {store_path}: {e}", file=sys.stderr)
+
+
+def _write_metrics(metrics_path: str, report: Dict[str, Any]) -> None:
+    """Write a report's OpenMetrics textfile; failures only warn."""
+    try:
+        from . import metrics
+    except ImportError:
+        import metrics
+    try:
+        metrics.gate_metrics(report).write_textfile(metrics_path)
+    except OSError as e:
+        print(f"Warning: could not write metrics to {metrics_path}: {e}", file=sys.stderr)
+
+
+def merge_main(
+    report_paths: List[str],
+    output_format: str = "text",
+    config_path: str = "validator_config.yaml",
+    store_path: Optional[str] = None,
+    metrics_path: Optional[str] = None
+) -> int:
+    """CLI entry point for ``validator.py merge``.
+    
+    Returns:
+        Exit code (0 = pass, 1 = violations found, 2 = unreadable or
+        inconsistent partial reports)
+    """
+    reset_config()
+    load_config(config_path)
+    
+    try:
+        reports = []
+        for path in report_paths:
+            with open(path, 'r', encoding='utf-8') as f:
+                reports.append(json.load(f))
+        report = merge_reports(reports)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    
+    if store_path:
+        _store_report(store_path, report)
+    if metrics_path:
+        _write_metrics(metrics_path, report)
+    
+    if output_format == "sarif":
+        print(json.dumps(generate_sarif(report), indent=2))
+    elif output_format == "text":
+        print_text_report(report)
+    else:
+        print(json.dumps(report, indent=2))
+    
+    return 0 if report["summary"]["gate_result"] == "PASS" else 1
+
+
+def cli_main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point of ``validator.py``.
+    
+    Args:
+        argv: Arguments without the program name (default: sys.argv[1:])
+        
+    Returns:
+        Exit code for the ``scan``, ``merge`` or ``history`` command
+    """
+    import argparse
+    
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    if argv and argv[0] == "merge":
+        merge_parser = argparse.ArgumentParser(
+            prog="validator.py merge",
+            description="Merge partial shard reports and recompute the gate result"
+        )
+        merge_parser.add_argument("reports", nargs="+", help="Partial JSON reports from --shard runs")
+        merge_parser.add_argument("--format", "-f", choices=["json", "sarif", "text"], default="text",
+                                  help="Output format (default: text)")
+        merge_parser.add_argument("--config", "-c", default="validator_config.yaml",
+                                  help="Path to validator config (default: validator_config.yaml)")
+        merge_parser.add_argument("--store", default=None,
+                                  help="SQLite violation store to append the merged run to")
+        merge_parser.add_argument("--metrics-file", default=None,
+                                  help="Write OpenMetrics gauges for the merged run to this file")
+        merge_args = merge_parser.parse_args(argv[1:])
+        return merge_main(merge_args.reports, merge_args.format, merge_args.config, merge_args.store,
+                          merge_args.metrics_file)
+    
+    if argv and argv[0] == "history":
+        try:
+            from .history import history_main
+        except ImportError:
+            from history import history_main
+        
+        history_parser = argparse.ArgumentParser(
+            prog="validator.py history",
+            description="Gate every commit in a revision range without checking it out"
+        )
+        history_parser.add_argument("range", help="Revision range for git rev-list, e.g. v1.0..main")
+        history_parser.add_argument("--repo", default=".", help="Path inside the repository (default: .)")
+        history_parser.add_argument("--root", default="",
+                                    help="Subdirectory to treat as the workspace (default: repository root)")
+        history_parser.add_argument("--format", "-f", choices=["json", "text"], default="text",
+                                    help="Output format (default: text)")
+        history_parser.add_argument("--config", "-c", default="validator_config.yaml",
+                                    help="Path to validator config (default: validator_config.yaml)")
+        history_parser.add_argument("--include-violations", action="store_true",
+                                    help="List every commit's violations in the JSON output")
+        history_args = history_parser.parse_args(argv[1:])
+        return history_main(history_args.range, history_args.repo, history_args.root,
+                            history_args.format, history_args.config, history_args.include_violations)
+    
+    parser = argparse.ArgumentParser(
+        description="PROACTIVE Constitutional Validator - Validates model outputs against I1-I6 invariants"
+    )
+    parser.add_argument("directory", nargs="?", default=".", 
+                        help="Directory or file to validate (default: current directory); "
+                             "with --stdin, the workspace root for I2 checks")
+    parser.add_argument("--format", "-f", choices=["json", "sarif", "text", "ndjson"], default="text",
+                        help="Output format (default: text; ndjson requires --stdin)")
+    parser.add_argument("--config", "-c", default="validator_config.yaml",
+                        help="Path to validator config (default: validator_config.yaml)")
+    parser.add_argument("--stdin", action="store_true",
+                        help="Stream newline-delimited records from stdin and write NDJSON violations")
+    parser.add_argument("--flush-ms", type=float, default=0.0,
+                        help="With --stdin, buffer output for at most this many ms (default: 0, flush every line)")
+    parser.add_argument("--perf-results", default=None,
+                        help="Benchmark results JSON to check for throughput regressions")
+    parser.add_argument("--perf-baseline", default=None,
+                        help="Baseline benchmark JSON (default: gate.performance.baseline, "
+                             "relative to the config file)")
+    parser.add_argument("--perf-max-regression", type=float, default=None,
+                        help="Allowed throughput drop in percent (default: gate.performance.max_regression_pct)")
+    
+    parser.add_argument("--shard", default=None, metavar="I/N",
+                        help="Validate only shard I of N (1-based) and print a partial JSON report")
+    parser.add_argument("--violation-baseline", default=None,
+                        help="Fingerprint baseline; only violations not in it are reported and gated on")
+    parser.add_argument("--write-baseline", default=None,
+                        help="Write the fingerprints of all current violations to this file")
+    parser.add_argument("--store", default=None,
+                        help="SQLite violation store to append this run to (query it with store.py)")
+    parser.add_argument("--metrics-file", default=None,
+                        help="Write OpenMetrics gauges for this run to this file (e.g. a node_exporter .prom)")
+    
+    args = parser.parse_args(argv)
+    
+    if args.stdin:
+        if args.format not in ("ndjson", "text"):
+            parser.error("--stdin writes NDJSON; use --format ndjson")
+        try:
+            from .stream import validate_stream
+        except ImportError:
+            from stream import validate_stream
+        reset_config()
+        load_config(args.config)
+        try:
+            summary = validate_stream(sys.stdin, sys.stdout, args.directory, args.flush_ms)
+        except BrokenPipeError:
+            # Downstream closed the pipe; fail closed without a traceback
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            return 1
+        return 0 if summary["gate_result"] == "PASS" else 1
+    if args.format == "ndjson":
+        parser.error("--format ndjson requires --stdin")
+    
+    try:
+        shard = parse_shard(args.shard) if args.shard else None
+    except ValueError as e:
+        parser.error(str(e))
+    
+    return main(args.directory, args.format, args.config,
+                args.perf_results, args.perf_baseline, args.perf_max_regression, shard,
+                args.violation_baseline, args.write_baseline, args.store, args.metrics_file)
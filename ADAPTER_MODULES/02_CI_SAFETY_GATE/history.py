@@ -0,0 +1,317 @@
+"""
+History Backfill for the PROACTIVE Safety Gate
+
+Computes the gate result of every commit in a revision range without
+checking anything out, for example to find when a violation first appeared:
+
+    python validator.py history v1.0..main --repo ../my-repo
+
+Objects are read through one long-lived ``git cat-file --batch`` process.
+Trees and blobs shared between commits are parsed and scanned once.
+"""
+
+import json
+import sys
+import time
+from typing import List, Dict, Any, Optional, Tuple
+
+# Handle both package import and direct execution
+try:
+    from .gate import (
+        Violation, load_config, reset_config, get_rules, assign_fingerprints,
+        check_invariant_i1, check_invariant_i3, check_invariant_i4, check_invariant_i5,
+        check_invariant_i6, _check_i2_artifact_verification, _check_i2_file_existence,
+        _decode_text, _relocate, _max_member_bytes, _read_error, _match_patterns,
+        _count_violations, _gate_decision
+    )
+except ImportError:
+    from gate import (
+        Violation, load_config, reset_config, get_rules, assign_fingerprints,
+        check_invariant_i1, check_invariant_i3, check_invariant_i4, check_invariant_i5,
+        check_invariant_i6, _check_i2_artifact_verification, _check_i2_file_existence,
+        _decode_text, _relocate, _max_member_bytes, _read_error, _match_patterns,
+        _count_violations, _gate_decision
+    )
+
+
+class GitObjectReader:
+    """Reads objects through one long-lived ``git cat-file --batch`` process.
+    
+    Args:
+        repo: Path inside the repository
+    """
+    
+    def __init__(self, repo: str = "."):
+        import subprocess
+        self.repo = repo
+        self.reads = 0
+        self._process = subprocess.Popen(
+            ["git", "cat-file", "--batch"], cwd=repo,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+    
+    def read(self, spec: str, limit: Optional[int] = None) -> Tuple[str, str, Optional[bytes]]:
+        """Return (object id, object type, content) for ``spec``.
+        
+        Content larger than ``limit`` is drained from the pipe and returned
+        as None.
+        
+        Raises:
+            KeyError: If the object does not exist
+        """
+        self._process.stdin.write(spec.encode('utf-8') + b"\n")
+        self._process.stdin.flush()
+        header = self._process.stdout.readline().split()
+        if len(header) != 3:
+            raise KeyError(spec)
+        sha, obj_type, size = header
+        size = int(size)
+        self.reads += 1
+        if limit is not None and size > limit:
+            remaining = size
+            while remaining:
+                remaining -= len(self._process.stdout.read(min(remaining, 1 << 20)))
+            data = None
+        else:
+            data = self._process.stdout.read(size)
+        self._process.stdout.read(1)  # trailing newline
+        return sha.decode('ascii'), obj_type.decode('ascii'), data
+    
+    def close(self) -> None:
+        self._process.stdin.close()
+        self._process.wait()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _TreeWalker:
+    """Lists the files of git trees, parsing every distinct tree object once."""
+    
+    def __init__(self, reader: GitObjectReader, hash_bytes: int = 20):
+        self.reader = reader
+        self.hash_bytes = hash_bytes
+        # tree sha -> [(name, is_tree, sha, mode)]
+        self._entries: Dict[str, List[Tuple[str, bool, str, bytes]]] = {}
+    
+    def _tree(self, sha: str) -> List[Tuple[str, bool, str, bytes]]:
+        entries = self._entries.get(sha)
+        if entries is None:
+            _, _, data = self.reader.read(sha)
+            entries = []
+            pos = 0
+            while pos < len(data):
+                space = data.index(b" ", pos)
+                nul = data.index(b"\0", space)
+                mode = data[pos:space]
+                name = data[space + 1:nul].decode('utf-8', 'surrogateescape')
+                obj = data[nul + 1:nul + 1 + self.hash_bytes].hex()
+                entries.append((name, mode == b"40000", obj, mode))
+                pos = nul + 1 + self.hash_bytes
+            self._entries[sha] = entries
+        return entries
+    
+    def walk(self, tree_sha: str, prefix: str = ""):
+        """Yield (path, sha, mode) for every entry below ``tree_sha``, trees included."""
+        for name, is_tree, sha, mode in self._tree(tree_sha):
+            path = f"{prefix}{name}"
+            yield path, sha, mode
+            if is_tree:
+                yield from self.walk(sha, path + "/")
+
+
+def scan_history(
+    rev_range: str,
+    repo: str = ".",
+    root: str = "",
+    include_patterns: Optional[List[str]] = None,
+    exclude_patterns: Optional[List[str]] = None,
+    include_violations: bool = False
+) -> Dict[str, Any]:
+    """Gate result of every commit in ``rev_range`` without checking anything out.
+    
+    Objects are read through one ``git cat-file --batch`` process. Each
+    distinct tree is parsed once and each distinct matching blob is scanned
+    once, however many commits contain it. I2 claimed files are resolved
+    against the commit's own tree; only that membership test runs per commit.
+    
+    Args:
+        rev_range: Anything ``git rev-list`` accepts, e.g. ``v1.0..main``
+        repo: Path inside the repository
+        root: Subdirectory treated as the workspace (default: repository root)
+        include_patterns: Glob patterns for files to include
+        exclude_patterns: Glob patterns for files to exclude
+        include_violations: Also list every commit's violations
+        
+    Returns:
+        Dictionary with per-commit ``commits`` results and ``totals``
+        
+    Raises:
+        ValueError: If ``rev_range`` cannot be resolved
+    """
+    import subprocess
+    import posixpath
+    
+    start = time.perf_counter()
+    config = load_config()
+    targets = config.get("validation_targets", {})
+    if include_patterns is None:
+        include_patterns = targets.get("include", ["**/*.json", "**/*.yaml", "**/*.yml"])
+    if exclude_patterns is None:
+        exclude_patterns = targets.get("exclude", ["node_modules/**", ".git/**"])
+    gate_config = config.get("gate", {})
+    limit = _max_member_bytes()
+    root = root.strip("/")
+    
+    try:
+        commits = subprocess.check_output(
+            ["git", "rev-list", "--reverse", rev_range], cwd=repo, stderr=subprocess.PIPE
+        ).decode().split()
+        object_format = subprocess.check_output(
+            ["git", "rev-parse", "--show-object-format"], cwd=repo, stderr=subprocess.DEVNULL
+        ).decode().strip() or "sha1"
+    except subprocess.CalledProcessError as e:
+        raise ValueError(f"Cannot resolve revision range '{rev_range}': {e.stderr.decode().strip()}")
+    
+    rules = get_rules()
+    matched: Dict[str, bool] = {}
+    # (blob sha, routing signature) -> (content-only violations, I2 claims as
+    # if every claimed file were missing)
+    scanned: Dict[Tuple[str, Tuple], Tuple[List[Violation], List[Violation]]] = {}
+    rows = []
+    
+    with GitObjectReader(repo) as reader:
+        walker = _TreeWalker(reader, 32 if object_format == "sha256" else 20)
+        for commit in commits:
+            _, _, commit_data = reader.read(commit)
+            headers, _, message = commit_data.decode('utf-8', 'replace').partition("\n\n")
+            tree = headers.split("\n", 1)[0].split()[1]
+            if root:
+                try:
+                    tree, obj_type, _ = reader.read(f"{tree}:{root}")
+                except KeyError:
+                    obj_type = None
+                if obj_type != "tree":
+                    tree = None
+            
+            entries = list(walker.walk(tree)) if tree else []
+            paths = {path for path, _, _ in entries}
+            exists = lambda claimed: posixpath.normpath(claimed) in paths
+            
+            violations: List[Violation] = []
+            files = 0
+            for path, sha, mode in entries:
+                if not mode.startswith(b"100"):
+                    continue
+                is_match = matched.get(path)
+                if is_match is None:
+                    is_match = (not _match_patterns(path, exclude_patterns)
+                                and _match_patterns(path, include_patterns))
+                    matched[path] = is_match
+                if not is_match:
+                    continue
+                files += 1
+                
+                key = (sha, rules.path_signature(path))
+                if key not in scanned:
+                    try:
+                        _, _, data = reader.read(sha, limit)
+                        if data is None:
+                            raise ValueError(f"blob exceeds {limit // (1024 * 1024)} MB; not scanned")
+                        content = _decode_text(data)
+                        scanned[key] = (
+                            check_invariant_i1(content, path)
+                            + _check_i2_artifact_verification(content, path)
+                            + check_invariant_i3(content, path)
+                            + check_invariant_i4(content, path)
+                            + check_invariant_i5(content, path)
+                            + check_invariant_i6(content, path),
+                            _check_i2_file_existence(content, path, "", lambda claimed: False)
+                        )
+                    except Exception as e:
+                        scanned[key] = (_read_error(path, f"Error reading blob {sha[:12]}: {e}").violations, [])
+                
+                content_violations, claims = scanned[key]
+                violations.extend(_relocate(v, path) for v in content_violations)
+                violations.extend(_relocate(v, path) for v in claims
+                                  if not exists(v.evidence["claimed_file"]))
+            
+            violations = assign_fingerprints(violations)
+            by_invariant, by_severity = _count_violations(v.to_dict() for v in violations)
+            gate_result, gate_reason = _gate_decision(by_severity["ERROR"], by_severity["WARNING"], gate_config)
+            row: Dict[str, Any] = {
+                "commit": commit,
+                "subject": message.split("\n", 1)[0],
+                "files_scanned": files,
+                "total_violations": len(violations),
+                "errors": by_severity["ERROR"],
+                "warnings": by_severity["WARNING"],
+                "by_invariant": by_invariant,
+                "gate_result": gate_result,
+                "gate_reason": gate_reason
+            }
+            if include_violations:
+                row["violations"] = [v.to_dict() for v in violations]
+            rows.append(row)
+        blob_reads = reader.reads
+    
+    return {
+        "format": "proactive-history",
+        "version": 1,
+        "range": rev_range,
+        "root": root,
+        "commits": rows,
+        "totals": {
+            "commits": len(rows),
+            "failed": sum(1 for r in rows if r["gate_result"] == "FAIL"),
+            "unique_blobs_scanned": len(scanned),
+            "objects_read": blob_reads,
+            "execution_time_ms": int((time.perf_counter() - start) * 1000)
+        }
+    }
+
+
+def history_main(
+    rev_range: str,
+    repo: str = ".",
+    root: str = "",
+    output_format: str = "text",
+    config_path: str = "validator_config.yaml",
+    include_violations: bool = False
+) -> int:
+    """CLI entry point for ``validator.py history``.
+    
+    Returns:
+        Exit code (0 = every commit passes, 1 = at least one fails,
+        2 = the range or repository cannot be read)
+    """
+    reset_config()
+    load_config(config_path)
+    
+    try:
+        history = scan_history(rev_range, repo, root, include_violations=include_violations)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    
+    if output_format == "json":
+        print(json.dumps(history, indent=2))
+    else:
+        totals = history["totals"]
+        print("=" * 72)
+        print(f"PROACTIVE History Backfill - {history['range']}")
+        print("=" * 72)
+        print(f"  {'commit':<12} {'result':<6} {'files':>6} {'errors':>7} {'warn':>6}  subject")
+        for row in history["commits"]:
+            print(f"  {row['commit'][:12]:<12} {row['gate_result']:<6} {row['files_scanned']:>6} "
+                  f"{row['errors']:>7} {row['warnings']:>6}  {row['subject'][:32]}")
+        print()
+        print(f"Commits: {totals['commits']}  failed: {totals['failed']}  "
+              f"unique blobs scanned: {totals['unique_blobs_scanned']}  "
+              f"time: {totals['execution_time_ms'] / 1000:.1f}s")
+        print("=" * 72)
+    
+    return 0 if history["totals"]["failed"] == 0 else 1
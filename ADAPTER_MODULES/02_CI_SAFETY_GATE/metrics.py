@@ -0,0 +1,137 @@
+"""
+Metrics Export for the PROACTIVE Safety Gate
+
+Writes the operational figures of a gate run as an OpenMetrics text file
+that node_exporter's textfile collector (or any Prometheus scraper) can
+pick up, so throughput regressions in production runs can be alerted on:
+
+    python validator.py . --metrics-file /var/lib/node_exporter/proactive_gate.prom
+
+Every sample describes the last run, so all families are gauges; the
+output is also valid Prometheus text format. The file is replaced
+atomically, so a scrape never sees a half-written run.
+"""
+
+import os
+import sys
+import time
+from typing import Dict, Any, Optional, Tuple
+
+PREFIX = "proactive_gate_"
+
+# Label set -> value, in insertion order
+Samples = Dict[Tuple[Tuple[str, str], ...], float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+class MetricsRegistry:
+    """Gauges of one run, rendered as OpenMetrics text."""
+
+    def __init__(self, prefix: str = PREFIX):
+        self.prefix = prefix
+        self._families: Dict[str, Tuple[str, Samples]] = {}
+
+    def gauge(self, name: str, help_text: str, value: float, **labels: str) -> None:
+        """Set a gauge sample (one per distinct label set)."""
+        _, samples = self._families.setdefault(self.prefix + name, (help_text, {}))
+        samples[tuple(labels.items())] = float(value)
+
+    def render(self) -> str:
+        """OpenMetrics text exposition, terminated by ``# EOF``."""
+        lines = []
+        for name, (help_text, samples) in self._families.items():
+            lines.append(f"# HELP {name} {_escape(help_text)}")
+            lines.append(f"# TYPE {name} gauge")
+            for labels, value in samples.items():
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str) -> None:
+        """Write ``render()`` to ``path`` via a temporary file and rename."""
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(self.render())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size of this process, or None where unavailable."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def gate_metrics(report: Dict[str, Any]) -> MetricsRegistry:
+    """Metrics for a gate report (full or merged).
+
+    Args:
+        report: Report dictionary matching violation_schema.json; its
+            optional ``io`` section adds bytes read and read/scan times
+
+    Returns:
+        Registry ready to render or write
+    """
+    summary = report["summary"]
+    io = report.get("io") or {}
+    registry = MetricsRegistry()
+
+    registry.gauge("passed", "1 if the gate passed, 0 if it failed",
+                   1 if summary["gate_result"] == "PASS" else 0)
+    registry.gauge("files_scanned", "Files validated", summary["total_files_scanned"])
+    registry.gauge("files_with_violations", "Files with at least one violation",
+                   summary["files_with_violations"])
+
+    severities = ("ERROR", "WARNING", "INFO")
+    counts: Dict[Tuple[str, str], int] = {}
+    for violation in report.get("violations", []):
+        key = (violation["invariant"], violation["severity"])
+        counts[key] = counts.get(key, 0) + 1
+    # Zero samples keep every (invariant, severity) series continuous
+    for invariant in sorted(set(summary["by_invariant"]) | {inv for inv, _ in counts}):
+        for severity in severities:
+            registry.gauge("violations", "Violations reported, by invariant and severity",
+                           counts.get((invariant, severity), 0), invariant=invariant, severity=severity)
+
+    duration_ms = summary.get("execution_time_ms")
+    if duration_ms is not None:
+        registry.gauge("duration_seconds", "Wall time of the gate run", duration_ms / 1000)
+    if io:
+        registry.gauge("bytes_read", "Bytes read from scanned files", io["bytes_read"])
+        registry.gauge("scan_wall_seconds", "Wall time of the directory scan", io["wall_s"])
+        registry.gauge("io_wait_seconds", "Time the scanner waited on file reads", io["io_wait_s"])
+        registry.gauge("scan_cpu_seconds", "Scanner CPU time", io["scan_cpu_s"])
+        registry.gauge("throughput_bytes_per_second", "Bytes scanned per second of scan wall time",
+                       io["bytes_read"] / io["wall_s"] if io["wall_s"] > 0 else 0)
+        registry.gauge("throughput_files_per_second", "Files scanned per second of scan wall time",
+                       io["files_read"] / io["wall_s"] if io["wall_s"] > 0 else 0)
+
+    rss = peak_rss_bytes()
+    if rss is not None:
+        registry.gauge("peak_rss_bytes", "Peak resident set size of the gate process", rss)
+    registry.gauge("last_run_timestamp_seconds", "Unix time the run finished", round(time.time(), 3))
+    return registry
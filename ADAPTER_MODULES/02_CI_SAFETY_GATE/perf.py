@@ -0,0 +1,152 @@
+"""
+Performance Gate for the PROACTIVE Safety Gate
+
+Compares the throughput figures of a benchmarks/suite.py run against a
+stored baseline and reports every metric that dropped by more than the
+allowed regression plus a noise allowance as a PERF violation:
+
+    python validator.py ./outputs --perf-results perf.json
+"""
+
+import json
+from typing import List, Dict, Any, Optional, Tuple
+
+# Handle both package import and direct execution
+try:
+    from .gate import Violation, load_config, _get_default_config, _generate_violation_id
+except ImportError:
+    from gate import Violation, load_config, _get_default_config, _generate_violation_id
+
+
+BENCHMARK_FORMAT = "proactive-benchmarks"
+
+
+def load_benchmark_results(path: str) -> Dict[str, Any]:
+    """Load a results or baseline file written by benchmarks/suite.py.
+    
+    Args:
+        path: Path to the JSON file
+        
+    Returns:
+        Parsed results dictionary
+        
+    Raises:
+        ValueError: If the file is not a benchmark results file
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get("format") != BENCHMARK_FORMAT or "benchmarks" not in data:
+        raise ValueError(f"Not a benchmark results file: {path}")
+    return data
+
+
+def _performance_config() -> Dict[str, Any]:
+    """gate.performance settings, with defaults for keys the config omits."""
+    defaults = _get_default_config()["gate"]["performance"]
+    return {**defaults, **load_config().get("gate", {}).get("performance", {})}
+
+
+def _metric_value(results: Dict[str, Any], metric: str) -> Tuple[Optional[float], float, int]:
+    """Look up ``benchmark.field`` and return (value, relative IQR, samples)."""
+    benchmark, _, field_name = metric.partition(".")
+    entry = results.get("benchmarks", {}).get(benchmark)
+    if not entry or entry.get(field_name) is None:
+        return None, 0.0, 0
+    median = entry.get("median_s") or 0.0
+    relative_iqr = entry.get("iqr_s", 0.0) / median if median else 0.0
+    return float(entry[field_name]), relative_iqr, len(entry.get("samples_s", []))
+
+
+def check_performance(
+    results_path: str,
+    baseline_path: str,
+    max_regression_pct: Optional[float] = None
+) -> Tuple[List[Violation], Dict[str, Any]]:
+    """Compare benchmark throughput against a stored baseline.
+    
+    A metric regresses when it drops by more than ``max_regression_pct``
+    plus a noise allowance of ``noise_iqr_factor`` times the larger relative
+    IQR (IQR / median) of the two runs, so a noisy runner widens the band
+    instead of failing the gate.
+    
+    Args:
+        results_path: Results of the current run (benchmarks/suite.py --out)
+        baseline_path: Stored baseline (benchmarks/baseline.json)
+        max_regression_pct: Overrides gate.performance.max_regression_pct
+        
+    Returns:
+        Tuple of (PERF violations, report section)
+    """
+    perf_config = _performance_config()
+    if max_regression_pct is None:
+        max_regression_pct = float(perf_config.get("max_regression_pct", 10.0))
+    noise_factor = float(perf_config.get("noise_iqr_factor", 1.0))
+    severity = perf_config.get("severity", "ERROR")
+    
+    section: Dict[str, Any] = {
+        "results": results_path,
+        "baseline": baseline_path,
+        "max_regression_pct": max_regression_pct,
+        "noise_iqr_factor": noise_factor,
+        "metrics": [],
+        "regressions": 0
+    }
+    
+    try:
+        results = load_benchmark_results(results_path)
+        baseline = load_benchmark_results(baseline_path)
+    except (OSError, ValueError) as e:
+        return [Violation(
+            violation_id=_generate_violation_id(),
+            invariant="SYSTEM",
+            severity="ERROR",
+            location={"file": results_path},
+            message=f"Error reading benchmark results: {e}"
+        )], section
+    
+    if results.get("params") != baseline.get("params"):
+        section["params_mismatch"] = {"results": results.get("params"), "baseline": baseline.get("params")}
+    
+    violations = []
+    for metric in perf_config.get("metrics", []):
+        current, current_iqr, samples = _metric_value(results, metric)
+        reference, reference_iqr, _ = _metric_value(baseline, metric)
+        record: Dict[str, Any] = {"metric": metric, "baseline": reference, "current": current, "samples": samples}
+        
+        if current is None or not reference:
+            record["status"] = "missing"
+            section["metrics"].append(record)
+            continue
+        
+        change_pct = (current / reference - 1) * 100
+        noise_pct = noise_factor * max(current_iqr, reference_iqr) * 100
+        threshold_pct = max_regression_pct + noise_pct
+        record.update({
+            "change_pct": round(change_pct, 2),
+            "noise_pct": round(noise_pct, 2),
+            "threshold_pct": round(threshold_pct, 2),
+            "status": "REGRESSED" if -change_pct > threshold_pct else "OK"
+        })
+        section["metrics"].append(record)
+        
+        if record["status"] == "REGRESSED":
+            violations.append(Violation(
+                violation_id=_generate_violation_id(),
+                invariant="PERF",
+                severity=severity,
+                location={"file": results_path},
+                message=(f"{metric} dropped {-change_pct:.1f}% against baseline "
+                         f"(allowed {max_regression_pct:.1f}% + {noise_pct:.1f}% noise)"),
+                suggested_fix="Profile the regression or re-record the baseline if the slowdown is intended",
+                evidence={
+                    "metric": metric,
+                    "baseline_value": reference,
+                    "current_value": current,
+                    "change_pct": round(change_pct, 2),
+                    "threshold_pct": round(threshold_pct, 2)
+                },
+                rule_id=f"PERF.{metric}"
+            ))
+    
+    section["regressions"] = len(violations)
+    return violations, section
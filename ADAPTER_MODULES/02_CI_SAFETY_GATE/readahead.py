@@ -0,0 +1,80 @@
+"""
+Read-Ahead I/O for the PROACTIVE Safety Gate
+
+Overlaps file reads with regex scanning in validate_directory: a pool of
+reader threads fetches file contents ahead of the scanner, within a memory
+budget, so the scan is not stalled on storage latency.
+"""
+
+import time
+from typing import List, Tuple
+
+# Handle both package import and direct execution
+try:
+    from .gate import _read_file
+except ImportError:
+    from gate import _read_file
+
+
+class _ReadAhead:
+    """Reads files on a thread pool ahead of the scanner.
+    
+    Files are submitted in the given order, each only once its size fits in
+    ``budget_bytes`` next to the files read but not yet released by the
+    scanner; a file larger than the whole budget is read on its own.
+    Compressed files count with their size on disk. ``next()`` returns the
+    futures in submission order.
+    """
+    
+    def __init__(self, files: List[Tuple[str, int]], threads: int, budget_bytes: int, limit: int):
+        import queue
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        
+        self.budget_bytes = budget_bytes
+        self.peak_buffered = 0
+        self.read_s = 0.0
+        self._buffered = 0
+        self._stopped = False
+        self._cond = threading.Condition()
+        self._ready = queue.Queue()
+        self._pool = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="proactive-read")
+        self._dispatcher = threading.Thread(target=self._dispatch, args=(files, limit), daemon=True)
+        self._dispatcher.start()
+    
+    def _read(self, file_path: str, limit: int) -> bytes:
+        start = time.perf_counter()
+        try:
+            return _read_file(file_path, limit)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._cond:
+                self.read_s += elapsed
+    
+    def _dispatch(self, files: List[Tuple[str, int]], limit: int) -> None:
+        for file_path, size in files:
+            with self._cond:
+                while not self._stopped and self._buffered and self._buffered + size > self.budget_bytes:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                self._buffered += size
+                self.peak_buffered = max(self.peak_buffered, self._buffered)
+            self._ready.put(self._pool.submit(self._read, file_path, limit))
+    
+    def next(self):
+        """Future of the next file's content."""
+        return self._ready.get()
+    
+    def release(self, size: int) -> None:
+        """Return a scanned file's bytes to the budget."""
+        with self._cond:
+            self._buffered -= size
+            self._cond.notify()
+    
+    def close(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        self._dispatcher.join()
+        self._pool.shutdown(wait=True, cancel_futures=True)
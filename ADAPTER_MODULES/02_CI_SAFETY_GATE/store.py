@@ -0,0 +1,317 @@
+"""
+Violation Store for the PROACTIVE Safety Gate
+
+Keeps the summary and violations of every gate run in a SQLite database, so
+questions across runs ("which files regressed on I3 this month") are indexed
+queries instead of re-parsing archived proactive_report.json files.
+
+``validator.py --store gate.db`` appends each run. This module is also the
+query CLI:
+
+    python store.py gate.db runs --limit 20
+    python store.py gate.db trends --invariant I3 --by week --since 2026-01-01
+    python store.py gate.db top --invariant I3 --since 2026-10-01
+    python store.py gate.db rules --since 2026-10-01
+    python store.py gate.db regressions --invariant I3 --since 2026-10-01
+
+Each violation row carries the run, file, invariant, rule_id, severity, line
+and fingerprint. File paths are stored once in ``files``. ``rule_counts``
+holds per-run totals by rule, so trends and rule counts read a few rows per
+run. File-level queries use a covering index on (run, invariant, rule,
+file, fingerprint).
+"""
+
+import json
+import sqlite3
+from typing import List, Dict, Any, Optional
+
+STORE_SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    report_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    commit_sha TEXT,
+    branch TEXT,
+    config_path TEXT,
+    gate_result TEXT NOT NULL,
+    files_scanned INTEGER NOT NULL,
+    total_violations INTEGER NOT NULL,
+    errors INTEGER NOT NULL,
+    warnings INTEGER NOT NULL,
+    execution_time_ms INTEGER
+);
+CREATE TABLE IF NOT EXISTS files (
+    file_id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS violations (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    file_id INTEGER REFERENCES files(file_id),
+    invariant TEXT NOT NULL,
+    rule_id TEXT,
+    severity TEXT NOT NULL,
+    line INTEGER,
+    fingerprint TEXT
+);
+-- Per-run totals by rule, so trends and rule counts never scan violations
+CREATE TABLE IF NOT EXISTS rule_counts (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    invariant TEXT NOT NULL,
+    rule_id TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    n INTEGER NOT NULL,
+    PRIMARY KEY (run_id, invariant, rule_id, severity)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_runs_timestamp ON runs(timestamp);
+-- Covers the per-window aggregations without touching the table
+CREATE INDEX IF NOT EXISTS ix_violations_run ON violations(run_id, invariant, rule_id, file_id, fingerprint);
+CREATE INDEX IF NOT EXISTS ix_violations_file ON violations(file_id, invariant, run_id);
+CREATE INDEX IF NOT EXISTS ix_violations_rule ON violations(rule_id, run_id);
+"""
+
+
+def connect(db_path: str) -> sqlite3.Connection:
+    """Open (and if needed create) a violation store.
+
+    Raises:
+        ValueError: If the database was written by a newer schema version
+    """
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.executescript(SCHEMA)
+    row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+    if row is None:
+        conn.execute("INSERT INTO meta (key, value) VALUES ('schema_version', ?)", (str(STORE_SCHEMA_VERSION),))
+        conn.commit()
+    elif int(row["value"]) > STORE_SCHEMA_VERSION:
+        conn.close()
+        raise ValueError(f"Violation store {db_path} has schema version {row['value']}; "
+                         f"this validator supports {STORE_SCHEMA_VERSION}")
+    return conn
+
+
+def record_run(db_path: str, report: Dict[str, Any]) -> int:
+    """Append one report (violation_schema.json) to the store in a single transaction.
+
+    Returns:
+        The new run_id
+    """
+    summary = report["summary"]
+    git = report.get("git_context", {})
+    conn = connect(db_path)
+    try:
+        with conn:
+            cursor = conn.execute(
+                "INSERT INTO runs (report_id, timestamp, commit_sha, branch, config_path, gate_result, "
+                "files_scanned, total_violations, errors, warnings, execution_time_ms) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (report["report_id"], report["timestamp"], git.get("commit_sha"), git.get("branch"),
+                 report.get("config_used", {}).get("config_path"), summary["gate_result"],
+                 summary["total_files_scanned"], summary["total_violations"], summary["errors"],
+                 summary["warnings"], summary.get("execution_time_ms"))
+            )
+            run_id = cursor.lastrowid
+
+            paths = {v["location"].get("file") for v in report["violations"]} - {None}
+            conn.executemany("INSERT OR IGNORE INTO files (path) VALUES (?)", [(p,) for p in paths])
+            file_ids: Dict[str, int] = {}
+            for path in paths:
+                file_ids[path] = conn.execute("SELECT file_id FROM files WHERE path = ?", (path,)).fetchone()[0]
+
+            conn.executemany(
+                "INSERT INTO violations (run_id, file_id, invariant, rule_id, severity, line, fingerprint) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(run_id, file_ids.get(v["location"].get("file")), v["invariant"], v.get("rule_id"),
+                  v["severity"], v["location"].get("line"), v.get("fingerprint"))
+                 for v in report["violations"]]
+            )
+            conn.execute(
+                "INSERT INTO rule_counts (run_id, invariant, rule_id, severity, n) "
+                "SELECT run_id, invariant, COALESCE(rule_id, invariant), severity, COUNT(*) FROM violations "
+                "WHERE run_id = ? GROUP BY invariant, COALESCE(rule_id, invariant), severity",
+                (run_id,)
+            )
+        # Sampled statistics keep the planner on ix_violations_run for window queries
+        conn.execute("PRAGMA analysis_limit=1000")
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+    return run_id
+
+
+def _window(since: Optional[str], until: Optional[str], alias: str = "r") -> tuple:
+    """SQL condition and parameters restricting runs to [since, until)."""
+    clauses, params = [], []
+    if since:
+        clauses.append(f"{alias}.timestamp >= ?")
+        params.append(since)
+    if until:
+        clauses.append(f"{alias}.timestamp < ?")
+        params.append(until)
+    return (" AND ".join(clauses) or "1"), params
+
+
+def _rows(cursor) -> List[Dict[str, Any]]:
+    return [dict(row) for row in cursor.fetchall()]
+
+
+def query_runs(conn: sqlite3.Connection, since: Optional[str] = None, until: Optional[str] = None,
+               limit: int = 20) -> List[Dict[str, Any]]:
+    """Most recent runs, newest first."""
+    where, params = _window(since, until)
+    return _rows(conn.execute(
+        f"SELECT run_id, timestamp, commit_sha, branch, gate_result, files_scanned, total_violations, "
+        f"errors, warnings, execution_time_ms FROM runs r WHERE {where} ORDER BY r.timestamp DESC LIMIT ?",
+        params + [limit]
+    ))
+
+
+# strftime formats for trend buckets
+BUCKETS = {"run": None, "day": "%Y-%m-%d", "week": "%Y-W%W", "month": "%Y-%m"}
+
+
+def query_trends(conn: sqlite3.Connection, invariant: Optional[str] = None, by: str = "day",
+                 since: Optional[str] = None, until: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Violations per run averaged over each time bucket (or per run with ``by="run"``)."""
+    where, params = _window(since, until)
+    match = "c.run_id = r.run_id" + (" AND c.invariant = ?" if invariant else "")
+    per_run = (f"SELECT r.run_id, r.timestamp, "
+               f"(SELECT COALESCE(SUM(c.n), 0) FROM rule_counts c WHERE {match}) AS violations "
+               f"FROM runs r WHERE {where}")
+    params = ([invariant] if invariant else []) + params
+    if BUCKETS[by] is None:
+        return _rows(conn.execute(f"{per_run} ORDER BY timestamp", params))
+    return _rows(conn.execute(
+        f"SELECT strftime('{BUCKETS[by]}', timestamp) AS bucket, COUNT(*) AS runs, "
+        f"ROUND(AVG(violations), 2) AS avg_violations, MIN(violations) AS min_violations, "
+        f"MAX(violations) AS max_violations FROM ({per_run}) GROUP BY bucket ORDER BY bucket",
+        params
+    ))
+
+
+def query_top(conn: sqlite3.Connection, invariant: Optional[str] = None, since: Optional[str] = None,
+              until: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
+    """Files with the most violations over the runs in the window."""
+    where, params = _window(since, until)
+    if invariant:
+        where += " AND v.invariant = ?"
+        params.append(invariant)
+    return _rows(conn.execute(
+        f"SELECT f.path AS file, COUNT(*) AS occurrences, COUNT(DISTINCT v.fingerprint) AS distinct_violations, "
+        f"COUNT(DISTINCT v.run_id) AS runs FROM violations v JOIN runs r ON r.run_id = v.run_id "
+        f"JOIN files f ON f.file_id = v.file_id WHERE {where} "
+        f"GROUP BY v.file_id ORDER BY occurrences DESC, file LIMIT ?",
+        params + [limit]
+    ))
+
+
+def query_rules(conn: sqlite3.Connection, since: Optional[str] = None,
+                until: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Violation counts per invariant and rule over the runs in the window."""
+    where, params = _window(since, until)
+    return _rows(conn.execute(
+        f"SELECT c.invariant, c.rule_id, SUM(c.n) AS occurrences, COUNT(DISTINCT c.run_id) AS runs, "
+        f"ROUND(SUM(c.n) * 1.0 / COUNT(DISTINCT c.run_id), 2) AS avg_per_run "
+        f"FROM rule_counts c JOIN runs r ON r.run_id = c.run_id "
+        f"WHERE {where} GROUP BY c.invariant, c.rule_id ORDER BY occurrences DESC",
+        params
+    ))
+
+
+def query_regressions(conn: sqlite3.Connection, invariant: Optional[str] = None, since: Optional[str] = None,
+                      until: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+    """Files with more violations in the last run of the window than in the first."""
+    where, params = _window(since, until)
+    bounds = conn.execute(
+        f"SELECT (SELECT run_id FROM runs r WHERE {where} ORDER BY timestamp, run_id LIMIT 1) AS first, "
+        f"(SELECT run_id FROM runs r WHERE {where} ORDER BY timestamp DESC, run_id DESC LIMIT 1) AS last",
+        params + params
+    ).fetchone()
+    if bounds["first"] is None or bounds["first"] == bounds["last"]:
+        return []
+    match = " AND v.invariant = ?" if invariant else ""
+    extra = [invariant] if invariant else []
+    return _rows(conn.execute(
+        f"SELECT f.path AS file, COALESCE(a.n, 0) AS before, b.n AS after, b.n - COALESCE(a.n, 0) AS delta "
+        f"FROM (SELECT file_id, COUNT(*) AS n FROM violations v WHERE v.run_id = ?{match} GROUP BY file_id) b "
+        f"LEFT JOIN (SELECT file_id, COUNT(*) AS n FROM violations v WHERE v.run_id = ?{match} GROUP BY file_id) a "
+        f"ON a.file_id = b.file_id JOIN files f ON f.file_id = b.file_id "
+        f"WHERE b.n > COALESCE(a.n, 0) ORDER BY delta DESC, file LIMIT ?",
+        [bounds["last"]] + extra + [bounds["first"]] + extra + [limit]
+    ))
+
+
+def print_table(rows: List[Dict[str, Any]]) -> None:
+    """Print query rows as an aligned table."""
+    if not rows:
+        print("(no rows)")
+        return
+    columns = list(rows[0])
+    widths = {c: max(len(c), *(len(str(r[c])) for r in rows)) for c in columns}
+    print("  ".join(c.ljust(widths[c]) for c in columns))
+    for row in rows:
+        print("  ".join(str(row[c]).ljust(widths[c]) for c in columns))
+
+
+def main(db_path: str, command: str, invariant: Optional[str] = None, by: str = "day",
+         since: Optional[str] = None, until: Optional[str] = None, limit: int = 20,
+         as_json: bool = False) -> int:
+    """Run one query against the store and print the result.
+
+    Returns:
+        Exit code (0 = success)
+    """
+    conn = connect(db_path)
+    try:
+        if command == "runs":
+            rows = query_runs(conn, since, until, limit)
+        elif command == "trends":
+            rows = query_trends(conn, invariant, by, since, until)
+        elif command == "top":
+            rows = query_top(conn, invariant, since, until, limit)
+        elif command == "rules":
+            rows = query_rules(conn, since, until)
+        else:
+            rows = query_regressions(conn, invariant, since, until, limit)
+    finally:
+        conn.close()
+
+    if as_json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print_table(rows)
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Query the PROACTIVE violation store")
+    parser.add_argument("db", help="SQLite store written by validator.py --store")
+    parser.add_argument("command", choices=["runs", "trends", "top", "rules", "regressions"],
+                        help="runs: recent runs; trends: violations over time; top: worst files; "
+                             "rules: counts per rule; regressions: files worse in the last run than the first")
+    parser.add_argument("--invariant", "-i", default=None, help="Restrict to one invariant, e.g. I3")
+    parser.add_argument("--by", choices=list(BUCKETS), default="day", help="Trend bucket (default: day)")
+    parser.add_argument("--since", default=None, help="Only runs at or after this ISO date/time")
+    parser.add_argument("--until", default=None, help="Only runs before this ISO date/time")
+    parser.add_argument("--limit", "-n", type=int, default=20, help="Maximum rows (default: 20)")
+    parser.add_argument("--json", action="store_true", help="Emit rows as JSON")
+
+    args = parser.parse_args()
+
+    try:
+        sys.exit(main(args.db, args.command, args.invariant, args.by, args.since, args.until,
+                      args.limit, args.json))
+    except (sqlite3.Error, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
@@ -0,0 +1,161 @@
+"""
+Streaming Mode for the PROACTIVE Safety Gate
+
+Validates newline-delimited records from a pipe as they arrive and writes
+every violation at once as an NDJSON line:
+
+    model-server | python validator.py --stdin --format ndjson --flush-ms 50
+
+Rules are compiled once at startup; each record is then checked with
+check_invariants. A final ``summary`` line carries the totals, the gate
+result and per-record latency percentiles.
+"""
+
+import json
+import time
+from typing import Dict, Any
+
+# Handle both package import and direct execution
+try:
+    from .gate import load_config, check_invariants, _gate_decision
+except ImportError:
+    from gate import load_config, check_invariants, _gate_decision
+
+
+def _percentile(sorted_values, q: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence."""
+    import math
+    if not sorted_values:
+        return 0.0
+    rank = min(len(sorted_values), max(1, math.ceil(q * len(sorted_values))))
+    return sorted_values[rank - 1]
+
+
+class _NdjsonWriter:
+    """Line writer that flushes at most ``flush_ms`` after a line is written.
+    
+    With ``flush_ms`` 0 every line is flushed immediately. Otherwise lines are
+    buffered and a daemon thread flushes them on the interval, so output
+    latency stays bounded even while the input stream is idle.
+    """
+    
+    def __init__(self, out, flush_ms: float = 0.0):
+        import threading
+        self._out = out
+        self._interval = flush_ms / 1000.0
+        self._lock = threading.Lock()
+        self._pending = False
+        self._stop = threading.Event()
+        self._thread = None
+        if self._interval > 0:
+            self._thread = threading.Thread(target=self._run, name="ndjson-flush", daemon=True)
+            self._thread.start()
+    
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            self.flush()
+    
+    def write(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._out.write(line)
+            if self._interval > 0:
+                self._pending = True
+            else:
+                self._out.flush()
+    
+    def flush(self) -> None:
+        with self._lock:
+            if self._pending:
+                self._out.flush()
+                self._pending = False
+    
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._pending = True
+        self.flush()
+
+
+def validate_stream(in_stream, out_stream, workspace: str = ".", flush_ms: float = 0.0) -> Dict[str, Any]:
+    """Validate newline-delimited records as they arrive.
+    
+    Every non-blank line is one record and is checked with check_invariants
+    against the already compiled rules. Each violation is written as an NDJSON
+    ``{"type": "violation", ...}`` line as soon as its record is scanned. A
+    final ``{"type": "summary", ...}`` line carries the totals, the gate
+    result and per-record latency (read to written) percentiles.
+    
+    Args:
+        in_stream: Text stream of records (e.g. sys.stdin)
+        out_stream: Text stream for NDJSON output (e.g. sys.stdout)
+        workspace: Workspace root for I2 file-existence checks
+        flush_ms: Maximum output buffering in milliseconds; 0 flushes every line
+        
+    Returns:
+        The summary record
+    """
+    from array import array
+    
+    writer = _NdjsonWriter(out_stream, flush_ms)
+    latencies = array('d')
+    records = 0
+    counts: Dict[str, Any] = {"ERROR": 0, "WARNING": 0, "INFO": 0}
+    by_invariant: Dict[str, int] = {}
+    start = time.perf_counter()
+    
+    try:
+        for line_num, line in enumerate(in_stream, 1):
+            received = time.perf_counter()
+            line = line.rstrip("\r\n")
+            if not line.strip():
+                continue
+            records += 1
+            
+            record_id = None
+            if line.lstrip().startswith("{"):
+                try:
+                    record_id = json.loads(line).get("id")
+                except (ValueError, AttributeError):
+                    pass
+            # Anchor fingerprints on the record id when there is one, so they
+            # survive records being reordered or interleaved
+            anchor = f"<stdin>#{record_id if record_id is not None else line_num}"
+            
+            for v in check_invariants(line, anchor, workspace):
+                counts[v.severity] = counts.get(v.severity, 0) + 1
+                by_invariant[v.invariant] = by_invariant.get(v.invariant, 0) + 1
+                violation = v.to_dict()
+                violation["location"] = {**violation["location"], "file": "<stdin>", "line": line_num}
+                header = {"type": "violation", "record": line_num}
+                if record_id is not None:
+                    header["record_id"] = record_id
+                writer.write({**header, **violation})
+            latencies.append(time.perf_counter() - received)
+        
+        gate_result, gate_reason = _gate_decision(
+            counts["ERROR"], counts["WARNING"], load_config().get("gate", {})
+        )
+        ordered = sorted(latencies)
+        summary = {
+            "type": "summary",
+            "records": records,
+            "total_violations": sum(counts.values()),
+            "errors": counts["ERROR"],
+            "warnings": counts["WARNING"],
+            "by_invariant": by_invariant,
+            "by_severity": counts,
+            "gate_result": gate_result,
+            "gate_reason": gate_reason,
+            "latency_ms": {
+                "p50": round(_percentile(ordered, 0.50) * 1000, 3),
+                "p99": round(_percentile(ordered, 0.99) * 1000, 3),
+                "max": round((ordered[-1] if ordered else 0.0) * 1000, 3)
+            },
+            "execution_time_ms": int((time.perf_counter() - start) * 1000)
+        }
+        writer.write(summary)
+    finally:
+        writer.close()
+    return summary
@@ -0,0 +1,73 @@
+"""
+Sharded runs merged with ``validator.py merge`` against an unsharded run.
+
+Run with: python -m pytest 02_CI_SAFETY_GATE/tests
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+GATE_DIR = Path(__file__).resolve().parent.parent
+SHARDS = 3
+
+
+def run_validator(*args):
+    """Run validator.py from the gate directory and return the process."""
+    return subprocess.run(
+        [sys.executable, "validator.py", *args],
+        cwd=GATE_DIR, capture_output=True, text=True, timeout=120
+    )
+
+
+def json_report(*args):
+    process = run_validator(*args, "--format", "json")
+    assert process.returncode in (0, 1), process.stderr
+    return json.loads(process.stdout)
+
+
+@pytest.fixture(scope="module")
+def partial_reports(tmp_path_factory):
+    """Paths of the partial reports of a SHARDS-way run over test_cases."""
+    out_dir = tmp_path_factory.mktemp("shards")
+    processes = [
+        subprocess.Popen(
+            [sys.executable, "validator.py", "test_cases", "--shard", f"{index}/{SHARDS}"],
+            cwd=GATE_DIR, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        )
+        for index in range(1, SHARDS + 1)
+    ]
+    paths = []
+    for index, process in enumerate(processes, start=1):
+        stdout, stderr = process.communicate(timeout=120)
+        assert process.returncode in (0, 1), stderr
+        path = out_dir / f"part-{index}.json"
+        path.write_text(stdout, encoding="utf-8")
+        paths.append(str(path))
+    return paths
+
+
+def test_merged_shards_match_unsharded_run(partial_reports):
+    unsharded = json_report("test_cases")
+    merged = json_report("merge", *partial_reports)
+
+    # Wall time is the only figure that differs between the two runs
+    summary = {key: value for key, value in merged["summary"].items() if key != "execution_time_ms"}
+    assert summary == {key: unsharded["summary"][key] for key in summary}
+    assert merged["summary"]["gate_result"] == unsharded["summary"]["gate_result"]
+    assert merged["report_id"] == unsharded["report_id"]
+    assert sorted(v["fingerprint"] for v in merged["violations"]) == \
+        sorted(v["fingerprint"] for v in unsharded["violations"])
+
+
+def test_missing_shard_fails_closed(partial_reports):
+    process = run_validator("merge", *partial_reports[1:], "--format", "json")
+    merged = json.loads(process.stdout)
+
+    assert process.returncode == 1
+    assert merged["summary"]["gate_result"] == "FAIL"
+    missing = [v for v in merged["violations"] if v["invariant"] == "SYSTEM"]
+    assert [v["location"]["file"] for v in missing] == [f"shard 1/{SHARDS}"]
@@ -0,0 +1,203 @@
+"""
+Cross-File Traceability for the PROACTIVE Safety Gate
+
+With ``I4_traceability_mandatory.cross_file: true``, validate_directory feeds
+every scanned file (archive members included) into a TraceIndex and resolves
+the REQ_id -> ... -> DECISION_id chains across the whole workspace once the
+scan is done, instead of requiring every file to carry the full chain.
+"""
+
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass
+
+# Handle both package import and direct execution
+try:
+    from .gate import (
+        Violation, ValidationResult, get_rules, assign_fingerprints, _generate_violation_id
+    )
+except ImportError:
+    from gate import (
+        Violation, ValidationResult, get_rules, assign_fingerprints, _generate_violation_id
+    )
+
+
+@dataclass
+class _TraceRecord:
+    """Trace fields of one record: ``ids`` maps chain position -> (id, line)."""
+    file_path: str
+    ids: Dict[int, Tuple[str, int]]
+    
+    @property
+    def own(self) -> int:
+        """Chain position of the id this record defines (its most downstream field)."""
+        return max(self.ids)
+    
+    @property
+    def upstream(self) -> int:
+        """Lowest chain position reachable from ``own`` without a gap."""
+        position = self.own
+        while position - 1 in self.ids:
+            position -= 1
+        return position
+
+
+class TraceIndex:
+    """Repository-wide index of trace ids for cross-file I4 checking.
+    
+    Every ``<FIELD>: <id>`` assignment of a required trace field is
+    collected in one sweep. Records are split where a field repeats, so a
+    JSON array or JSONL log yields one record per entry. A record defines
+    the id of its most downstream field (DECISION_id over EVID_id, ...) and
+    links upstream through the fields it carries below that. When the chain
+    stops short of the first field (REQ_id), the lowest id present must be
+    defined by another record, which continues the chain.
+    
+    ``resolve`` joins references against definitions through a hash map, so
+    the pass is linear in the number of records.
+    """
+    
+    def __init__(self, fields: List[str], field_regex: Any):
+        self.fields = fields
+        self._positions = {name.lower(): i for i, name in enumerate(fields)}
+        self._field_regex = field_regex
+        self.records: List[_TraceRecord] = []
+    
+    def add(self, content: str, file_path: str) -> None:
+        """Collect the trace records of one file."""
+        record: Dict[int, Tuple[str, int]] = {}
+        line, last = 1, 0
+        for match in self._field_regex.finditer(content):
+            value = match.group(2).rstrip(".:/-")
+            if not value or value.lower() in ("null", "none"):
+                continue
+            position = self._positions[match.group(1).lower()]
+            line += content.count('\n', last, match.start())
+            last = match.start()
+            if position in record:
+                self.records.append(_TraceRecord(file_path, record))
+                record = {}
+            record[position] = (value, line)
+        if record:
+            self.records.append(_TraceRecord(file_path, record))
+    
+    def resolve(self) -> Tuple[List[Violation], set]:
+        """Find the chains that do not reach the first trace field.
+        
+        Returns:
+            Tuple of (I4 violations, files whose every record resolves to a
+            complete chain). Each dangling reference is reported once at the
+            referencing line, with the record it belongs to and the chain
+            origins that depend on it; a referenced record that has no
+            upstream field is reported at its definition.
+        """
+        definitions: Dict[Tuple[int, str], _TraceRecord] = {}
+        for record in self.records:
+            definitions.setdefault((record.own, record.ids[record.own][0]), record)
+        
+        # record index -> None (complete) or the break: ("dangling", record
+        # holding the reference) / ("broken", record without upstream field)
+        memo: Dict[int, Optional[Tuple[str, _TraceRecord]]] = {}
+        
+        def chain_break(record: _TraceRecord) -> Optional[Tuple[str, _TraceRecord]]:
+            key = id(record)
+            if key not in memo:
+                upstream = record.upstream
+                if upstream == 0:
+                    memo[key] = None
+                elif upstream == record.own:
+                    memo[key] = ("broken", record)
+                else:
+                    target = definitions.get((upstream, record.ids[upstream][0]))
+                    # Chain positions strictly decrease, so this recursion is
+                    # at most len(fields) deep
+                    memo[key] = ("dangling", record) if target is None else chain_break(target)
+            return memo[key]
+        
+        breaks: Dict[Tuple[str, int], Tuple[str, _TraceRecord, List[_TraceRecord]]] = {}
+        unresolved_files = set()
+        for record in self.records:
+            found = chain_break(record)
+            if found is None:
+                continue
+            unresolved_files.add(record.file_path)
+            kind, at = found
+            if kind == "broken" and at is record:
+                # A record with no upstream field at all is the per-file
+                # check's finding; report it here only when others depend on it
+                continue
+            breaks.setdefault((kind, id(at)), (kind, at, []))[2].append(record)
+        
+        rules = get_rules()
+        severity = rules.invariants["I4"]["severity"]
+        violations = []
+        for kind, at, origins in breaks.values():
+            own_id, own_line = at.ids[at.own]
+            origin_list = [
+                {"id": o.ids[o.own][0], "file": o.file_path, "line": o.ids[o.own][1]} for o in origins[:5]
+            ]
+            if kind == "dangling":
+                field_name = self.fields[at.upstream]
+                ref_id, ref_line = at.ids[at.upstream]
+                violations.append(Violation(
+                    violation_id=_generate_violation_id(),
+                    invariant="I4",
+                    severity=severity,
+                    location={"file": at.file_path, "line": ref_line},
+                    message=f"I4 Violation: {field_name} '{ref_id}' referenced by '{own_id}' is not defined in any file",
+                    suggested_fix=f"Add the record defining {field_name} '{ref_id}' or fix the reference",
+                    evidence={
+                        "matched_text": f"{field_name}: {ref_id}",
+                        "referenced_by": {"id": own_id, "file": at.file_path, "line": own_line},
+                        "chain_origins": origin_list,
+                        "affected_chains": len(origins)
+                    },
+                    rule_id="I4_dangling_trace_reference"
+                ))
+            else:
+                missing = self.fields[at.own - 1]
+                # Prefer a record that names this id directly over a later link
+                referrer = next((o for o in origins if o.ids.get(at.own, ("",))[0] == own_id), origins[0])
+                ref_line = referrer.ids[at.own][1] if at.own in referrer.ids else referrer.ids[referrer.own][1]
+                violations.append(Violation(
+                    violation_id=_generate_violation_id(),
+                    invariant="I4",
+                    severity=severity,
+                    location={"file": at.file_path, "line": own_line},
+                    message=f"I4 Violation: '{own_id}' is referenced but has no {missing} link; "
+                            f"trace chain is broken",
+                    suggested_fix=f"Add {missing} to the record defining '{own_id}'",
+                    evidence={
+                        "missing_field": f"{own_id} -> {missing}",
+                        "referenced_by": {"id": referrer.ids[referrer.own][0], "file": referrer.file_path,
+                                          "line": ref_line},
+                        "chain_origins": origin_list,
+                        "affected_chains": len(origins)
+                    },
+                    rule_id="I4_broken_trace_chain"
+                ))
+        
+        resolved_files = {r.file_path for r in self.records} - unresolved_files
+        return assign_fingerprints(violations), resolved_files
+
+
+def apply_trace_index(results: List[ValidationResult], index: TraceIndex) -> List[ValidationResult]:
+    """Add cross-file I4 findings to per-file results.
+    
+    Per-file missing-trace-field violations are dropped for files whose
+    chains all resolve through other files; violations of the index are
+    attached to the result of the file they point at. A violation whose
+    file has no result gets a result of its own, so it still counts toward
+    the gate.
+    """
+    violations, resolved_files = index.resolve()
+    by_file: Dict[str, List[Violation]] = {}
+    for violation in violations:
+        by_file.setdefault(violation.location["file"], []).append(violation)
+    
+    for result in results:
+        if result.file_path in resolved_files:
+            result.violations = [v for v in result.violations if v.rule_id != "I4_missing_trace_field"]
+        result.violations.extend(by_file.pop(result.file_path, []))
+    for file_path, leftover in by_file.items():
+        results.append(ValidationResult(file_path=file_path, violations=leftover))
+    return results
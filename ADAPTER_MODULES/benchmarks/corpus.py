@@ -0,0 +1,224 @@
+"""
+Synthetic Corpus Generators for the Benchmarks
+
+Builds inputs for both adapters at configurable scale with a fixed seed, so
+two runs over the same parameters see byte-identical corpora:
+
+- trace logs for the W&B Trace Adapter with a controlled failure-mode mix
+- directory trees for the CI Safety Gate with a controlled violation density
+
+Usage:
+    python corpus.py trace-log out/traces.json --entries 100000 --mix none=0.7,F1=0.1,F2=0.1,F4=0.1
+    python corpus.py tree out/workspace --files 2000 --density 0.05
+"""
+
+import json
+import random
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+CHECKS = ["I1_check", "I2_check", "I3_check", "I4_check", "I5_check", "I6_check"]
+TAGS = ["OBSERVED", "INFERRED", "SPECULATED"]
+TRACE_FIELDS = ["REQ_id", "CTRL_id", "TEST_id", "EVID_id", "DECISION_id"]
+
+# Validator checks that fail for each failure mode ("none" is a clean entry)
+FAILURE_CHECKS = {
+    "none": [],
+    "F1": ["I1_check", "I3_check"],
+    "F2": ["I2_check"],
+    "F3": ["I5_check"],
+    "F4": ["I4_check"],
+    "F5": ["I6_check"],
+}
+
+DEFAULT_MIX = {"none": 0.7, "F1": 0.08, "F2": 0.08, "F3": 0.04, "F4": 0.06, "F5": 0.04}
+
+WORDS = [
+    "the", "cache", "handler", "returns", "sum", "of", "items", "request",
+    "module", "config", "value", "parser", "result", "queue", "worker", "index"
+]
+
+# Text that triggers one invariant each under the shipped validator_config.yaml
+VIOLATION_SNIPPETS = {
+    "I1": "This fix will definitely resolve the outage.",
+    "I2": "I have created the file 'missing_report.pdf' with the results.",
+    "I3": "Prediction made with confidence: 0.97 for this release.",
+    "I4": "The team decided to roll back the deployment.",
+    "I5": "It seems like the answer, with high confidence.",
+    "I6": "We can ignore the error and continue.",
+}
+
+CLEAN_SNIPPETS = [
+    "Latency measurements are attached for review.",
+    "The queue depth stayed within the configured bounds.",
+    "Parser output matches the recorded fixture.",
+]
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """Parse ``none=0.7,F1=0.1`` into a failure-mode mix."""
+    mix = {}
+    for item in spec.split(","):
+        key, _, weight = item.partition("=")
+        key = key.strip()
+        if key not in FAILURE_CHECKS:
+            raise ValueError(f"Unknown failure mode in mix: {key} (expected one of {list(FAILURE_CHECKS)})")
+        mix[key] = float(weight)
+    return mix
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def generate_trace_log(
+    entries: int,
+    mix: Optional[Dict[str, float]] = None,
+    long_text_ratio: float = 0.1,
+    seed: int = 0
+) -> List[Dict[str, Any]]:
+    """Synthetic trace log entries that pass schema validation.
+
+    Args:
+        entries: Number of entries
+        mix: Failure mode -> relative weight (see FAILURE_CHECKS); defaults
+            to DEFAULT_MIX
+        long_text_ratio: Fraction of claims longer than the default
+            max_claim_text_length
+        seed: Random seed
+
+    Returns:
+        List of entries, round-tripped through JSON like a parsed log
+    """
+    rng = random.Random(seed)
+    mix = mix or DEFAULT_MIX
+    modes = list(mix)
+    weights = [mix[m] for m in modes]
+
+    log = []
+    for i in range(entries):
+        mode = rng.choices(modes, weights)[0]
+        failing = FAILURE_CHECKS[mode]
+        chain = {f: f"{f.split('_')[0]}-{i:06d}" for f in TRACE_FIELDS}
+        chain["REQ_id"] = f"REQ-{rng.randint(1, 200):03d}"
+        if mode == "F4":
+            for f in rng.sample(TRACE_FIELDS[1:4], rng.randint(1, 3)):
+                chain[f] = None
+
+        log.append({
+            "claim_id": f"00000000-0000-4000-8000-{i:012d}",
+            "timestamp": f"2026-01-{1 + i // 86400 % 28:02d}T{i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}.000Z",
+            "prompt_hash": f"{rng.getrandbits(256):064x}",
+            "claim_text": _sentence(rng, rng.randint(90, 160) if rng.random() < long_text_ratio else rng.randint(8, 24)),
+            "confidence_score": round(rng.uniform(0.85, 0.99) if mode == "F1" else rng.random(), 3),
+            "epistemic_tag": rng.choice(TAGS),
+            "evidence_sources": [f"file://src/{rng.choice(WORDS)}.py:{j * 10}" for j in range(rng.randint(0, 3))],
+            "validator_results": {
+                check: "FAIL" if check in failing else rng.choice(["PASS", "PASS", "PASS", "SKIP"])
+                for check in CHECKS
+            },
+            "trace_chain": chain,
+            "principle_tags": ["O"],
+            "failure_mode": None if mode == "none" else mode,
+            "final_decision": "EMIT" if mode == "none" else rng.choice(["BLOCK", "ESCALATE"])
+        })
+    return json.loads(json.dumps(log))
+
+
+def write_trace_log(path: str, entries: int, **kwargs) -> str:
+    """Generate a trace log and write it as a JSON array."""
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with open(target, 'w', encoding='utf-8') as f:
+        json.dump(generate_trace_log(entries, **kwargs), f)
+    return str(target)
+
+
+def generate_tree(
+    root: str,
+    files: int,
+    density: float = 0.05,
+    lines_per_file: int = 40,
+    fanout: int = 20,
+    seed: int = 0
+) -> Dict[str, Any]:
+    """Write a workspace of model-output JSON files for the safety gate.
+
+    Each file holds ``lines_per_file`` claim records; a fraction ``density``
+    of the records carries one snippet that violates an invariant (rotating
+    through I1-I6), the rest are clean.
+
+    Args:
+        root: Directory to create
+        files: Number of files
+        density: Fraction of records containing a violation
+        lines_per_file: Records per file
+        fanout: Files per subdirectory
+        seed: Random seed
+
+    Returns:
+        Summary with ``files``, ``bytes``, ``records`` and planted
+        ``violations`` per invariant
+    """
+    rng = random.Random(seed)
+    root_path = Path(root)
+    invariants = list(VIOLATION_SNIPPETS)
+    planted = {inv: 0 for inv in invariants}
+    total_bytes = 0
+
+    for i in range(files):
+        records = []
+        for j in range(lines_per_file):
+            if rng.random() < density:
+                invariant = invariants[(i * lines_per_file + j) % len(invariants)]
+                planted[invariant] += 1
+                text = f"{_sentence(rng, 10)} {VIOLATION_SNIPPETS[invariant]}"
+            else:
+                text = f"{_sentence(rng, 10)} {rng.choice(CLEAN_SNIPPETS)}"
+            records.append({"id": f"out-{i:06d}-{j:03d}", "text": text})
+
+        path = root_path / f"outputs_{i // fanout:04d}" / f"result_{i:06d}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        content = json.dumps(records, indent=1)
+        path.write_text(content, encoding='utf-8')
+        total_bytes += len(content.encode('utf-8'))
+
+    return {
+        "files": files,
+        "bytes": total_bytes,
+        "records": files * lines_per_file,
+        "violations": planted
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate synthetic PROACTIVE benchmark corpora")
+    sub = parser.add_subparsers(dest="kind", required=True)
+
+    log_parser = sub.add_parser("trace-log", help="Trace log JSON for the W&B adapter")
+    log_parser.add_argument("path", help="Output JSON file")
+    log_parser.add_argument("--entries", "-n", type=int, default=10000, help="Entries (default: 10000)")
+    log_parser.add_argument("--mix", default=None, help="Failure-mode mix, e.g. none=0.8,F2=0.2")
+    log_parser.add_argument("--long-text-ratio", type=float, default=0.1,
+                            help="Fraction of long claim texts (default: 0.1)")
+    log_parser.add_argument("--seed", type=int, default=0)
+
+    tree_parser = sub.add_parser("tree", help="Workspace tree for the CI safety gate")
+    tree_parser.add_argument("root", help="Output directory")
+    tree_parser.add_argument("--files", "-n", type=int, default=1000, help="Files (default: 1000)")
+    tree_parser.add_argument("--density", type=float, default=0.05,
+                             help="Fraction of records with a violation (default: 0.05)")
+    tree_parser.add_argument("--lines-per-file", type=int, default=40)
+    tree_parser.add_argument("--seed", type=int, default=0)
+
+    args = parser.parse_args()
+
+    if args.kind == "trace-log":
+        mix = parse_mix(args.mix) if args.mix else None
+        print(write_trace_log(args.path, args.entries, mix=mix,
+                              long_text_ratio=args.long_text_ratio, seed=args.seed))
+    else:
+        print(json.dumps(generate_tree(args.root, args.files, args.density,
+                                       args.lines_per_file, seed=args.seed), indent=2))
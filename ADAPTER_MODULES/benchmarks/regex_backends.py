@@ -0,0 +1,168 @@
+"""
+Regex Backend Benchmark for the CI Safety Gate
+
+Times check_invariants under every installed regex backend (re, regex,
+google-re2; see validator.RegexBackend) on three inputs:
+
+    shipped      generated workspace, shipped validator_config.yaml
+    lazy_dotall  one long document full of I6 trigger words with no closing
+                 word, so every lazy ``.*?`` scans to the end (quadratic in re)
+    nested       a user pattern with a nested quantifier, ``(\\w+\\s?)+:$``,
+                 against a near-miss input (exponential in re)
+
+Violation counts are printed next to the timings so backend differences in
+results are visible, as are patterns that fell back to ``re``.
+
+Usage: python regex_backends.py [--files N] [--lazy-size N] [--nested-size N] [--json]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+MODULES_DIR = Path(__file__).resolve().parent.parent
+GATE_DIR = MODULES_DIR / "02_CI_SAFETY_GATE"
+sys.path.insert(0, str(GATE_DIR))
+
+import validator  # noqa: E402
+from corpus import generate_tree  # noqa: E402
+from suite import summarize, time_call  # noqa: E402
+
+NESTED_PATTERN = {"pattern": r"(\w+\s?)+:$", "message": "Nested quantifier (adversarial)"}
+
+
+def _load_config(path: Path) -> Dict[str, Any]:
+    import yaml
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
+
+def _use_rules(config_path: str, backend: str) -> validator.CompiledRules:
+    """Load ``config_path`` compiled with ``backend`` as the active rule set."""
+    os.environ[validator.REGEX_BACKEND_ENV] = backend
+    validator.reset_config()
+    return validator.get_rules(config_path)
+
+
+def _cases(workspace: Path, files: int, lazy_size: int, nested_size: int) -> List[Tuple[str, List[Tuple[str, str]], bool]]:
+    """(name, [(path, content)], uses nested pattern) for every input."""
+    generate_tree(str(workspace), files)
+    shipped = [(str(p), p.read_text(encoding='utf-8')) for p in sorted(workspace.rglob("*.json"))]
+    lazy = [("lazy_dotall.txt", "error " * lazy_size)]
+    nested = [("nested.txt", "a" * nested_size + "!")]
+    return [("shipped", shipped, False), ("lazy_dotall", lazy, False), ("nested", nested, True)]
+
+
+def run(
+    files: int = 200,
+    lazy_size: int = 1500,
+    nested_size: int = 20,
+    repeat: int = 3,
+    backends: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Time every case under every backend.
+
+    Returns:
+        Results dictionary (``results[backend][case]`` -> timing summary)
+    """
+    backends = backends or validator.available_regex_backends()
+    shipped_config = _load_config(GATE_DIR / "validator_config.yaml")
+    nested_config = json.loads(json.dumps(shipped_config))
+    nested_config["invariants"]["I5_safety_over_fluency"]["patterns"].append(NESTED_PATTERN)
+    saved_env = {k: os.environ.get(k) for k in (validator.REGEX_BACKEND_ENV, validator.CONFIG_CACHE_ENV)}
+    # Measure parsing and compilation, not the config cache
+    os.environ[validator.CONFIG_CACHE_ENV] = ""
+
+    results: Dict[str, Dict[str, Any]] = {}
+    try:
+        with tempfile.TemporaryDirectory(prefix="proactive-regex-") as tmp:
+            cases = _cases(Path(tmp) / "workspace", files, lazy_size, nested_size)
+            config_paths = {}
+            for nested, config in ((False, shipped_config), (True, nested_config)):
+                # JSON is valid YAML, so the dumped configs load like the shipped one
+                config_paths[nested] = str(Path(tmp) / f"config-{int(nested)}.yaml")
+                Path(config_paths[nested]).write_text(json.dumps(config), encoding='utf-8')
+
+            for backend in backends:
+                results[backend] = {}
+                for name, contents, nested in cases:
+                    start = time.perf_counter()
+                    rules = _use_rules(config_paths[nested], backend)
+                    compile_s = time.perf_counter() - start
+
+                    violations = sum(len(validator.check_invariants(c, p, tmp)) for p, c in contents)
+                    samples = time_call(
+                        lambda: [validator.check_invariants(c, p, tmp) for p, c in contents], repeat
+                    )
+                    nbytes = sum(len(c.encode('utf-8')) for _, c in contents)
+                    summary = summarize(samples)
+                    results[backend][name] = {
+                        **summary,
+                        "backend": rules.backend,
+                        "compile_ms": round(compile_s * 1000, 3),
+                        "bytes": nbytes,
+                        "mb_per_s": round(nbytes / (summary["median_s"] or 1e-9) / 1e6, 3),
+                        "violations": violations,
+                        "fallbacks": [f"{owner}: {pattern}" for owner, pattern, _ in rules.fallbacks]
+                    }
+    finally:
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        validator.reset_config()
+
+    return {
+        "params": {"files": files, "lazy_size": lazy_size, "nested_size": nested_size, "repeat": repeat},
+        "results": results
+    }
+
+
+def main(
+    files: int = 200,
+    lazy_size: int = 1500,
+    nested_size: int = 20,
+    repeat: int = 3,
+    backends: Optional[List[str]] = None,
+    as_json: bool = False
+) -> Dict[str, Any]:
+    """Run the comparison and print a table (or JSON)."""
+    data = run(files, lazy_size, nested_size, repeat, backends)
+    if as_json:
+        print(json.dumps(data, indent=2))
+        return data
+
+    params = data["params"]
+    print(f"files={params['files']} lazy_size={params['lazy_size']} "
+          f"nested_size={params['nested_size']} repeat={params['repeat']}")
+    print(f"  {'backend':<8} {'case':<12} {'median':>10} {'MB/s':>9} {'compile':>9} {'violations':>11}")
+    for backend, cases in data["results"].items():
+        for name, r in cases.items():
+            print(f"  {backend:<8} {name:<12} {r['median_s'] * 1000:>8.1f}ms {r['mb_per_s']:>9.2f} "
+                  f"{r['compile_ms']:>7.1f}ms {r['violations']:>11}")
+            for fallback in r["fallbacks"]:
+                print(f"  {'':<8} {'':<12} fell back to re: {fallback}")
+    return data
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compare regex backends for the PROACTIVE validator")
+    parser.add_argument("--files", type=int, default=200, help="Files in the shipped-config workspace (default: 200)")
+    parser.add_argument("--lazy-size", type=int, default=1500,
+                        help="Trigger words in the lazy .*? document (default: 1500)")
+    parser.add_argument("--nested-size", type=int, default=20,
+                        help="Length of the nested-quantifier near miss; re time doubles per step (default: 20)")
+    parser.add_argument("--repeat", "-n", type=int, default=3, help="Timed runs per case (default: 3)")
+    parser.add_argument("--backend", action="append", default=None,
+                        help="Backend to include (repeatable; default: every installed backend)")
+    parser.add_argument("--json", action="store_true", help="Emit results as JSON")
+
+    args = parser.parse_args()
+    main(args.files, args.lazy_size, args.nested_size, args.repeat, args.backend, args.json)
@@ -0,0 +1,107 @@
+"""
+Row Memory Benchmark for convert_to_wandb_table
+
+Compares bytes per row retained by the converted trace table against the
+previous list-of-lists representation (one Python list per row, a truncated
+copy of every long claim text, one reference per enum value).
+
+Entries are generated and parsed before measurement starts, so only memory
+owned by the table is counted (via ``tracemalloc``).
+
+Usage: python row_memory.py [--rows N] [--long-text-ratio R] [--json]
+"""
+
+import json
+import sys
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Callable
+
+MODULES_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(MODULES_DIR / "01_WANDB_TRACE_ADAPTER"))
+
+from adapter import convert_to_wandb_table  # noqa: E402
+from config import DEFAULT_CONFIG  # noqa: E402
+from corpus import generate_trace_log  # noqa: E402
+
+
+def legacy_rows(trace_entries: List[Dict[str, Any]]) -> List[List[Any]]:
+    """The list-of-lists rows convert_to_wandb_table used to build."""
+    max_length = DEFAULT_CONFIG.max_claim_text_length
+    rows = []
+    for entry in trace_entries:
+        validator = entry.get("validator_results", {})
+        trace = entry.get("trace_chain", {})
+        claim_text = entry.get("claim_text", "")
+        if len(claim_text) > max_length:
+            claim_text = claim_text[:max_length] + "..."
+        row = [
+            entry.get("claim_id", "UNKNOWN"),
+            entry.get("timestamp", datetime.now().isoformat()),
+            claim_text,
+            entry.get("confidence_score", 0.0),
+            entry.get("epistemic_tag", "UNKNOWN"),
+        ]
+        row.extend(validator.get(f"I{n}_check", "SKIP") for n in range(1, 7))
+        row.extend([
+            entry.get("failure_mode") or "none",
+            entry.get("final_decision", "UNKNOWN"),
+            len(entry.get("evidence_sources", [])),
+            trace.get("REQ_id", "MISSING"),
+            all(trace.get(k) for k in ("REQ_id", "CTRL_id", "TEST_id", "EVID_id", "DECISION_id"))
+        ])
+        rows.append(row)
+    return rows
+
+
+def measure(build: Callable[[], Any]) -> Dict[str, int]:
+    """Bytes retained by and peak bytes allocated while building a table."""
+    tracemalloc.start()
+    try:
+        table = build()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del table
+    return {"retained_bytes": retained, "peak_bytes": peak}
+
+
+def main(rows: int = 100_000, long_text_ratio: float = 0.2, as_json: bool = False) -> Dict[str, Any]:
+    """Run the benchmark and print bytes per row for both representations."""
+    entries = generate_trace_log(rows, long_text_ratio=long_text_ratio)
+    results = {
+        "rows": rows,
+        "long_text_ratio": long_text_ratio,
+        "list_of_lists": measure(lambda: legacy_rows(entries)),
+        "compact": measure(lambda: convert_to_wandb_table(entries))
+    }
+    for name in ("list_of_lists", "compact"):
+        results[name]["bytes_per_row"] = round(results[name]["retained_bytes"] / rows, 1)
+    results["reduction"] = round(
+        1 - results["compact"]["bytes_per_row"] / results["list_of_lists"]["bytes_per_row"], 3
+    )
+
+    if as_json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{rows} rows, {long_text_ratio:.0%} with claim_text over "
+              f"{DEFAULT_CONFIG.max_claim_text_length} chars")
+        for name in ("list_of_lists", "compact"):
+            r = results[name]
+            print(f"  {name:<14} {r['bytes_per_row']:>8} bytes/row  (peak {r['peak_bytes'] / 1e6:.1f} MB)")
+        print(f"  reduction      {results['reduction']:.1%}")
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Bytes per row of converted trace tables")
+    parser.add_argument("--rows", "-n", type=int, default=100_000, help="Synthetic rows (default: 100000)")
+    parser.add_argument("--long-text-ratio", type=float, default=0.2,
+                        help="Fraction of claims longer than max_claim_text_length (default: 0.2)")
+    parser.add_argument("--json", action="store_true", help="Emit results as JSON")
+
+    args = parser.parse_args()
+    main(args.rows, args.long_text_ratio, args.json)
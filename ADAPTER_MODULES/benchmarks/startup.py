@@ -0,0 +1,141 @@
+"""
+Cold-start Benchmark for the PROACTIVE Adapters
+
+Measures CLI startup of the validation-only code paths using
+``python -X importtime`` (per-module import cost) and wall-clock time over
+repeated fresh interpreter launches.
+
+Usage: python startup.py [--repeat N] [--budget-ms MS] [--json]
+
+Exit code is 1 if the median cold start of any target exceeds the budget.
+
+Each target is launched once untimed first, with bytecode writing enabled
+even under PYTHONDONTWRITEBYTECODE, so the timed launches load cached
+bytecode like an installed copy does. Only the entry scripts themselves
+are compiled on every launch, which is why they stay thin.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from statistics import median
+from typing import Dict, List, Any
+
+MODULES_DIR = Path(__file__).resolve().parent.parent
+GATE_DIR = MODULES_DIR / "02_CI_SAFETY_GATE"
+ADAPTER_DIR = MODULES_DIR / "01_WANDB_TRACE_ADAPTER"
+
+# (name, working directory, argv) for each validation-only entry point
+TARGETS = [
+    ("validator", GATE_DIR,
+     ["validator.py", "test_cases/tc07_clean_output.json", "--format", "json"]),
+    ("adapter", ADAPTER_DIR,
+     ["adapter.py", "sample_input.json", "--validate-only"]),
+]
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """Parse ``-X importtime`` output into per-module records.
+
+    Each record has ``module``, ``self_us``, ``cumulative_us`` and ``depth``
+    (nesting level; 0 for modules imported directly by the script).
+    """
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|", 2)
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        records.append({
+            "module": name.strip(),
+            "self_us": int(self_us.strip()),
+            "cumulative_us": int(cumulative_us.strip()),
+            "depth": depth
+        })
+    return records
+
+
+def measure_target(cwd: Path, argv: List[str], repeat: int) -> Dict[str, Any]:
+    """Measure wall-clock cold start and import profile for one entry point."""
+    # Warm-up launch: writes the __pycache__ entries the timed launches read
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    subprocess.run([sys.executable] + argv, cwd=cwd, capture_output=True, env=env)
+
+    wall_ms = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + argv, cwd=cwd, capture_output=True)
+        wall_ms.append((time.perf_counter() - start) * 1000)
+
+    profile = subprocess.run(
+        [sys.executable, "-X", "importtime"] + argv, cwd=cwd, capture_output=True, text=True
+    )
+    records = parse_importtime(profile.stderr)
+    top_level = sorted(
+        (r for r in records if r["depth"] == 0),
+        key=lambda r: r["cumulative_us"],
+        reverse=True
+    )
+
+    return {
+        "median_ms": round(median(wall_ms), 2),
+        "min_ms": round(min(wall_ms), 2),
+        "max_ms": round(max(wall_ms), 2),
+        "import_total_ms": round(sum(r["cumulative_us"] for r in top_level) / 1000, 2),
+        "top_imports": [
+            {"module": r["module"], "cumulative_ms": round(r["cumulative_us"] / 1000, 2)}
+            for r in top_level[:10]
+        ]
+    }
+
+
+def measure_interpreter(repeat: int) -> float:
+    """Median wall-clock time of a bare interpreter launch (the floor)."""
+    wall_ms = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], capture_output=True)
+        wall_ms.append((time.perf_counter() - start) * 1000)
+    return round(median(wall_ms), 2)
+
+
+def main(repeat: int = 10, budget_ms: float = 100.0, as_json: bool = False) -> int:
+    """Run the startup benchmark and return an exit code."""
+    results = {
+        "python": sys.version.split()[0],
+        "budget_ms": budget_ms,
+        "interpreter_ms": measure_interpreter(repeat),
+        "targets": {name: measure_target(cwd, argv, repeat) for name, cwd, argv in TARGETS}
+    }
+    over_budget = [name for name, r in results["targets"].items() if r["median_ms"] > budget_ms]
+
+    if as_json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"Interpreter floor: {results['interpreter_ms']} ms (python {results['python']})")
+        for name, r in results["targets"].items():
+            status = "OVER BUDGET" if name in over_budget else "ok"
+            print(f"\n{name}: median {r['median_ms']} ms "
+                  f"(min {r['min_ms']}, max {r['max_ms']}) [{status}]")
+            print(f"  imports: {r['import_total_ms']} ms")
+            for imp in r["top_imports"]:
+                print(f"    {imp['module']:<30} {imp['cumulative_ms']:>8} ms")
+
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Cold-start benchmark for the PROACTIVE adapters")
+    parser.add_argument("--repeat", "-n", type=int, default=10,
+                        help="Interpreter launches per target (default: 10)")
+    parser.add_argument("--budget-ms", type=float, default=100.0,
+                        help="Median cold-start budget per target in ms (default: 100)")
+    parser.add_argument("--json", action="store_true", help="Emit results as JSON")
+
+    args = parser.parse_args()
+    sys.exit(main(args.repeat, args.budget_ms, args.json))
@@ -0,0 +1,228 @@
+"""
+Throughput Benchmark Suite for the PROACTIVE Adapters
+
+Times the hot paths of both adapters on synthetic corpora (see corpus.py):
+
+    validate_directory       CI gate, full scan of a generated workspace
+    check_invariants         CI gate, I1-I6 on preloaded file contents
+    load_trace_log           trace adapter, JSON parse of a generated log
+    validate_all             trace adapter, schema validation
+    convert_to_wandb_table   trace adapter, row conversion + aggregates
+
+Every benchmark runs ``--repeat`` times after one warm-up run; results keep
+all samples plus the median and interquartile range. ``--save-baseline``
+stores the results as the reference later runs are compared against.
+
+Usage:
+    python suite.py                          # run, compare with baseline.json
+    python suite.py --save-baseline          # run and overwrite baseline.json
+    python suite.py --files 2000 --entries 100000 --repeat 7 --out results.json
+"""
+
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Dict, Any, Callable, Optional
+
+MODULES_DIR = Path(__file__).resolve().parent.parent
+GATE_DIR = MODULES_DIR / "02_CI_SAFETY_GATE"
+ADAPTER_DIR = MODULES_DIR / "01_WANDB_TRACE_ADAPTER"
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+sys.path.insert(0, str(GATE_DIR))
+sys.path.insert(0, str(ADAPTER_DIR))
+
+import validator  # noqa: E402
+import adapter  # noqa: E402
+from aggregates import TraceAggregates  # noqa: E402
+from corpus import generate_tree, write_trace_log  # noqa: E402
+
+RESULTS_FORMAT = "proactive-benchmarks"
+RESULTS_VERSION = 1
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Median and interquartile range of timing samples (seconds)."""
+    median = statistics.median(samples)
+    if len(samples) >= 2:
+        q1, _, q3 = statistics.quantiles(samples, n=4, method="inclusive")
+    else:
+        q1 = q3 = median
+    return {
+        "median_s": round(median, 6),
+        "iqr_s": round(q3 - q1, 6),
+        "min_s": round(min(samples), 6),
+        "max_s": round(max(samples), 6)
+    }
+
+
+def time_call(fn: Callable[[], Any], repeat: int) -> List[float]:
+    """Run ``fn`` once to warm up, then ``repeat`` timed times."""
+    fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _result(samples: List[float], items: int, unit: str, nbytes: Optional[int] = None) -> Dict[str, Any]:
+    result: Dict[str, Any] = {"samples_s": [round(s, 6) for s in samples], **summarize(samples)}
+    median = result["median_s"] or 1e-9
+    result["items"] = items
+    result["unit"] = unit
+    result["items_per_s"] = round(items / median, 1)
+    if nbytes is not None:
+        result["bytes"] = nbytes
+        result["mb_per_s"] = round(nbytes / median / 1e6, 3)
+    return result
+
+
+def run_suite(
+    files: int = 500,
+    entries: int = 20000,
+    density: float = 0.05,
+    repeat: int = 5,
+    seed: int = 0
+) -> Dict[str, Any]:
+    """Generate corpora in a temporary directory and time every benchmark.
+
+    Returns:
+        Results dictionary (``benchmarks`` maps name -> timing summary)
+    """
+    validator.reset_config()
+    validator.load_config(str(GATE_DIR / "validator_config.yaml"))
+    benchmarks: Dict[str, Dict[str, Any]] = {}
+
+    with tempfile.TemporaryDirectory(prefix="proactive-bench-") as tmp:
+        workspace = Path(tmp) / "workspace"
+        tree = generate_tree(str(workspace), files, density, seed=seed)
+        contents = [(str(p), p.read_text(encoding='utf-8')) for p in sorted(workspace.rglob("*.json"))]
+
+        samples = time_call(lambda: validator.validate_directory(str(workspace)), repeat)
+        benchmarks["validate_directory"] = _result(samples, tree["files"], "files", tree["bytes"])
+
+        def scan_contents():
+            for path, content in contents:
+                validator.check_invariants(content, path, str(workspace))
+
+        samples = time_call(scan_contents, repeat)
+        benchmarks["check_invariants"] = _result(samples, tree["files"], "files", tree["bytes"])
+
+        log_path = write_trace_log(str(Path(tmp) / "trace_log.json"), entries, seed=seed)
+        log_bytes = Path(log_path).stat().st_size
+
+        samples = time_call(lambda: adapter.load_trace_log(log_path), repeat)
+        benchmarks["load_trace_log"] = _result(samples, entries, "entries", log_bytes)
+
+        log = adapter.load_trace_log(log_path)
+        samples = time_call(lambda: adapter.validate_all(log), repeat)
+        benchmarks["validate_all"] = _result(samples, entries, "entries")
+
+        samples = time_call(lambda: adapter.convert_to_wandb_table(log, aggregates=TraceAggregates()), repeat)
+        benchmarks["convert_to_wandb_table"] = _result(samples, entries, "rows")
+
+    return {
+        "format": RESULTS_FORMAT,
+        "version": RESULTS_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "params": {"files": files, "entries": entries, "density": density, "repeat": repeat, "seed": seed},
+        "benchmarks": benchmarks
+    }
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """Read a results or baseline file written by this suite."""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get("format") != RESULTS_FORMAT or data.get("version") != RESULTS_VERSION:
+        raise ValueError(f"Not a benchmark results file (version {RESULTS_VERSION}): {path}")
+    return data
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any]) -> Dict[str, Optional[float]]:
+    """Relative throughput change per benchmark (negative is slower)."""
+    changes: Dict[str, Optional[float]] = {}
+    for name, result in results["benchmarks"].items():
+        reference = baseline["benchmarks"].get(name)
+        if not reference or not reference.get("items_per_s"):
+            changes[name] = None
+            continue
+        changes[name] = round(result["items_per_s"] / reference["items_per_s"] - 1, 4)
+    return changes
+
+
+def print_results(results: Dict[str, Any], changes: Optional[Dict[str, Optional[float]]] = None) -> None:
+    params = results["params"]
+    print(f"python {results['python']}  files={params['files']} entries={params['entries']} "
+          f"density={params['density']} repeat={params['repeat']}")
+    print(f"  {'benchmark':<24} {'median':>10} {'iqr':>9} {'throughput':>20} {'MB/s':>8}"
+          + (f" {'vs base':>8}" if changes is not None else ""))
+    for name, r in results["benchmarks"].items():
+        rate = f"{r['items_per_s']:,.0f} {r['unit']}/s"
+        mbps = f"{r['mb_per_s']:.2f}" if "mb_per_s" in r else "-"
+        line = f"  {name:<24} {r['median_s'] * 1000:>8.1f}ms {r['iqr_s'] * 1000:>7.1f}ms {rate:>20} {mbps:>8}"
+        if changes is not None:
+            change = changes.get(name)
+            line += f" {change:>+8.1%}" if change is not None else f" {'n/a':>8}"
+        print(line)
+
+
+def main(
+    files: int = 500,
+    entries: int = 20000,
+    density: float = 0.05,
+    repeat: int = 5,
+    out: Optional[str] = None,
+    baseline: Optional[str] = None,
+    save_baseline: bool = False,
+    as_json: bool = False
+) -> Dict[str, Any]:
+    """Run the suite, write results and compare against the baseline."""
+    baseline_path = Path(baseline) if baseline else DEFAULT_BASELINE
+    results = run_suite(files, entries, density, repeat)
+
+    if out:
+        Path(out).write_text(json.dumps(results, indent=2), encoding='utf-8')
+    if save_baseline:
+        baseline_path.write_text(json.dumps(results, indent=2), encoding='utf-8')
+
+    changes = None
+    if not save_baseline and baseline_path.exists():
+        reference = load_results(str(baseline_path))
+        if reference["params"] != results["params"]:
+            print(f"Warning: baseline parameters {reference['params']} differ from this run", file=sys.stderr)
+        changes = compare(results, reference)
+
+    if as_json:
+        print(json.dumps({**results, "vs_baseline": changes}, indent=2))
+    else:
+        print_results(results, changes)
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Throughput benchmarks for the PROACTIVE adapters")
+    parser.add_argument("--files", type=int, default=500, help="Files in the gate workspace (default: 500)")
+    parser.add_argument("--entries", type=int, default=20000, help="Trace log entries (default: 20000)")
+    parser.add_argument("--density", type=float, default=0.05,
+                        help="Fraction of records with a violation (default: 0.05)")
+    parser.add_argument("--repeat", "-n", type=int, default=5, help="Timed runs per benchmark (default: 5)")
+    parser.add_argument("--out", "-o", default=None, help="Write results JSON to this file")
+    parser.add_argument("--baseline", default=None, help=f"Baseline file (default: {DEFAULT_BASELINE.name})")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the baseline")
+    parser.add_argument("--json", action="store_true", help="Emit results as JSON")
+
+    args = parser.parse_args()
+    main(args.files, args.entries, args.density, args.repeat, args.out,
+         args.baseline, args.save_baseline, args.json)